@@ -19,7 +19,7 @@ from rich.table import Table
 from rich.text import Text
 
 from tklr.controller import Controller
-from tklr.item import Item
+from tklr.item import Item, td_to_td_str
 from tklr.migration import MIGRATION_ITEM_TYPES, migrate_etm_directory
 from tklr.model import DatabaseManager, td_str_to_seconds
 from tklr.query import QueryError
@@ -440,9 +440,25 @@ def add(ctx, entry, file, batch):
         f"[blue]➤ Adding {len(entries)} entr{'y' if len(entries) == 1 else 'ies'}[/blue]"
     )
     count = 0
-    for e in entries:
-        if process_entry(e):
-            count += 1
+    # One transaction for the whole import; derived tables are refreshed once.
+    # Each entry gets a savepoint so a failure drops only that entry.
+    with controller.db_manager.batch():
+        for e in entries:
+            try:
+                with controller.db_manager.savepoint("tklr_add_entry"):
+                    added = process_entry(e)
+            except Exception as exc:
+                msg = (
+                    "\n[red]✘ Could not add entry:[/red]"
+                    f"\nentry: {e}\nexception: {exc}"
+                )
+                if verbose:
+                    print(msg)
+                else:
+                    bad_items.append(msg)
+                continue
+            if added:
+                count += 1
 
     controller.db_manager.populate_dependent_tables()
     print(
@@ -1062,6 +1078,93 @@ def days(ctx, start_opt, end_opt, width, rich, ids):
         current_date += timedelta(days=1)
 
 
+def _parse_day_hours(text: str) -> tuple[int, int]:
+    """'8-18' → (8, 18)."""
+    match = re.fullmatch(r"\s*(\d{1,2})\s*-\s*(\d{1,2})\s*", text or "")
+    if not match:
+        raise click.BadParameter("expected START-END hours, e.g. 8-18")
+    first, last = int(match.group(1)), int(match.group(2))
+    if not 0 <= first < last <= 24:
+        raise click.BadParameter("hours must satisfy 0 <= START < END <= 24")
+    return first, last
+
+
+@cli.command()
+@click.option(
+    "--start",
+    "start_opt",
+    type=_DATE,
+    help="Start date or 'today'. Defaults to now.",
+)
+@click.option(
+    "--end",
+    "end_opt",
+    type=_DATE_OR_INT,
+    default="1",
+    help="End date or number of weeks. Default: 1.",
+)
+@click.option(
+    "--duration",
+    default="1h",
+    show_default=True,
+    help="Minimum free period, e.g. 90m or 1h30m.",
+)
+@click.option(
+    "--hours",
+    default="8-18",
+    show_default=True,
+    help="Hours of each day to search, as START-END.",
+)
+@click.pass_context
+def free(ctx, start_opt, end_opt, duration, hours):
+    """
+    free(start: date = now, end: date|int = 1, duration: str = 1h, hours: str = 8-18)
+
+    List free periods of at least DURATION, read from the cached busy times
+    of events.
+
+    Examples:
+      tklr free --duration 90m
+      tklr free --start 2026-01-05 --end 4 --hours 9-17
+    """
+    env = ctx.obj["ENV"]
+    db_path = ctx.obj["DB"]
+    controller = Controller(db_path, env)
+
+    try:
+        min_duration = timedelta(seconds=td_str_to_seconds(duration))
+    except ValueError as exc:
+        raise click.BadParameter(str(exc), param_hint="--duration")
+    if min_duration <= timedelta(0):
+        raise click.BadParameter("must be positive", param_hint="--duration")
+    day_hours = _parse_day_hours(hours)
+
+    if start_opt is None or start_opt == date.today():
+        start_dt = datetime.now().replace(second=0, microsecond=0)
+    else:
+        start_dt = datetime.combine(start_opt, time(0, 0))
+    start_day = datetime.combine(start_dt.date(), time(0, 0))
+    if isinstance(end_opt, int):
+        end_dt = start_day + timedelta(weeks=end_opt)
+    else:
+        end_dt = datetime.combine(end_opt + timedelta(days=1), time(0, 0))
+
+    slots = controller.db_manager.find_free_slots(
+        start_dt, end_dt, min_duration, day_hours
+    )
+    if not slots:
+        click.echo("No free periods found.")
+        return
+
+    current_day = None
+    for slot_start, slot_end in slots:
+        if slot_start.date() != current_day:
+            current_day = slot_start.date()
+            click.echo(f"{current_day:%a, %b %-d}")
+        span = format_time_range(slot_start, slot_end, controller.AMPM)
+        click.echo(f"  {span} ({td_to_td_str(slot_end - slot_start)})")
+
+
 @cli.command()
 @click.option(
     "--end",
@@ -1396,21 +1499,28 @@ def finish(ctx, finish_parts, yes):
 
 @cli.command()
 @click.argument("regex_parts", nargs=-1)
+@click.option(
+    "--fts",
+    is_flag=True,
+    help="Match plain words as prefixes in the full-text index "
+    "(subject, description, jobs and context); regex patterns still use regex.",
+)
 @click.pass_context
-def find(ctx, regex_parts):
+def find(ctx, regex_parts, fts):
     """
     Search reminders whose subject or @d description matches a case-insensitive regex.
 
     Examples:
         tklr find waldo
         tklr find '(?i)project\\d+'
+        tklr find --fts quarterly rev
     """
     pattern = " ".join(regex_parts).strip()
     env = ctx.obj["ENV"]
     db_path = ctx.obj["DB"]
     controller = Controller(db_path, env)
 
-    matches = controller.db_manager.find_records(pattern)
+    matches = controller.db_manager.find_records(pattern, fts=fts)
     if not matches:
         if pattern:
             print(f"No reminders matched {pattern!r}.")
@@ -10,7 +10,7 @@ import shutil
 import subprocess
 import sys
 import textwrap
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta, timezone
 from importlib.metadata import version
@@ -19,7 +19,6 @@ from typing import Any, Dict, List, Literal, Optional, Set, Tuple
 from zoneinfo import ZoneInfo
 
 from dateutil import tz
-from dateutil.rrule import rrulestr
 from packaging.version import parse as parse_version
 
 from . import shared as shared_colors
@@ -97,6 +96,7 @@ from .shared import (
     at_color,
     bug_msg,
     calculate_4_week_start,
+    compile_rruleset,
     datetime_from_timestamp,
     datetime_in_words,
     fmt_utc_z,
@@ -111,10 +111,12 @@ from .shared import (
     indx_to_tag,
     is_all_day_text,
     label_color,
+    log_enabled,
     log_msg,
     parse,
     parse_month_spec,
     round_seconds_to_step_minutes,
+    rruleset_cache,
     timedelta_str_to_seconds,
     truncate_string,
     type_color,
@@ -142,6 +144,11 @@ FIELD_COLOR = LIGHT_SKY_BLUE
 
 ONEDAY = timedelta(days=1)
 
+# Rendered week pages kept by get_week_details, least recently used first out.
+WEEK_PAGE_CACHE_SIZE = 16
+# Beyond this many touched records, drop cached pages instead of checking each.
+WEEK_PAGE_TOUCH_LIMIT = 500
+
 # TYPE_TO_COLOR = {
 #     "*": EVENT_COLOR,  # event
 #     "~": AVAILABLE_COLOR,  # available task
@@ -505,6 +512,8 @@ class Controller:
         self.list_tag_to_id: dict[str, dict[str, object]] = {}
 
         self.yrwk_to_pages = {}  # Maps (iso_year, iso_week) to week description
+        # (iso_year, iso_week) -> (day built, touch_seq, record ids, pages)
+        self._week_page_cache: OrderedDict = OrderedDict()
         self.rownum_to_yrwk = {}  # Maps row numbers to (iso_year, iso_week)
         self.start_date = calculate_4_week_start()
         self.selected_week = tuple(datetime.now().isocalendar()[:2])
@@ -747,9 +756,9 @@ class Controller:
             log_msg(f"Invalid current_command '{cmd}': {exc}")
             return None
         if raw:
-            log_msg(f"Built raw current_command args: {parts}")
+            log_msg(f"Built raw current_command args: {parts}", level="debug")
             return parts
-        log_msg(f"Built current_command args: {parts}")
+        log_msg(f"Built current_command args: {parts}", level="debug")
         return [sys.executable, "-m", "tklr.cli.main", "--home", home, *parts]
 
     def consume_after_save_command(self) -> tuple[list[str], str] | None:
@@ -1118,7 +1127,7 @@ class Controller:
             return False
 
         try:
-            rule = rrulestr(rruleset)
+            rule = compile_rruleset(rruleset)
         except Exception:
             return False
 
@@ -1770,11 +1779,11 @@ class Controller:
         """
         Append any flags from Records.flags (e.g. 𝕒𝕘𝕠𝕣) to the given subject.
         """
-        row = self.db_manager.get_record_as_dictionary(record_id)
-        if not row:
+        snapshot = self.db_manager.get_record_snapshot(record_id)
+        if not snapshot:
             return subject
 
-        flags = f" {row.get('flags')}" or ""
+        flags = f" {snapshot[0]}" or ""
         # log_msg(f"{row = }, {flags = }")
         if not flags:
             return subject
@@ -2033,8 +2042,9 @@ class Controller:
         """
         Execute a query string and return the resulting QueryResponse.
         """
-        records = self.db_manager.iter_records_for_query()
-        return self.query_engine.run(query_text, records)
+        return self.query_engine.run(
+            query_text, self.db_manager.iter_records_for_query
+        )
 
     def get_all_records(self):
         return self.db_manager.get_all()
@@ -2060,6 +2070,10 @@ class Controller:
     def populate_notice(self):
         self.db_manager.populate_notice()
 
+    def rescore_urgency(self) -> int:
+        """Bring stored urgency up to the current time; return rows changed."""
+        return self.db_manager.rescore_urgency()
+
     def refresh_alerts(self):
         self.db_manager.populate_alerts()
 
@@ -2126,7 +2140,8 @@ class Controller:
     def get_active_alerts(self, width: int = 70):
         # now_fmt = datetime.now().strftime("%A, %B %-d %H:%M:%S")
         alerts = self.db_manager.get_active_alerts()
-        log_msg(f"{alerts = }")
+        if log_enabled("debug"):
+            log_msg(f"{alerts = }", level="debug")
         title = "Remaining alerts for today"
         if not alerts:
             header = f"[{HEADER_COLOR}] none remaining [/{HEADER_COLOR}]"
@@ -2179,7 +2194,8 @@ class Controller:
             )
             if extended:
                 log_msg(
-                    f"[weeks] extended/generated around {year}-W{week:02d} (+cushion)"
+                    f"[weeks] extended/generated around {year}-W{week:02d} (+cushion)",
+                    level="debug",
                 )
                 try:
                     self.db_manager.populate_dependent_tables()
@@ -2215,7 +2231,8 @@ class Controller:
             )
             if extended:
                 log_msg(
-                    f"[jots] extended/generated around {year}-W{week:02d} (+cushion)"
+                    f"[jots] extended/generated around {year}-W{week:02d} (+cushion)",
+                    level="debug",
                 )
                 try:
                     self.db_manager.populate_dependent_tables()
@@ -2321,6 +2338,10 @@ class Controller:
 
         start_datetime = datetime.strptime(f"{yr_wk[0]} {yr_wk[1]} 1", "%G %V %u")
         end_datetime = start_datetime + timedelta(weeks=1)
+        cached = self._cached_week_pages(yr_wk, start_datetime, end_datetime)
+        if cached is not None:
+            return cached
+        touch_seq = self.db_manager.touch_seq
         events = self.db_manager.get_events_for_period(start_datetime, end_datetime)
 
         # log_msg(f"from get_events_for_period:\n{events = }")
@@ -2343,8 +2364,10 @@ class Controller:
                 }
             )
             pages = self._paginate(rows)
+            self._store_week_pages(yr_wk, touch_seq, set(), pages)
             return pages
 
+        shown_ids = {event[5] for event in events}
         weekday_to_events = {}
         for i in range(7):
             this_day = (start_datetime + timedelta(days=i)).date()
@@ -2428,10 +2451,66 @@ class Controller:
                 for event in events:
                     rows.append(event)
         pages = self._paginate(rows)
-        self.yrwk_to_pages[yr_wk] = pages
+        self._store_week_pages(yr_wk, touch_seq, shown_ids, pages)
         # log_msg(f"{len(pages) = }, {pages[0] = }, {pages[-1] = }")
         return pages
 
+    def _cached_week_pages(self, yr_wk, start_datetime, end_datetime):
+        """
+        Return the cached pages for yr_wk if they are still current, else None.
+
+        Pages are dropped when the day has changed (today/tomorrow labels) or
+        when a record touched since they were built either appears in the
+        week or now has DateTimes rows in it.
+        """
+        entry = self._week_page_cache.get(yr_wk)
+        if entry is None:
+            return None
+        built_on, seq, record_ids, pages = entry
+        stale = built_on != date.today()
+        if not stale:
+            touched = self.db_manager.records_touched_since(seq)
+            if touched is None or len(touched) > WEEK_PAGE_TOUCH_LIMIT:
+                self._week_page_cache.clear()
+                self._forget_week_page_touches()
+                return None
+            stale = bool(touched & record_ids) or (
+                self.db_manager.records_have_datetimes_in_period(
+                    touched, start_datetime, end_datetime
+                )
+            )
+        if stale:
+            del self._week_page_cache[yr_wk]
+            self._forget_week_page_touches()
+            return None
+        self._week_page_cache[yr_wk] = (
+            built_on,
+            self.db_manager.touch_seq,
+            record_ids,
+            pages,
+        )
+        self._week_page_cache.move_to_end(yr_wk)
+        self._forget_week_page_touches()
+        return pages
+
+    def _store_week_pages(self, yr_wk, touch_seq, record_ids, pages):
+        if self.db_manager.conn.in_transaction:
+            # read views may not see uncommitted rows yet; don't pin them
+            return
+        self._week_page_cache[yr_wk] = (date.today(), touch_seq, record_ids, pages)
+        self._week_page_cache.move_to_end(yr_wk)
+        while len(self._week_page_cache) > WEEK_PAGE_CACHE_SIZE:
+            self._week_page_cache.popitem(last=False)
+        self._forget_week_page_touches()
+
+    def _forget_week_page_touches(self):
+        """Let the db manager drop touch stamps no cached week still needs."""
+        oldest = min(
+            (entry[1] for entry in self._week_page_cache.values()),
+            default=self.db_manager.touch_seq,
+        )
+        self.db_manager.forget_touched_before(oldest)
+
     def get_jot_details(self, yr_wk, *, timer_record_id: int | None = None):
         """
         Fetch and format jot rows for a specific week.
@@ -3669,12 +3748,14 @@ class Controller:
         pages = self._paginate(rows)
         return pages, header
 
-    def find_records(self, search_str: str):
+    def find_records(self, search_str: str, fts: bool = True):
         """
         Fetch and format description for the next instances.
+        Plain words are matched through the full-text index unless ``fts``
+        is False; regex patterns always use regex.
         """
         search_str = search_str.strip()
-        events = self.db_manager.find_records(search_str)
+        events = self.db_manager.find_records(search_str, fts=fts)
 
         matching = (
             f'containing a match for "[{SELECTED_COLOR}]{search_str}[/{SELECTED_COLOR}]" '
@@ -4036,14 +4117,11 @@ class Controller:
 
         if rruleset:
             try:
-                rule_str = self.db_manager._normalize_rruleset(
-                    rruleset.replace("\\N", "\n").replace("\\n", "\n")
+                _, rule = rruleset_cache.get(
+                    rruleset.replace("\\N", "\n").replace("\\n", "\n"),
+                    record_timezone,
+                    prepare=self.db_manager._prepare_rruleset,
                 )
-                if "RRULE" in rule_str:
-                    rule_str = self.db_manager._localize_rruleset(
-                        rule_str, record_timezone
-                    )
-                rule = rrulestr(rule_str, tzids=lambda name: tz.gettz(name))
                 rule_dtstart = getattr(rule, "_dtstart", None)
                 if anchor_dt is not None:
                     if (
@@ -4518,6 +4596,7 @@ class Controller:
                 self.db_manager.cursor.execute(
                     "DELETE FROM DateTimes WHERE record_id=?", (record_id,)
                 )
+                self.db_manager.note_touched(record_id)
                 self.db_manager.conn.commit()
             except Exception:
                 pass
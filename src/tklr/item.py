@@ -25,7 +25,7 @@ from dateutil import tz
 from dateutil.parser import parse as parse_dt
 
 # from dateutil.parser import parse as duparse
-from dateutil.rrule import rruleset, rrulestr
+from dateutil.rrule import rruleset
 from dateutil.tz import gettz
 from tzlocal import get_localzone_name
 
@@ -33,6 +33,7 @@ from .mask import obfuscate_mask_tokens, reveal_mask_tokens
 from .shared import (
     _to_local_naive,
     bug_msg,
+    compile_rruleset,
     fmt_utc_z,
     log_msg,
     parse_utc_z,
@@ -2969,7 +2970,7 @@ Entry: {self.entry}
             return None, None
 
         try:
-            rs = rrulestr(self.rruleset)
+            rs = compile_rruleset(self.rruleset)
             it = iter(rs)
             first = next(it, None)
             second = next(it, None)
@@ -3765,7 +3766,7 @@ Entry: {self.entry}
         if not rule_str and not self._find_all("@", "+"):
             return False
         try:
-            rs = rrulestr(rule_str) if rule_str else None
+            rs = compile_rruleset(rule_str) if rule_str else None
             if rs is None:
                 # RDATE-only path (from @+ mirrored into rruleset)
                 rdates = self._parse_rdate_list()  # returns compact strings
@@ -3896,7 +3897,7 @@ Entry: {self.entry}
             return False
 
         try:
-            rs = rrulestr(rule_str)
+            rs = compile_rruleset(rule_str)
             return next(iter(rs), None) is not None
         except Exception:
             return False
@@ -4047,7 +4048,7 @@ Entry: {self.entry}
             rdict.get("RRULE", ""),
             rdict.get("EXDATE", ""),
         ]
-        rule = rrulestr("\n".join(components))
+        rule = compile_rruleset("\n".join(components))
         first_two = list(rule)[:2]
         if len(first_two) == 2:
             return first_two[1]
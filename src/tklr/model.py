@@ -7,10 +7,13 @@ import os
 import re
 import shutil
 import sqlite3
+import time as time_module
 import unicodedata
 from collections import defaultdict, deque
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import date, datetime, time, timedelta
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
@@ -27,10 +30,19 @@ from rich.console import Console
 from rich.text import Text
 
 from tklr.mask import reveal_mask_tokens
+from tklr.query import (
+    DATETIME_FIELDS,
+    UNINDEXED_FIELDS,
+    RecordView,
+    SqlFilter,
+    field_datetime_key,
+    to_number,
+)
 from tklr.tklr_env import TklrEnvironment
 
 from .item import Item
 from .shared import (
+    _normalize_ts,
     _to_local_naive,
     bug_msg,
     datetime_from_timestamp,
@@ -40,11 +52,10 @@ from .shared import (
     fmt_utc_z,
     format_datetime,
     get_anchor,
-    has_zero_time_component,
-    is_all_day_text,
     log_msg,
     parse,
     parse_utc_z,
+    rruleset_cache,
 )
 
 TAG_RE = re.compile(r"(?<!\w)#(\w+)")
@@ -74,11 +85,39 @@ BIN_PATHS = [
 DATETIME_DERIVED_VERSION = "2026-03-09-dst-timezone"
 
 
+# Characters that make a find pattern a regex rather than plain words.
+REGEX_META_RE = re.compile(r"[.^$*+?{}\[\]\\|()]")
+# Distinct patterns kept compiled for the REGEXP SQL function.
+REGEXP_CACHE_SIZE = 256
+
+
+@lru_cache(maxsize=REGEXP_CACHE_SIZE)
+def _regexp_matcher(pattern: str):
+    """
+    Return a ``value -> bool`` test for ``pattern``.
+
+    A leading '(?i)' becomes a compile flag, and a pattern without regex
+    metacharacters is reduced to a substring test (lowercased when case
+    insensitive and ASCII).  Invalid patterns raise ``re.error`` and are not
+    cached.
+    """
+    body, flags = pattern, 0
+    if body.startswith("(?i)"):
+        body, flags = body[4:], re.IGNORECASE
+    if not REGEX_META_RE.search(body) and (not flags or body.isascii()):
+        if flags:
+            needle = body.lower()
+            return lambda value: needle in value.lower()
+        return lambda value: body in value
+    search = re.compile(body, flags).search
+    return lambda value: search(value) is not None
+
+
 def regexp(pattern, value):
-    try:
-        return re.search(pattern, value) is not None
-    except TypeError:
-        return False  # Handle None values gracefully
+    """SQLite REGEXP: ``value REGEXP pattern`` (NULL never matches)."""
+    if pattern is None or not isinstance(value, str):
+        return False
+    return _regexp_matcher(pattern)(value)
 
 
 def utc_now_string():
@@ -242,6 +281,32 @@ def dt_str_to_seconds(datetime_str: str) -> int:
         )  # Allow date-only
 
 
+def parse_alert_specs(alerts_json: str | None) -> list[tuple[int, str]]:
+    """
+    Expand stored @a entries such as '["30m, 15m: d, v"]' into
+    (lead_seconds, command) pairs. Malformed entries are skipped.
+    """
+    try:
+        alert_list = json.loads(alerts_json) if alerts_json else []
+    except (TypeError, ValueError):
+        return []
+    if not isinstance(alert_list, list):
+        return []
+
+    specs = []
+    for alert in alert_list:
+        if not isinstance(alert, str) or ":" not in alert:
+            continue  # malformed, e.g. "10m"
+        time_part, command_part = alert.split(":", 1)
+        try:
+            leads = [td_str_to_seconds(t.strip()) for t in time_part.split(",")]
+        except ValueError:
+            continue
+        commands = [cmd.strip() for cmd in command_part.split(",") if cmd.strip()]
+        specs.extend((lead, command) for lead in leads for command in commands)
+    return specs
+
+
 def dt_to_dtstr(dt_obj: datetime) -> str:
     """Convert a datetime object to 'YYYYMMDDTHHMM' format."""
     if is_date:
@@ -353,6 +418,16 @@ def or_aggregate(values: list[int]) -> int:
     return acc
 
 
+def conflict_aggregate(values: list[int]) -> int:
+    """Bits set in at least two of values (pairwise AND accumulation)."""
+    seen = 0
+    conflict = 0
+    for v in values:
+        conflict |= seen & v
+        seen |= v
+    return conflict
+
+
 def _parse_local_naive(ts: str) -> datetime:
     # "YYYYmmddTHHMM" → naive local datetime
     return datetime.strptime(ts, "%Y%m%dT%H%M")
@@ -370,101 +445,163 @@ def fine_busy_bits_for_event(
     Return dict of {year_week: 679-slot uint8 array}
     (7 days × (1 all-day + 96 fifteen-minute blocks))
     """
-    start = parse(start_str)
-    end = parse(end_str) if end_str else None
-
-    is_all_day = is_all_day_text(start_str, end_str)
-
-    if isinstance(start, date) and not isinstance(start, datetime):
-        start = datetime.combine(start, datetime.min.time())
-    if isinstance(end, date) and not isinstance(end, datetime):
-        end = datetime.combine(end, datetime.min.time()) if end else None
-
-    if end is None and not is_all_day:
-        return {}
-
-    slot_minutes = 15
-    slots_per_day = 96
-    slots_per_week = 7 * (1 + slots_per_day)  # 679
-    weeks: dict[str, np.ndarray] = {}
-
-    def yw_key(dt: datetime) -> str:
-        y, w, _ = dt.isocalendar()
-        return f"{y:04d}-{w:02d}"
-
-    cur = start
-    busy_count = 0
-    all_day_last_date: date | None = None
-    if is_all_day:
-        start_day = start.date()
-        all_day_last_date = start_day
-        if end:
-            end_day = end.date()
-            candidate = end_day
-            if has_zero_time_component(end_str) and end_day > start_day:
-                candidate = end_day - timedelta(days=1)
-            all_day_last_date = max(start_day, candidate)
-
-    while True:
-        yw = yw_key(cur)
-        if yw not in weeks:
-            weeks[yw] = np.zeros(slots_per_week, dtype=np.uint8)
-
-        day_index = cur.weekday()  # Mon=0
-        base = day_index * (1 + slots_per_day)
-
-        if is_all_day:
-            weeks[yw][base] = 1
-        else:
-            day_start = datetime.combine(cur.date(), datetime.min.time())
-            day_end = datetime.combine(cur.date(), datetime.max.time())
-            s = max(start, day_start)
-            e = min(end, day_end)
-
-            s_idx = (s.hour * 60 + s.minute) // slot_minutes
-            e_idx = (e.hour * 60 + e.minute) // slot_minutes
-            weeks[yw][base + 1 + s_idx : base + 1 + e_idx + 1] = 1
-            busy_count += np.count_nonzero(weeks[yw])
-
-        if is_all_day:
-            if cur.date() >= all_day_last_date:
-                break
+    keys, bits = busy_bits_for_events([(0, start_str, end_str)])
+    return {year_week: bits[i] for i, (_, year_week) in enumerate(keys)}
+
+
+# Fine busy maps: 7 days × (1 all-day + 96 fifteen-minute slots) per week.
+DAY_SLOTS = 97
+WEEK_SLOTS = 7 * DAY_SLOTS  # 679
+# BusyWeeksFromDateTimes stores the 679 bits packed (np.packbits, big-endian).
+PACKED_WEEK_BYTES = (WEEK_SLOTS + 7) // 8  # 85
+# A Monday, so that days // 7 since the epoch lines up with ISO weeks.
+_BUSY_EPOCH = np.datetime64("1969-12-29", "D")
+
+
+def pack_busy_bits(bits: np.ndarray) -> list[bytes]:
+    """(n, 679) 0/1 maps → n packed blobs of PACKED_WEEK_BYTES."""
+    fine = np.asarray(bits, dtype=np.uint8).reshape(-1, WEEK_SLOTS)
+    packed = np.packbits(fine, axis=1)
+    return [row.tobytes() for row in packed]
+
+
+def unpack_busy_bits(blob: bytes) -> np.ndarray:
+    """Packed blob → 679-slot uint8 0/1 map."""
+    return np.unpackbits(np.frombuffer(blob, dtype=np.uint8), count=WEEK_SLOTS)
+
+
+def busy_mask(blob: bytes) -> int:
+    """Packed blob → integer bit mask, for OR/AND aggregation."""
+    return int.from_bytes(blob, "big")
+
+
+def busy_mask_to_bits(mask: int) -> np.ndarray:
+    """Integer bit mask from busy_mask → 679-slot uint8 0/1 map."""
+    return unpack_busy_bits(mask.to_bytes(PACKED_WEEK_BYTES, "big"))
+
+
+def _busy_minutes(texts: list[str]) -> np.ndarray:
+    """'YYYYMMDD[THHMM[SS]]' strings → int64 minutes since _BUSY_EPOCH."""
+    iso = []
+    for text in texts:
+        t = _normalize_ts(text)
+        if len(t) >= 13 and t[8] == "T":
+            iso.append(f"{t[:4]}-{t[4:6]}-{t[6:8]}T{t[9:11]}:{t[11:13]}")
+        elif len(t) == 8:
+            iso.append(f"{t[:4]}-{t[4:6]}-{t[6:8]}T00:00")
         else:
-            if end is None or cur.date() >= end.date():
-                break
-        cur += timedelta(days=1)
-    # log_msg(f"{start_str = }, {end_str = }, {busy_count = }")
-    return weeks
+            dt = parse(t)
+            if not isinstance(dt, datetime):
+                dt = datetime.combine(dt, datetime.min.time())
+            iso.append(dt.isoformat(timespec="minutes"))
+    stamps = np.array(iso, dtype="datetime64[m]")
+    return (stamps - _BUSY_EPOCH).astype(np.int64)
+
+
+def _busy_week_label(week: int) -> str:
+    monday = (_BUSY_EPOCH + np.timedelta64(int(week) * 7, "D")).astype(date)
+    y, w, _ = monday.isocalendar()
+    return f"{y:04d}-{w:02d}"
+
+
+def busy_bits_for_events(
+    rows: Iterable[tuple[int, str, str | None]],
+) -> tuple[list[tuple[int, str]], np.ndarray]:
+    """
+    Vectorized fine_busy_bits_for_event over many (record_id, start, end) rows.
+
+    Returns ``(keys, bits)`` where ``keys[i]`` is ``(record_id, year_week)``
+    and ``bits[i]`` is that record's 679-slot uint8 map for the week, merged
+    over all of its rows.  Timed rows are painted as end-exclusive intervals
+    (a zero-length row marks its start slot) in a single difference array
+    (np.add.at + cumsum); all-day rows mark the all-day slot of each day they
+    cover.
+    """
+    rows = list(rows)
+    if not rows:
+        return [], np.zeros((0, WEEK_SLOTS), dtype=np.uint8)
+
+    record_ids = np.fromiter((r[0] for r in rows), dtype=np.int64, count=len(rows))
+    start = _busy_minutes([r[1] for r in rows])
+    has_end = np.fromiter((bool(r[2]) for r in rows), dtype=bool, count=len(rows))
+    end = start.copy()
+    if has_end.any():
+        end[has_end] = _busy_minutes([r[2] for r in rows if r[2]])
+
+    all_day = (start % 1440 == 0) & (~has_end | (end % 1440 == 0))
+    timed = ~all_day & has_end
+
+    # Timed rows: one interval of fine positions, pos = day * 97 + 1 + slot,
+    # split into per-week pieces.  Days in between are fully covered.
+    t_rec = record_ids[timed]
+    last = np.maximum(end[timed] - 1, start[timed])  # the minute before end
+    a = (start[timed] // 1440) * DAY_SLOTS + 1 + (start[timed] % 1440) // 15
+    b = (last // 1440) * DAY_SLOTS + 1 + (last % 1440) // 15
+    keep = b >= a
+    t_rec, a, b = t_rec[keep], a[keep], b[keep]
+    w0 = a // WEEK_SLOTS
+    spans = b // WEEK_SLOTS - w0 + 1
+    piece = np.repeat(np.arange(len(a)), spans)
+    offsets = np.cumsum(spans) - spans
+    t_week = w0[piece] + (np.arange(len(piece)) - offsets[piece])
+    base = t_week * WEEK_SLOTS
+    lo = np.maximum(a[piece], base) - base
+    hi = np.minimum(b[piece], base + WEEK_SLOTS - 1) - base
+    t_rec = t_rec[piece]
+
+    # All-day rows: one entry per covered day.
+    d_rec = record_ids[all_day]
+    first_day = start[all_day] // 1440
+    end_day = np.where(has_end[all_day], end[all_day] // 1440, first_day)
+    last_day = np.maximum(first_day, end_day - (end_day > first_day))
+    days = last_day - first_day + 1
+    day_piece = np.repeat(np.arange(len(first_day)), days)
+    day_offsets = np.cumsum(days) - days
+    day = first_day[day_piece] + (np.arange(len(day_piece)) - day_offsets[day_piece])
+    d_rec = d_rec[day_piece]
+    d_week = day // 7
+
+    pair_cols = np.column_stack(
+        (np.concatenate((t_rec, d_rec)), np.concatenate((t_week, d_week)))
+    )
+    pairs, inverse = np.unique(pair_cols, axis=0, return_inverse=True)
+    inverse = inverse.reshape(-1)
+    t_pair = inverse[: len(t_rec)]
+    d_pair = inverse[len(t_rec) :]
+
+    diff = np.zeros(len(pairs) * WEEK_SLOTS + 1, dtype=np.int32)
+    np.add.at(diff, t_pair * WEEK_SLOTS + lo, 1)
+    np.add.at(diff, t_pair * WEEK_SLOTS + hi + 1, -1)
+    bits = (np.cumsum(diff[:-1]) > 0).astype(np.uint8).reshape(len(pairs), WEEK_SLOTS)
+    bits[:, ::DAY_SLOTS] = 0
+    bits[d_pair, (day % 7) * DAY_SLOTS] = 1
+
+    labels = {int(w): _busy_week_label(w) for w in np.unique(pairs[:, 1])}
+    keys = [(int(rid), labels[int(w)]) for rid, w in pairs]
+    return keys, bits
 
 
 def _reduce_to_35_slots(arr: np.ndarray) -> np.ndarray:
     """
     Convert 679 fine bits (7 × (1 + 96)) into 35 coarse slots
     (7 × [1 all-day + 4 × 6-hour blocks]).
+
+    Accepts a single 679-slot map or an (n, 679) stack of weeks; each
+    6-hour block takes the max of its 24 quarter-hour values.
     """
-    days = 7
-    allday_bits = arr.reshape(days, 97)[:, 0]
-    quarters = arr.reshape(days, 97)[:, 1:]  # 7×96
-
-    coarse = np.zeros((days, 5), dtype=np.uint8)
-
-    for d in range(days):
-        # all-day stays as-is
-        coarse[d, 0] = allday_bits[d]
-
-        # 4 six-hour ranges
-        for i in range(4):
-            start = i * 24  # 6h = 24 × 15min
-            end = start + 24
-            chunk = quarters[d, start:end]
-            if np.any(chunk == 2):
-                coarse[d, i + 1] = 2
-            elif np.any(chunk == 1):
-                coarse[d, i + 1] = 1
-            else:
-                coarse[d, i + 1] = 0
+    fine = np.asarray(arr, dtype=np.uint8)
+    lead = fine.shape[:-1]
+    days = fine.reshape(*lead, 7, DAY_SLOTS)
+    coarse = np.empty((*lead, 7, 5), dtype=np.uint8)
+    coarse[..., 0] = days[..., 0]
+    coarse[..., 1:] = days[..., 1:].reshape(*lead, 7, 4, 24).max(axis=-1)
+    return coarse.reshape(*lead, 35)
 
-    return coarse.flatten()
+
+def _ternary_strings(coarse: np.ndarray) -> list[str]:
+    """(n, 35) array of 0/1/2 → n strings of '0', '1', '2'."""
+    digits = (np.asarray(coarse, dtype=np.uint8) + ord("0")).reshape(-1, 35)
+    return [row.tobytes().decode("ascii") for row in digits]
 
 
 class SafeDict(dict):
@@ -1114,6 +1251,7 @@ class UrgencyComputer:
             "created": kwargs.get("created"),
             "modified": kwargs.get("modified"),
             "due": kwargs.get("due"),
+            "due_offset": kwargs.get("due_offset"),
             "priority_level": kwargs.get("priority_level"),
             "extent": kwargs.get("extent"),
             "blocking": kwargs.get("blocking", 0.0),
@@ -1125,11 +1263,222 @@ class UrgencyComputer:
         urgency = self.compute_partitioned_urgency(weights)
         return urgency, self.urgency_to_bucket_color(urgency), weights
 
+    def _interval_seconds(self, setting) -> int:
+        interval = getattr(setting, "interval", None)
+        return td_str_to_seconds(interval) if interval else 0
+
+    def score_batch(
+        self, now: int, rows: list[dict]
+    ) -> tuple[np.ndarray, list[str], list[dict]]:
+        """
+        Score many urgency rows at once.
+
+        Each row holds the keyword arguments of ``from_args_and_weights``
+        (without ``now``). Every component is evaluated as an array
+        expression over the whole batch, using the same arithmetic as the
+        scalar methods so both paths agree exactly.
+
+        Returns:
+            (urgency array, colors, weights dicts) in row order.
+        """
+        n = len(rows)
+        if not n:
+            return np.zeros(0), [], []
+
+        def column(key, default=0):
+            return np.fromiter(
+                ((row.get(key) or default) for row in rows), dtype=np.float64, count=n
+            )
+
+        def clip(values, cap):
+            return np.maximum(0.0, np.minimum(cap, values))
+
+        zeros = np.zeros(n)
+        due = column("due")
+        modified = column("modified")
+        has_due = due != 0
+        pinned = np.fromiter(
+            (bool(row.get("pinned", False)) for row in rows), dtype=bool, count=n
+        )
+
+        cfg = self.urgency
+        due_weight = zeros
+        interval = self._interval_seconds(cfg.due)
+        if cfg.due.max and interval:
+            ramp = cfg.due.max * (1.0 - (due - now) / interval)
+            due_weight = np.where(has_due, clip(ramp, cfg.due.max), 0.0)
+        pastdue_weight = zeros
+        interval = self._interval_seconds(cfg.pastdue)
+        if cfg.pastdue.max and interval:
+            ramp = cfg.pastdue.max * (now - due) / interval
+            pastdue_weight = np.where(has_due, clip(ramp, cfg.pastdue.max), 0.0)
+        age_weight = zeros
+        interval = self._interval_seconds(cfg.age)
+        if cfg.age.max and interval:
+            age_weight = clip(cfg.age.max * (now - modified) / interval, cfg.age.max)
+        recent_weight = zeros
+        interval = self._interval_seconds(cfg.recent)
+        if cfg.recent.max and interval:
+            ramp = cfg.recent.max * (1 - (now - modified) / interval)
+            recent_weight = clip(ramp, cfg.recent.max)
+
+        levels: dict = {}
+        for row in rows:
+            level = row.get("priority_level")
+            if level is not None and level not in levels:
+                levels[level] = self.urgency_priority(level)
+        priority_weight = np.fromiter(
+            (
+                0.0
+                if row.get("priority_level") is None
+                else levels[row["priority_level"]]
+                for row in rows
+            ),
+            dtype=np.float64,
+            count=n,
+        )
+        inactivity_weight = np.maximum(age_weight, recent_weight)
+        by_priority = ~has_due & (priority_weight >= inactivity_weight)
+        by_inactivity = ~has_due & ~by_priority
+
+        extent_interval = td_str_to_seconds(cfg.extent.interval)
+        blocking_weight = zeros
+        if cfg.blocking.max and cfg.blocking.count:
+            ramp = cfg.blocking.max * column("blocking") / cfg.blocking.count
+            blocking_weight = clip(ramp, cfg.blocking.max)
+        tags_weight = zeros
+        if cfg.tags.max and cfg.tags.count:
+            ramp = cfg.tags.max * column("tags") / cfg.tags.count
+            tags_weight = clip(ramp, cfg.tags.max)
+
+        components = {
+            "due": np.where(has_due, due_weight, 0.0),
+            "pastdue": np.where(has_due, pastdue_weight, 0.0),
+            "age": np.where(
+                by_inactivity & (age_weight >= recent_weight), age_weight, 0.0
+            ),
+            "recent": np.where(
+                by_inactivity & (recent_weight > age_weight), recent_weight, 0.0
+            ),
+            "priority": np.where(by_priority, priority_weight, 0.0),
+            "extent": clip(1.0 * column("extent") / extent_interval, 1.0),
+            "blocking": blocking_weight,
+            "tags": tags_weight,
+            "description": np.where(
+                column("description", False) != 0, cfg.description.max or 0.0, 0.0
+            ),
+            "project": np.where(
+                column("jobs", False) != 0, cfg.project.max or 0.0, 0.0
+            ),
+        }
+
+        # Sum in the same order as compute_partitioned_urgency.
+        positive = np.zeros(n)
+        negative = np.zeros(n)
+        for values in components.values():
+            positive = positive + np.where(values > 0, values, 0.0)
+            negative = negative + np.where(values < 0, -values, 0.0)
+        urgency = np.where(
+            pinned, 1.0, (positive - negative) / self.MAX_POSSIBLE_URGENCY
+        )
+
+        buckets = self.BUCKETS
+        index = np.minimum(
+            ((urgency - self.MIN_URGENCY) * len(buckets)).astype(np.int64),
+            len(buckets) - 1,
+        )
+        colors = [
+            self.MIN_HEX_COLOR
+            if value <= self.MIN_URGENCY
+            else self.MAX_HEX_COLOR
+            if value >= 1.0
+            else buckets[i]
+            for value, i in zip(urgency.tolist(), index.tolist())
+        ]
+
+        values = {name: arr.tolist() for name, arr in components.items()}
+        weights = []
+        for i, row in enumerate(rows):
+            if pinned[i]:
+                weights.append({})
+                continue
+            entry = {name: vals[i] for name, vals in values.items()}
+            entry["args"] = {
+                "now": now,
+                "created": row.get("created"),
+                "modified": row.get("modified"),
+                "due": row.get("due"),
+                "due_offset": row.get("due_offset"),
+                "priority_level": row.get("priority_level"),
+                "extent": row.get("extent"),
+                "blocking": row.get("blocking", 0.0),
+                "tags": row.get("tags", 0),
+                "description": row.get("description", False),
+                "jobs": row.get("jobs", False),
+                "pinned": row.get("pinned", False),
+            }
+            weights.append(entry)
+        return urgency, colors, weights
+
 
 # Increment this whenever a code change requires a forced rebuild of derived
 # tables (DateTimes, alerts, notice, busy weeks, urgency) on next startup.
 DB_LOGIC_VERSION = 1
 
+# Increment this whenever the layout of the busy cache tables (BusyWeeks,
+# BusyWeeksFromDateTimes, BusyUpdateQueue) or their triggers changes.  The
+# busy tables are only dropped and rebuilt when the stored version differs.
+BUSY_SCHEMA_VERSION = 3
+
+# Records columns whose updates queue the record in DirtyRecords.
+DIRTY_RECORD_COLUMNS = """
+    itemtype, subject, description, rruleset, timezone, extent,
+    alerts, notice, context, use_id, jobs, flags, priority, tokens,
+    created, modified
+"""
+
+# Seconds between PRAGMA data_version checks for commits by other connections.
+EXTERNAL_CHECK_INTERVAL = 1.0
+
+
+def _fts_jobs_sql(column: str) -> str:
+    """SQL expression joining the job subjects ('~') of a jobs JSON column."""
+    return f"""(
+        SELECT group_concat(json_extract(value, '$."~"'), ' ')
+        FROM json_each(CASE WHEN json_valid({column}) THEN {column} ELSE '[]' END)
+    )"""
+
+
+RECORDS_FTS_INSERT = f"""
+    INSERT INTO RecordsFTS (rowid, subject, description, jobs, context)
+    VALUES (
+        NEW.id, NEW.subject, NEW.description, {_fts_jobs_sql("NEW.jobs")}, NEW.context
+    );
+"""
+RECORDS_FTS_UPDATE = "DELETE FROM RecordsFTS WHERE rowid = OLD.id;" + RECORDS_FTS_INSERT
+
+# Earliest DateTimes row per (record_id, job_id). The window follows
+# idx_datetimes_record_job_start_key, so SQLite numbers rows without a sort;
+# ``{where}`` narrows the scan.
+FIRST_INSTANCE_CTE = """
+    first_dt AS (
+        SELECT id, record_id, job_id, start_datetime
+        FROM (
+            SELECT
+                id,
+                record_id,
+                job_id,
+                start_datetime,
+                ROW_NUMBER() OVER (
+                    PARTITION BY record_id, job_id ORDER BY start_key, id
+                ) AS rn
+            FROM DateTimes
+            {where}
+        )
+        WHERE rn = 1
+    )
+"""
+
 
 class DatabaseManager:
     def __init__(
@@ -1149,15 +1498,20 @@ class DatabaseManager:
         if reset and os.path.exists(self.db_path):
             os.remove(self.db_path)
 
+        self.storage = getattr(env.config, "storage", None)
         self.conn = sqlite3.connect(self.db_path)
         try:
             self.conn.execute("PRAGMA busy_timeout = 5000")
         except sqlite3.OperationalError:
             pass
+        self._apply_storage_profile(self.conn)
         self.cursor = self.conn.cursor()
-        self.conn.create_function("REGEXP", 2, regexp)
-        self.conn.create_function("REGEXP", 2, regexp)
+        self._batch_depth = 0
+        self.conn.create_function("REGEXP", 2, regexp, deterministic=True)
         self.setup_database()
+        self._setup_change_tracking()
+        self.read_conn = self._open_read_connection()
+        self.read_cursor = self.read_conn.cursor()
         self.compute_urgency = UrgencyComputer(env)
         self._state_cache: dict[str, Any] = {}
         self._bin_root_overrides: dict[str, str] = self._load_bin_root_overrides()
@@ -1181,9 +1535,109 @@ class DatabaseManager:
         if auto_populate:
             self.populate_dependent_tables()
 
+    # ---------------- Storage profile ----------------
+
+    def _tuned_storage(self) -> bool:
+        return getattr(self.storage, "profile", "default") == "tuned"
+
+    def _apply_storage_profile(
+        self, conn: sqlite3.Connection, *, read_only: bool = False
+    ) -> None:
+        """
+        Apply the [storage] pragmas from config.toml to ``conn``.
+
+        The tuned profile enables WAL with synchronous=NORMAL and sizes the
+        page cache, mmap window and temp store.  The default profile leaves
+        SQLite's settings alone, switching a database that was left in WAL
+        by the tuned profile back to the rollback journal.
+        """
+        try:
+            if not self._tuned_storage():
+                if not read_only:
+                    mode = conn.execute("PRAGMA journal_mode").fetchone()
+                    if mode and str(mode[0]).lower() == "wal":
+                        conn.execute("PRAGMA journal_mode = DELETE")
+                return
+            if not read_only:
+                conn.execute("PRAGMA journal_mode = WAL")
+                conn.execute("PRAGMA synchronous = NORMAL")
+            cache_mb = int(getattr(self.storage, "cache_size_mb", 0) or 0)
+            mmap_mb = int(getattr(self.storage, "mmap_size_mb", 0) or 0)
+            if cache_mb:
+                # negative cache_size is measured in KiB rather than pages
+                conn.execute(f"PRAGMA cache_size = {-1024 * cache_mb}")
+            conn.execute(f"PRAGMA mmap_size = {1024 * 1024 * mmap_mb}")
+            conn.execute("PRAGMA temp_store = MEMORY")
+        except sqlite3.OperationalError as e:
+            log_msg(f"⚠️ could not apply storage profile: {e}")
+
+    def _open_read_connection(self) -> sqlite3.Connection:
+        """
+        Return the connection used by view queries.
+
+        With the tuned (WAL) profile this is a separate read-only connection,
+        so view builders read the last committed snapshot without waiting on
+        writers.  Otherwise the main connection is shared.
+        """
+        if not self._tuned_storage() or str(self.db_path) == ":memory:":
+            return self.conn
+        uri = f"{Path(self.db_path).resolve().as_uri()}?mode=ro"
+        try:
+            conn = sqlite3.connect(uri, uri=True)
+            conn.execute("PRAGMA busy_timeout = 5000")
+        except sqlite3.Error as e:
+            log_msg(f"⚠️ read-only connection unavailable: {e}")
+            return self.conn
+        conn.create_function("REGEXP", 2, regexp, deterministic=True)
+        self._apply_storage_profile(conn, read_only=True)
+        return conn
+
     def commit(self):
-        self.conn.commit()
         self.after_save_needed = True
+        if self._batch_depth:
+            return  # deferred until the outermost batch() exits
+        self.conn.commit()
+
+    @contextmanager
+    def batch(self):
+        """
+        Defer commit() calls until the outermost ``with db.batch():`` exits.
+
+        Nested batches join the enclosing one.  The transaction is committed
+        once on a clean exit and rolled back if an exception escapes.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        except BaseException:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self.conn.rollback()
+                self._state_cache.clear()
+            raise
+        else:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self.conn.commit()
+
+    @contextmanager
+    def savepoint(self, name: str = "tklr_savepoint"):
+        """
+        Undo only this block's writes if an exception escapes it.
+
+        Inside batch() a failure otherwise rolls back the whole transaction;
+        wrap each independent unit of work so the others are still committed.
+        """
+        self.cursor.execute(f"SAVEPOINT {name}")
+        try:
+            yield self
+        except BaseException:
+            self.cursor.execute(f"ROLLBACK TO {name}")
+            self.cursor.execute(f"RELEASE {name}")
+            self._state_cache.clear()
+            raise
+        else:
+            self.cursor.execute(f"RELEASE {name}")
 
     def _get_state_value(self, key: str, default=None):
         if key in self._state_cache:
@@ -1436,6 +1890,14 @@ class DatabaseManager:
             CREATE INDEX IF NOT EXISTS idx_urgency_urgency
             ON Urgency(urgency DESC);
         """)
+        # When the earliest hidden (not yet in notice) row of a task appears
+        self.cursor.execute("""
+            CREATE TABLE IF NOT EXISTS UrgencyReveal (
+                record_id INTEGER PRIMARY KEY,
+                reveal_at INTEGER NOT NULL,  -- UTC seconds: due - notice
+                FOREIGN KEY (record_id) REFERENCES Records(id) ON DELETE CASCADE
+            );
+        """)
 
         # ---------------- Completions ----------------
         self.cursor.execute("""
@@ -1628,6 +2090,449 @@ class DatabaseManager:
         tables.sort()
 
         self._ensure_use_schema()
+        self._ensure_rruleset_kind_schema()
+        self._ensure_datetimes_key_schema()
+        self.setup_dirty_records()
+        self.setup_alert_specs()
+        self.setup_token_fields()
+        self.setup_records_fts()
+
+    def _ensure_datetimes_key_schema(self):
+        """
+        Ensure DateTimes.start_key / end_key and their indexes exist.
+
+        Both are virtual generated columns holding fixed-width 'YYYYMMDDTHHMM'
+        keys (the format of _to_key): date-only starts become 'T0000',
+        date-only ends 'T2359', and a NULL end falls back to start_key.  Range
+        and ordering queries compare these instead of CASE expressions so they
+        can use the indexes.
+        """
+        columns = {
+            col[1]
+            for col in self.cursor.execute("PRAGMA table_xinfo(DateTimes)").fetchall()
+        }
+        if "start_key" not in columns:
+            self.cursor.execute("""
+                ALTER TABLE DateTimes ADD COLUMN start_key TEXT
+                GENERATED ALWAYS AS (
+                    CASE
+                        WHEN LENGTH(start_datetime) = 8 THEN start_datetime || 'T0000'
+                        ELSE substr(start_datetime, 1, 13)
+                    END
+                ) VIRTUAL;
+            """)
+        if "end_key" not in columns:
+            self.cursor.execute("""
+                ALTER TABLE DateTimes ADD COLUMN end_key TEXT
+                GENERATED ALWAYS AS (
+                    CASE
+                        WHEN end_datetime IS NULL THEN
+                            CASE
+                                WHEN LENGTH(start_datetime) = 8
+                                    THEN start_datetime || 'T0000'
+                                ELSE substr(start_datetime, 1, 13)
+                            END
+                        WHEN LENGTH(end_datetime) = 8 THEN end_datetime || 'T2359'
+                        ELSE substr(end_datetime, 1, 13)
+                    END
+                ) VIRTUAL;
+            """)
+        self.cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_datetimes_start_end_key
+            ON DateTimes(start_key, end_key);
+        """)
+        self.cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_datetimes_record_job_start_key
+            ON DateTimes(record_id, job_id, start_key);
+        """)
+        self.conn.commit()
+
+    def _ensure_rruleset_kind_schema(self):
+        """
+        Ensure Records.rruleset_kind and its index exist.
+
+        rruleset_kind is a virtual generated column: 0 = no schedule,
+        1 = finite (RDATE-only, COUNT= or UNTIL=), 2 = infinite RRULE.  Together
+        with ``processed`` it lets window regeneration select just the records
+        that need expanding.
+        """
+        columns = {
+            col[1]
+            for col in self.cursor.execute("PRAGMA table_xinfo(Records)").fetchall()
+        }
+        if "rruleset_kind" not in columns:
+            self.cursor.execute("""
+                ALTER TABLE Records ADD COLUMN rruleset_kind INTEGER
+                GENERATED ALWAYS AS (
+                    CASE
+                        WHEN rruleset IS NULL OR rruleset = '' THEN 0
+                        WHEN rruleset LIKE '%RRULE%'
+                             AND rruleset NOT LIKE '%COUNT=%'
+                             AND rruleset NOT LIKE '%UNTIL=%' THEN 2
+                        ELSE 1
+                    END
+                ) VIRTUAL;
+            """)
+        self.cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_records_rruleset_kind_processed
+            ON Records(rruleset_kind, processed);
+        """)
+        self.conn.commit()
+
+    def setup_records_fts(self):
+        """
+        Create RecordsFTS, an FTS5 index over subject, description, job
+        subjects and context keyed by Records.id, and the triggers that keep
+        it in sync.  A new index is backfilled from Records.  When the SQLite
+        build lacks FTS5, ``fts_enabled`` stays False and find falls back to
+        REGEXP.
+        """
+        self.fts_enabled = False
+        exists = self.cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'RecordsFTS'"
+        ).fetchone()
+        try:
+            self.cursor.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS RecordsFTS USING fts5(
+                    subject, description, jobs, context,
+                    tokenize = 'unicode61 remove_diacritics 2',
+                    prefix = '2 3'
+                );
+            """)
+        except sqlite3.OperationalError as exc:
+            log_msg(f"FTS5 unavailable, find will use REGEXP: {exc}", level="warning")
+            return
+
+        for name, event, body in (
+            ("insert", "INSERT", RECORDS_FTS_INSERT),
+            (
+                "update",
+                "UPDATE OF subject, description, jobs, context",
+                RECORDS_FTS_UPDATE,
+            ),
+            ("delete", "DELETE", "DELETE FROM RecordsFTS WHERE rowid = OLD.id;"),
+        ):
+            self.cursor.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS trig_records_fts_{name}
+                AFTER {event} ON Records
+                BEGIN
+                    {body}
+                END;
+            """)
+        if not exists:
+            self.cursor.execute(f"""
+                INSERT INTO RecordsFTS (rowid, subject, description, jobs, context)
+                SELECT id, subject, description, {_fts_jobs_sql("jobs")}, context
+                FROM Records
+            """)
+        self.conn.commit()
+        self.fts_enabled = True
+
+    def setup_alert_specs(self):
+        """
+        Create AlertSpecs: one (lead_seconds, command) row for every lead time
+        and command of a record's @a entries, parsed when the record is saved
+        so alert generation never re-parses the alerts JSON.  A new table is
+        backfilled from Records.
+        """
+        exists = self.cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'AlertSpecs'"
+        ).fetchone()
+        self.cursor.execute("""
+            CREATE TABLE IF NOT EXISTS AlertSpecs (
+                record_id    INTEGER NOT NULL,
+                lead_seconds INTEGER NOT NULL,  -- trigger = start - lead
+                command      TEXT    NOT NULL,  -- key into [alerts], or 'n'
+                FOREIGN KEY (record_id) REFERENCES Records(id) ON DELETE CASCADE
+            );
+        """)
+        self.cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_alertspecs_record
+            ON AlertSpecs(record_id);
+        """)
+        if not exists:
+            self.rebuild_alert_specs()
+        self.conn.commit()
+
+    def rebuild_alert_specs(self):
+        """Re-parse the @a entries of every record into AlertSpecs."""
+        self.cursor.execute("DELETE FROM AlertSpecs")
+        rows = self.cursor.execute(
+            "SELECT id, alerts FROM Records WHERE alerts IS NOT NULL AND alerts != ''"
+        ).fetchall()
+        self.cursor.executemany(
+            "INSERT INTO AlertSpecs (record_id, lead_seconds, command)"
+            " VALUES (?, ?, ?)",
+            [
+                (record_id, lead, command)
+                for record_id, alerts_json in rows
+                for lead, command in parse_alert_specs(alerts_json)
+            ],
+        )
+
+    def update_alert_specs_for_record(self, record_id: int):
+        """Re-parse one record's @a entries into AlertSpecs."""
+        self.cursor.execute("DELETE FROM AlertSpecs WHERE record_id = ?", (record_id,))
+        row = self.cursor.execute(
+            "SELECT alerts FROM Records WHERE id = ?", (record_id,)
+        ).fetchone()
+        if not row:
+            return
+        self.cursor.executemany(
+            "INSERT INTO AlertSpecs (record_id, lead_seconds, command)"
+            " VALUES (?, ?, ?)",
+            [(record_id, lead, command) for lead, command in parse_alert_specs(row[0])],
+        )
+
+    def setup_token_fields(self):
+        """
+        Create TokenFields: the (field, value) pairs RecordView derives from a
+        record's tokens, with the numeric and datetime readings of each value,
+        so query clauses become index lookups instead of JSON scans.
+
+        Saving a record rewrites its rows.  Any other change to itemtype,
+        subject or tokens clears them through a trigger, and a record without
+        rows is re-indexed by sync_token_fields() before the next query.
+        """
+        self.cursor.execute("""
+            CREATE TABLE IF NOT EXISTS TokenFields (
+                record_id INTEGER NOT NULL,
+                field     TEXT    NOT NULL,  -- normalized key: 'subject', 'c', '~r'
+                value     TEXT    NOT NULL,
+                value_num REAL,              -- float(value) when numeric
+                value_dt  TEXT,              -- 'YYYY-MM-DD' or 'YYYY-MM-DD HH:MM:SS'
+                FOREIGN KEY (record_id) REFERENCES Records(id) ON DELETE CASCADE
+            );
+        """)
+        for name, columns in (
+            ("record", "record_id"),
+            ("field_value", "field, value"),
+            ("field_dt", "field, value_dt"),
+        ):
+            self.cursor.execute(f"""
+                CREATE INDEX IF NOT EXISTS idx_tokenfields_{name}
+                ON TokenFields({columns});
+            """)
+        self.cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS trig_token_fields_stale
+            AFTER UPDATE OF itemtype, subject, tokens ON Records
+            BEGIN
+                DELETE FROM TokenFields WHERE record_id = NEW.id;
+            END;
+        """)
+        self.sync_token_fields()
+        self.conn.commit()
+
+    def _token_field_rows(self, record_id, itemtype, subject, tokens) -> list[tuple]:
+        view = RecordView(record_id, itemtype, subject, self._tokens_list(tokens))
+        return [
+            (
+                record_id,
+                field,
+                value,
+                to_number(value),
+                field_datetime_key(value) if field in DATETIME_FIELDS else None,
+            )
+            for field, value in view.field_values()
+            if field not in UNINDEXED_FIELDS
+        ]
+
+    def _insert_token_field_rows(self, rows: list[tuple]):
+        self.cursor.executemany(
+            "INSERT INTO TokenFields (record_id, field, value, value_num, value_dt)"
+            " VALUES (?, ?, ?, ?, ?)",
+            rows,
+        )
+
+    def update_token_fields_for_record(self, record_id: int):
+        """Rewrite one record's TokenFields rows from its tokens."""
+        self.cursor.execute("DELETE FROM TokenFields WHERE record_id = ?", (record_id,))
+        row = self.cursor.execute(
+            "SELECT itemtype, subject, tokens FROM Records WHERE id = ?", (record_id,)
+        ).fetchone()
+        if row:
+            self._insert_token_field_rows(self._token_field_rows(record_id, *row))
+
+    def sync_token_fields(self) -> int:
+        """
+        Index every record that has no TokenFields rows (every indexed record
+        has at least its itemtype row); returns the number indexed.
+        """
+        stale = self.cursor.execute("""
+            SELECT id, itemtype, subject, tokens FROM Records r
+            WHERE NOT EXISTS (SELECT 1 FROM TokenFields WHERE record_id = r.id)
+        """).fetchall()
+        if stale:
+            with self.batch():
+                self._insert_token_field_rows(
+                    [
+                        field_row
+                        for row in stale
+                        for field_row in self._token_field_rows(*row)
+                    ]
+                )
+        return len(stale)
+
+    def setup_dirty_records(self):
+        """
+        Create the DirtyRecords queue and the Records triggers that feed it.
+
+        Any insert, delete or content update of a record enqueues its id so
+        populate_dependent_tables() can refresh just that record's DateTimes,
+        alerts, notice and urgency rows.  Updates that only touch the
+        ``processed`` bookkeeping column are ignored.
+
+        The first write after a refresh also records the records version it
+        started from as ``dirty_base_version`` so _refresh_dirty_records()
+        can tell which derived-state entries were current before the edits.
+        """
+        self.cursor.execute("""
+            CREATE TABLE IF NOT EXISTS DirtyRecords (
+                record_id INTEGER PRIMARY KEY
+            );
+        """)
+
+        for event, columns in (
+            ("insert", "INSERT"),
+            ("update", f"UPDATE OF {DIRTY_RECORD_COLUMNS}"),
+            ("delete", "DELETE"),
+        ):
+            self.cursor.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS trig_dirty_base_{event}
+                BEFORE {columns} ON Records
+                WHEN NOT EXISTS (
+                    SELECT 1 FROM DerivedState WHERE key = 'dirty_base_version'
+                )
+                BEGIN
+                    INSERT INTO DerivedState(key, value)
+                    SELECT 'dirty_base_version',
+                           json_quote(COALESCE(MAX(modified), '0'))
+                    FROM Records;
+                END;
+            """)
+
+        self.cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS trig_dirty_records_insert
+            AFTER INSERT ON Records
+            BEGIN
+                INSERT OR IGNORE INTO DirtyRecords(record_id)
+                VALUES (NEW.id);
+            END;
+        """)
+
+        self.cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS trig_dirty_records_update
+            AFTER UPDATE OF {DIRTY_RECORD_COLUMNS}
+            ON Records
+            BEGIN
+                INSERT OR IGNORE INTO DirtyRecords(record_id)
+                VALUES (NEW.id);
+            END;
+        """)
+
+        self.cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS trig_dirty_records_delete
+            AFTER DELETE ON Records
+            BEGIN
+                INSERT OR IGNORE INTO DirtyRecords(record_id)
+                VALUES (OLD.id);
+            END;
+        """)
+
+        self.conn.commit()
+
+    def _setup_change_tracking(self):
+        """
+        Track which record ids this connection writes, for view caches.
+
+        Every write stamps the record id with an increasing sequence number
+        via ``note_touched``.  TEMP triggers on Records fire once per record
+        row; DateTimes rows are many per record, so
+        generate_datetimes_for_record() marks its record once instead of a
+        trigger firing per row.  Callers remember ``touch_seq`` when they
+        build something and later ask ``records_touched_since(seq)``.
+        """
+        self.touch_seq = 0
+        self._touched: dict[int, int] = {}
+        self._all_touched_seq = 0
+        self._data_version = self._read_data_version()
+        self._external_checked_at = time_module.monotonic()
+        # record id -> (flags, jobs JSON); None until first loaded
+        self._record_snapshots: dict[int, tuple[Any, Any]] | None = None
+        self._parsed_jobs: dict[int, list[dict]] = {}
+        self.conn.create_function("tklr_touch", 1, self.note_touched)
+        update = f"UPDATE OF {DIRTY_RECORD_COLUMNS}"
+        for name, event, ref in (
+            ("trig_touch_records_insert", "INSERT", "NEW.id"),
+            ("trig_touch_records_update", update, "NEW.id"),
+            ("trig_touch_records_delete", "DELETE", "OLD.id"),
+        ):
+            self.cursor.execute(f"""
+                CREATE TEMP TRIGGER IF NOT EXISTS {name}
+                AFTER {event} ON main.Records
+                BEGIN
+                    SELECT tklr_touch({ref});
+                END;
+            """)
+
+    def note_touched(self, record_id):
+        """Stamp ``record_id`` as written and drop its cached snapshots."""
+        if record_id is not None:
+            self.touch_seq += 1
+            self._touched[record_id] = self.touch_seq
+            if self._record_snapshots is not None:
+                self._record_snapshots.pop(record_id, None)
+            self._parsed_jobs.pop(record_id, None)
+
+    def forget_touched_before(self, seq: int) -> None:
+        """
+        Drop touch stamps at or below ``seq``.
+
+        Callers pass the oldest ``touch_seq`` any of their caches still hold,
+        so stamps no later ``records_touched_since`` call can return go away.
+        """
+        self._touched = {
+            rid: stamp for rid, stamp in self._touched.items() if stamp > seq
+        }
+
+    def _read_data_version(self) -> int:
+        return self.conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def sync_external_changes(self, *, force: bool = False) -> bool:
+        """
+        Treat every record as touched if another connection has committed.
+
+        ``PRAGMA data_version`` only moves for commits made elsewhere (another
+        tklr process, the CLI), which the TEMP triggers cannot see.  The check
+        is throttled to EXTERNAL_CHECK_INTERVAL seconds unless ``force``.
+        """
+        now = time_module.monotonic()
+        if not force and now - self._external_checked_at < EXTERNAL_CHECK_INTERVAL:
+            return False
+        self._external_checked_at = now
+        version = self._read_data_version()
+        if version == self._data_version:
+            return False
+        self._data_version = version
+        self.touch_seq += 1
+        self._all_touched_seq = self.touch_seq
+        self._record_snapshots = None
+        self._parsed_jobs.clear()
+        return True
+
+    def records_touched_since(self, seq: int) -> set[int] | None:
+        """
+        Return the ids of records written after touch sequence ``seq``.
+
+        Returns None when everything must be considered touched, i.e. another
+        connection has committed since ``seq``.
+        """
+        self.sync_external_changes()
+        if seq < self._all_touched_seq:
+            return None
+        if seq >= self.touch_seq:
+            return set()
+        return {rid for rid, stamp in self._touched.items() if stamp > seq}
 
     def _ensure_use_schema(self):
         """Ensure Uses lookup table exists and Records.use_id is available."""
@@ -1989,20 +2894,46 @@ class DatabaseManager:
 
     def setup_busy_tables(self):
         """
-        Create / reset busy cache tables and triggers.
+        Create (or migrate) busy cache tables and triggers.
 
         Design:
-        - BusyWeeksFromDateTimes: per (record_id, year_week) cache of fine-grained busybits (BLOB, 672 slots).
+        - BusyWeeksFromDateTimes: per (record_id, year_week) cache of fine-grained
+            busybits (BLOB, 679 slots packed into 85 bytes).
             FK references Records(id) — not DateTimes — since we aggregate per record/week.
         - BusyWeeks: per year_week aggregated ternary bits (TEXT, 35 chars).
         - BusyUpdateQueue: queue of record_ids to recompute.
 
         Triggers enqueue record_id on any insert/update/delete in DateTimes.
+
+        The tables persist across restarts; they are only dropped when the
+        stored ``busy_schema_version`` differs from BUSY_SCHEMA_VERSION.
         """
 
-        # Make schema idempotent and remove any old incompatible objects.
         self.cursor.execute("PRAGMA foreign_keys=ON")
 
+        row = self.cursor.execute(
+            "SELECT value FROM DerivedState WHERE key = 'busy_schema_version'"
+        ).fetchone()
+        try:
+            stored_version = json.loads(row[0]) if row else None
+        except Exception:
+            stored_version = None
+        if stored_version != BUSY_SCHEMA_VERSION:
+            self._drop_busy_tables()
+
+        self._create_busy_tables()
+        self.cursor.execute(
+            """
+            INSERT INTO DerivedState(key, value)
+            VALUES ('busy_schema_version', ?)
+            ON CONFLICT(key) DO UPDATE SET value = excluded.value
+            """,
+            (json.dumps(BUSY_SCHEMA_VERSION),),
+        )
+        self.commit()
+
+    def _drop_busy_tables(self):
+        """Drop the busy cache tables and triggers after a layout change."""
         # Drop old triggers (names must match what you used previously)
         self.cursor.execute("DROP TRIGGER IF EXISTS trig_busy_insert")
         self.cursor.execute("DROP TRIGGER IF EXISTS trig_busy_update")
@@ -2030,6 +2961,8 @@ class DatabaseManager:
             # Table will be created moments later; nothing to do.
             pass
 
+    def _create_busy_tables(self):
+        """Create the busy cache tables and triggers if they are missing."""
         # Recreate BusyWeeks (aggregate per week)
         self.cursor.execute("""
             CREATE TABLE IF NOT EXISTS BusyWeeks (
@@ -2045,12 +2978,18 @@ class DatabaseManager:
             CREATE TABLE IF NOT EXISTS BusyWeeksFromDateTimes (
                 record_id  INTEGER NOT NULL,
                 year_week  TEXT    NOT NULL,
-                busybits   BLOB    NOT NULL,  -- 672 slots (15-min blocks)
+                busybits   BLOB    NOT NULL,  -- 679 slots packed (np.packbits)
                 PRIMARY KEY (record_id, year_week),
                 FOREIGN KEY(record_id) REFERENCES Records(id) ON DELETE CASCADE
             );
         """)
 
+        # Week lookups (aggregation, free-slot search) scan by year_week
+        self.cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_busy_fdt_year_week
+            ON BusyWeeksFromDateTimes(year_week);
+        """)
+
         # Update queue for incremental recomputation
         self.cursor.execute("""
             CREATE TABLE IF NOT EXISTS BusyUpdateQueue (
@@ -2097,8 +3036,6 @@ class DatabaseManager:
             END;
         """)
 
-        self.commit()
-
     def backup_to(self, dest_db: Path) -> Path:
         """
         Create a consistent SQLite snapshot of the current database at dest_db.
@@ -2142,6 +3079,10 @@ class DatabaseManager:
         Populate derived tables (DateTimes cache, alerts, notice, busy weeks, urgency)
         only when inputs have changed.
         """
+        with self.batch():
+            self._populate_dependent_tables(force)
+
+    def _populate_dependent_tables(self, force: bool) -> None:
         if not force and self._get_state_value("logic_version") != DB_LOGIC_VERSION:
             force = True
 
@@ -2151,6 +3092,11 @@ class DatabaseManager:
         schedule_version = self._schedule_version(records_version)
 
         work_done = False
+        if force:
+            self.cursor.execute("DELETE FROM DirtyRecords")
+            self._clear_dirty_base_version()
+        else:
+            work_done |= self._refresh_dirty_records(schedule_version)
         work_done |= self._maybe_extend_datetimes(yr, wk, 12, schedule_version, force)
         work_done |= self._maybe_populate_alerts(today_key, schedule_version, force)
         work_done |= self._maybe_populate_notice(today_key, schedule_version, force)
@@ -2160,6 +3106,82 @@ class DatabaseManager:
         self._set_state_value("logic_version", DB_LOGIC_VERSION)
         self.after_save_needed = False
 
+    def _clear_dirty_base_version(self) -> str | None:
+        """Remove and return the records version recorded by the dirty triggers."""
+        row = self.cursor.execute(
+            "SELECT value FROM DerivedState WHERE key = 'dirty_base_version'"
+        ).fetchone()
+        if not row:
+            return None
+        self.cursor.execute(
+            "DELETE FROM DerivedState WHERE key = 'dirty_base_version'"
+        )
+        try:
+            return str(json.loads(row[0]))
+        except ValueError:
+            return row[0]
+
+    def _refresh_dirty_records(self, schedule_version: str) -> bool:
+        """
+        Refresh derived rows only for the records queued in DirtyRecords.
+
+        DateTimes (within the generated window), alerts, notice and urgency
+        are rebuilt per record.  Derived-state entries that were current
+        before these edits, i.e. stamped with the schedule version recorded
+        in ``dirty_base_version``, are then stamped with ``schedule_version``
+        so the full-table passes in populate_dependent_tables() are skipped.
+        Entries that were already stale are left for those passes.
+        """
+        self.cursor.execute("SELECT record_id FROM DirtyRecords")
+        queued = [row[0] for row in self.cursor.fetchall()]
+        base_version = self._clear_dirty_base_version()
+        if not queued:
+            return False
+
+        window = None
+        rng = self.get_generated_weeks_range()
+        if rng:
+            window = self._weeks_window(rng[:2], rng[2:])
+
+        for record_id in queued:
+            row = self.cursor.execute(
+                "SELECT itemtype FROM Records WHERE id = ?", (record_id,)
+            ).fetchone()
+            if not row:
+                # Deleted: derived rows are removed by ON DELETE CASCADE.
+                continue
+            if window:
+                self.generate_datetimes_for_record(
+                    record_id, window=window, clear_existing=True, commit=False
+                )
+            self.populate_alerts_for_record(record_id)
+            self.cursor.execute("DELETE FROM Notice WHERE record_id = ?", (record_id,))
+            self.populate_notice_for_record(record_id)
+            if row[0] in ("~", "^"):
+                self.populate_urgency_from_record(record_id)
+            else:
+                self.cursor.execute(
+                    "DELETE FROM Urgency WHERE record_id = ?", (record_id,)
+                )
+
+        if base_version:
+            previous_version = self._schedule_version(base_version)
+            for key in ("datetimes", "alerts", "notice", "urgency"):
+                if key == "datetimes" and not window:
+                    continue
+                state = self._get_state_value(key, {}) or {}
+                if state.get("version") == previous_version:
+                    self._set_state_value(
+                        key, {**state, "version": schedule_version}
+                    )
+
+        self.cursor.execute("DELETE FROM DirtyRecords")
+        self.commit()
+        log_msg(
+            f"refreshed derived rows for {len(queued)} dirty record(s)", level="debug"
+        )
+        return True
+
     def _maybe_extend_datetimes(
         self,
         year: int,
@@ -2181,7 +3203,9 @@ class DatabaseManager:
         if not force and version_match and range_ok:
             return False
 
-        self.extend_datetimes_for_weeks(year, week, weeks_ahead)
+        self.extend_datetimes_for_weeks(
+            year, week, weeks_ahead, regenerate=force or not version_match
+        )
         new_rng = self.get_generated_weeks_range()
         self._set_state_value(
             "datetimes",
@@ -2382,6 +3406,9 @@ class DatabaseManager:
             record_id = self.cursor.lastrowid
             self.relink_bins_for_record(record_id, item)  # ← add this
             self._update_hashtags_for_record(record_id, item.subject, item.description)
+            self.update_alert_specs_for_record(record_id)
+            self.update_token_fields_for_record(record_id)
+            self.commit()
             return record_id
 
         except Exception as e:
@@ -2427,6 +3454,7 @@ class DatabaseManager:
             sql = f"UPDATE Records SET {', '.join(fields)} WHERE id = ?"
 
             self.cursor.execute(sql, values)
+            self.update_token_fields_for_record(record_id)
             self.commit()
             self.relink_bins_for_record(record_id, item)  # ← add this
 
@@ -2507,6 +3535,7 @@ class DatabaseManager:
 
         # Dependent tables
         self.relink_bins_for_record(record_id, item)
+        self.update_token_fields_for_record(record_id)
         self.generate_datetimes_for_record(record_id)
         self.populate_alerts_for_record(record_id)
         if item.notice:
@@ -2900,18 +3929,46 @@ class DatabaseManager:
         if job_id is None:
             return None
 
-        self.cursor.execute("SELECT jobs FROM Records WHERE id=?", (record_id,))
-        row = self.cursor.fetchone()
-        if not row or not row[0]:
-            return None
-
-        jobs = _parse_jobs_json(row[0])
-        for job in jobs:
+        for job in self.get_record_jobs(record_id):
             if job.get("job_id") == job_id:
                 return job.get("display_subject") or None
 
         return None
 
+    def get_record_snapshot(self, record_id: int) -> tuple[Any, Any] | None:
+        """
+        Return (flags, jobs JSON) for record_id from the record snapshot.
+
+        The snapshot is loaded for all records with a single query and kept
+        until the records are written (see _setup_change_tracking), so view
+        builders can decorate every row without a per-row SELECT.
+        """
+        self.sync_external_changes()
+        snapshots = self._record_snapshots
+        if snapshots is None:
+            # read through self.conn so uncommitted writes of our own are seen
+            rows = self.conn.execute("SELECT id, flags, jobs FROM Records")
+            snapshots = self._record_snapshots = {
+                rid: (flags, jobs) for rid, flags, jobs in rows
+            }
+        if record_id not in snapshots:
+            row = self.conn.execute(
+                "SELECT flags, jobs FROM Records WHERE id = ?", (record_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            snapshots[record_id] = (row[0], row[1])
+        return snapshots[record_id]
+
+    def get_record_jobs(self, record_id: int) -> list[dict]:
+        """Return the parsed Records.jobs list for record_id, parsed once."""
+        jobs = self._parsed_jobs.get(record_id)
+        if jobs is None:
+            snapshot = self.get_record_snapshot(record_id)
+            jobs = _parse_jobs_json(snapshot[1]) if snapshot and snapshot[1] else []
+            self._parsed_jobs[record_id] = jobs
+        return jobs
+
     def get_job_dict(self, record_id: int, job_id: int | None) -> dict | None:
         """
         Return the full job dictionary for the given record_id + job_id pair.
@@ -2921,12 +3978,7 @@ class DatabaseManager:
         if job_id is None:
             return None
 
-        self.cursor.execute("SELECT jobs FROM Records WHERE id=?", (record_id,))
-        row = self.cursor.fetchone()
-        if not row or not row[0]:
-            return None
-
-        jobs = _parse_jobs_json(row[0])
+        jobs = self.get_record_jobs(record_id)
         for job in jobs:
             if job.get("job_id") == job_id:
                 return job  # Return the full dictionary
@@ -3127,14 +4179,24 @@ class DatabaseManager:
             "UPDATE Records SET tokens = ?, modified = ? WHERE id = ?",
             (serialized, utc_now_string(), record_id),
         )
+        self.update_token_fields_for_record(record_id)
         self.commit()
 
-    def iter_records_for_query(self):
+    def iter_records_for_query(self, sql_filter: SqlFilter | None = None):
         """
         Yield dictionaries containing id, itemtype, subject, and decoded tokens for queries.
+
+        ``sql_filter`` is the WHERE fragment a QueryPlan pushed down to
+        TokenFields; only the records it selects are decoded and returned.
         """
+        where, params = "", ()
+        if sql_filter is not None:
+            self.sync_token_fields()
+            where, params = f"WHERE {sql_filter.sql}", sql_filter.params
         self.cursor.execute(
-            "SELECT id, itemtype, subject, tokens FROM Records ORDER BY id ASC"
+            f"SELECT r.id, r.itemtype, r.subject, r.tokens FROM Records r {where}"
+            " ORDER BY r.id ASC",
+            params,
         )
         for record_id, itemtype, subject, token_blob in self.cursor.fetchall():
             yield {
@@ -3145,120 +4207,105 @@ class DatabaseManager:
             }
 
     def _generate_alert_rows(
-        self, window_start: datetime, window_end: datetime
+        self,
+        window_start: datetime,
+        window_end: datetime,
+        record_id: int | None = None,
     ) -> list[dict]:
         """
         Yield alert rows that trigger within [window_start, window_end].
-        """
-
-        def _parse_local_text_dt(s: str) -> datetime:
-            s = (s or "").strip()
-            if not s:
-                raise ValueError("empty datetime text")
-            if "T" in s:
-                return datetime.strptime(s, "%Y%m%dT%H%M")
-            return datetime.strptime(s, "%Y%m%d")
-
-        def _to_text_dt(dt: datetime, is_date_only: bool = False) -> str:
-            return dt.strftime("%Y%m%d") if is_date_only else dt.strftime("%Y%m%dT%H%M")
-
-        def _is_date_only_text(s: str) -> bool:
-            return "T" not in (s or "")
 
+        Lead times come pre-parsed from AlertSpecs, so only DateTimes rows
+        starting in [window_start + min lead, window_end + max lead] are read;
+        each candidate is then checked against its own lead.
+        """
+        where = "" if record_id is None else " WHERE record_id = ?"
+        params: tuple = () if record_id is None else (record_id,)
+        min_lead, max_lead = self.cursor.execute(
+            f"SELECT MIN(lead_seconds), MAX(lead_seconds) FROM AlertSpecs{where}",
+            params,
+        ).fetchone()
         rows: list[dict] = []
-
-        self.cursor.execute(
-            """
-            SELECT R.id, R.subject, R.description, R.context, R.alerts, D.start_datetime
-            FROM Records R
-            JOIN DateTimes D ON R.id = D.record_id
-            WHERE R.alerts IS NOT NULL AND R.alerts != ''
-            """
-        )
-        records = self.cursor.fetchall()
-        if not records:
+        if min_lead is None:
             return rows
 
+        sql = """
+            SELECT R.id, R.subject, R.description, R.context,
+                   S.lead_seconds, S.command, D.start_datetime
+            FROM DateTimes D
+            JOIN AlertSpecs S ON S.record_id = D.record_id
+            JOIN Records R ON R.id = D.record_id
+            WHERE D.start_key BETWEEN ? AND ?
+        """
+        if record_id is not None:
+            sql += " AND D.record_id = ?"
+        lower = _fmt_naive(window_start + timedelta(seconds=min_lead))
+        upper = _fmt_naive(window_end + timedelta(seconds=max_lead))
+
         for (
-            record_id,
+            rec_id,
             record_name,
             record_description,
             record_location,
-            alerts_json,
+            lead_secs,
+            alert_name,
             start_text,
-        ) in records:
-            try:
-                start_dt = _parse_local_text_dt(start_text)
-            except Exception:
+        ) in self.cursor.execute(sql, (lower, upper) + params).fetchall():
+            # Date-only starts parse to midnight, which alerts are relative to.
+            start_dt = datetime_from_timestamp(start_text)
+            if start_dt is None:
                 continue
-
-            is_date_only = _is_date_only_text(start_text)
-            try:
-                alert_list = json.loads(alerts_json)
-                if not isinstance(alert_list, list):
-                    continue
-            except Exception:
+            trigger_dt = start_dt - timedelta(seconds=lead_secs)
+            if not (window_start <= trigger_dt <= window_end):
                 continue
 
-            for alert in alert_list:
-                if ":" not in alert:
-                    continue
-                time_part, command_part = alert.split(":", 1)
-                try:
-                    lead_secs_list = [
-                        td_str_to_seconds(t.strip()) for t in time_part.split(",")
-                    ]
-                except Exception:
-                    continue
-                commands = [
-                    cmd.strip() for cmd in command_part.split(",") if cmd.strip()
-                ]
-                if not commands:
-                    continue
-
-                effective_start_dt = (
-                    start_dt.replace(hour=0, minute=0, second=0, microsecond=0)
-                    if is_date_only
-                    else start_dt
-                )
-
-                for lead_secs in lead_secs_list:
-                    trigger_dt = effective_start_dt - timedelta(seconds=lead_secs)
-                    if not (window_start <= trigger_dt <= window_end):
-                        continue
-
-                    trigger_text = _to_text_dt(trigger_dt)
-                    start_store_text = _to_text_dt(
-                        effective_start_dt, is_date_only=is_date_only
-                    )
-
-                    for alert_name in commands:
-                        alert_command = self.create_alert(
-                            alert_name,
-                            lead_secs,
-                            start_store_text,
-                            record_id,
-                            record_name,
-                            record_description,
-                            record_location,
-                        )
-                        if not alert_command:
-                            continue
-                        rows.append(
-                            {
-                                "alert_id": None,
-                                "record_id": record_id,
-                                "record_name": record_name,
-                                "trigger_datetime": trigger_text,
-                                "start_datetime": start_store_text,
-                                "alert_name": alert_name,
-                                "alert_command": alert_command,
-                            }
-                        )
+            start_store_text = start_text[:13]
+            alert_command = self.create_alert(
+                alert_name,
+                lead_secs,
+                start_store_text,
+                rec_id,
+                record_name,
+                record_description,
+                record_location,
+            )
+            if not alert_command:
+                continue
+            rows.append(
+                {
+                    "alert_id": None,
+                    "record_id": rec_id,
+                    "record_name": record_name,
+                    "trigger_datetime": trigger_dt.strftime("%Y%m%dT%H%M"),
+                    "start_datetime": start_store_text,
+                    "alert_name": alert_name,
+                    "alert_command": alert_command,
+                }
+            )
 
         rows.sort(key=lambda r: r["trigger_datetime"])
         return rows
 
+    def _insert_alert_rows(self, rows: list[dict]) -> None:
+        self.cursor.executemany(
+            """
+            INSERT OR IGNORE INTO Alerts
+                (record_id, record_name, trigger_datetime, start_datetime, alert_name, alert_command)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            [
+                (
+                    row["record_id"],
+                    row["record_name"],
+                    row["trigger_datetime"],
+                    row["start_datetime"],
+                    row["alert_name"],
+                    row["alert_command"],
+                )
+                for row in rows
+            ],
+        )
+
     def populate_alerts(self):
         """
         Populate the Alerts table for all records that have alerts defined.
@@ -3278,60 +4325,25 @@ class DatabaseManager:
         )
         self.commit()
 
-        rows = self._generate_alert_rows(now, end_of_day)
-        for row in rows:
-            self.cursor.execute(
-                """
-                INSERT OR IGNORE INTO Alerts
-                    (record_id, record_name, trigger_datetime, start_datetime, alert_name, alert_command)
-                VALUES (?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    row["record_id"],
-                    row["record_name"],
-                    row["trigger_datetime"],
-                    row["start_datetime"],
-                    row["alert_name"],
-                    row["alert_command"],
-                ),
-            )
-
+        self._insert_alert_rows(self._generate_alert_rows(now, end_of_day))
         self.commit()
-        log_msg("✅ Alerts table updated with the relevant alerts for today.")
+        log_msg(
+            "✅ Alerts table updated with the relevant alerts for today.", level="debug"
+        )
 
     def populate_alerts_for_record(self, record_id: int):
         """
         Regenerate alerts for a specific record, for alerts that trigger today
         (local time), using the same TEXT-based semantics as populate_alerts().
+        The record's AlertSpecs are re-parsed first, since this runs whenever
+        the record is saved.
         """
-
-        # --- small helpers (you can factor these out to avoid duplication) ---
-        def _parse_local_text_dt(s: str) -> datetime:
-            """Parse 'YYYYMMDD' or 'YYYYMMDDTHHMM' (local-naive) into datetime."""
-            s = (s or "").strip()
-            if not s:
-                raise ValueError("empty datetime text")
-            if "T" in s:
-                return datetime.strptime(s, "%Y%m%dT%H%M")
-            else:
-                return datetime.strptime(s, "%Y%m%d")
-
-        def _to_text_dt(dt: datetime, is_date_only: bool = False) -> str:
-            """Render datetime back to TEXT storage."""
-            if is_date_only:
-                return dt.strftime("%Y%m%d")
-            return dt.strftime("%Y%m%dT%H%M")
-
-        def _is_date_only_text(s: str) -> bool:
-            return "T" not in (s or "")
+        self.update_alert_specs_for_record(record_id)
 
         # --- time window (local-naive) ---
         now = datetime.now()
         end_of_day = now.replace(hour=23, minute=59, second=59, microsecond=0)
 
-        now_text = now.strftime("%Y%m%dT%H%M")
-        eod_text = end_of_day.strftime("%Y%m%dT%H%M")
-
         # Clear old alerts for this record in today's window
         self.cursor.execute(
             """
@@ -3340,118 +4352,15 @@ class DatabaseManager:
             AND trigger_datetime >= ?
             AND trigger_datetime <= ?
             """,
-            (record_id, now_text, eod_text),
+            (
+                record_id,
+                now.strftime("%Y%m%dT%H%M"),
+                end_of_day.strftime("%Y%m%dT%H%M"),
+            ),
         )
-        self.commit()
-
-        # Look up the record’s alert data and start datetimes
-        self.cursor.execute(
-            """
-            SELECT R.id, R.subject, R.description, R.context, R.alerts, D.start_datetime
-            FROM Records R
-            JOIN DateTimes D ON R.id = D.record_id
-            WHERE R.id = ?
-            AND R.alerts IS NOT NULL
-            AND R.alerts != ''
-            """,
-            (record_id,),
+        self._insert_alert_rows(
+            self._generate_alert_rows(now, end_of_day, record_id=record_id)
         )
-        records = self.cursor.fetchall()
-        if not records:
-            return
-
-        for (
-            rec_id,
-            record_name,
-            record_description,
-            record_location,
-            alerts_json,
-            start_text,
-        ) in records:
-            try:
-                start_dt = _parse_local_text_dt(start_text)
-            except Exception as e:
-                log_msg(
-                    f"⚠️ Skipping record {rec_id}: invalid start_datetime {start_text!r}: {e}"
-                )
-                continue
-
-            is_date_only = _is_date_only_text(start_text)
-
-            try:
-                alert_list = json.loads(alerts_json)
-                if not isinstance(alert_list, list):
-                    continue
-            except Exception:
-                continue
-
-            for alert in alert_list:
-                if ":" not in alert:
-                    continue  # malformed, e.g. "10m"
-                time_part, command_part = alert.split(":", 1)
-
-                try:
-                    lead_secs_list = [
-                        td_str_to_seconds(t.strip()) for t in time_part.split(",")
-                    ]
-                except Exception:
-                    continue
-
-                commands = [
-                    cmd.strip() for cmd in command_part.split(",") if cmd.strip()
-                ]
-                if not commands:
-                    continue
-
-                # For date-only starts, schedule relative to midnight of that day
-                if is_date_only:
-                    effective_start_dt = start_dt.replace(
-                        hour=0, minute=0, second=0, microsecond=0
-                    )
-                else:
-                    effective_start_dt = start_dt
-
-                for lead_secs in lead_secs_list:
-                    trigger_dt = effective_start_dt - timedelta(seconds=lead_secs)
-
-                    # only alerts that trigger today between now and end_of_day
-                    if not (now <= trigger_dt <= end_of_day):
-                        continue
-
-                    trigger_text = _to_text_dt(trigger_dt)
-                    start_store_text = _to_text_dt(
-                        effective_start_dt, is_date_only=is_date_only
-                    )
-
-                    for alert_name in commands:
-                        alert_command = self.create_alert(
-                            alert_name,
-                            lead_secs,
-                            start_store_text,  # TEXT, same as in populate_alerts()
-                            rec_id,
-                            record_name,
-                            record_description,
-                            record_location,
-                        )
-                        if not alert_command:
-                            continue
-
-                        self.cursor.execute(
-                            """
-                            INSERT OR IGNORE INTO Alerts
-                                (record_id, record_name, trigger_datetime, start_datetime, alert_name, alert_command)
-                            VALUES (?, ?, ?, ?, ?, ?)
-                            """,
-                            (
-                                rec_id,
-                                record_name,
-                                trigger_text,
-                                start_store_text,
-                                alert_name,
-                                alert_command,
-                            ),
-                        )
-
         self.commit()
 
     def get_generated_weeks_range(self) -> tuple[int, int, int, int] | None:
@@ -3516,6 +4425,13 @@ class DatabaseManager:
                 normalized.append(line)
         return "\n".join(normalized)
 
+    def _prepare_rruleset(self, rule_str: str, timezone_name: str | None) -> str:
+        """Normalize rule_str and, for RRULE schedules, localize it to timezone_name."""
+        normalized = self._normalize_rruleset(rule_str)
+        if "RRULE" in normalized:
+            normalized = self._localize_rruleset(normalized, timezone_name)
+        return normalized
+
     def _format_rrule_datetime_for_timezone(self, value: str, zone) -> str:
         text = (value or "").strip()
         if not text:
@@ -3689,54 +4605,58 @@ class DatabaseManager:
 
         return False
 
-    def extend_datetimes_for_weeks(self, start_year, start_week, weeks):
+    def extend_datetimes_for_weeks(
+        self, start_year, start_week, weeks, *, regenerate: bool = False
+    ):
         """
         Extend the DateTimes table by generating data for the specified number of weeks
         starting from a given year and week.
 
+        Only the weeks not already recorded in GeneratedWeeks are generated, and
+        only for records with infinite rules (finite schedules are expanded in
+        full whenever their record changes).  Rows are appended, never cleared.
+        With ``regenerate=True`` every record is regenerated over the whole
+        resulting span instead.  GeneratedWeeks then holds the exact covered
+        interval.
+
         Args:
             start_year (int): The starting year.
             start_week (int): The starting ISO week.
             weeks (int): Number of weeks to generate.
+            regenerate (bool): Rebuild all records across the full span.
         """
         start = datetime.strptime(f"{start_year} {start_week} 1", "%G %V %u")
         end = start + timedelta(weeks=weeks)
 
-        start_year, start_week = start.isocalendar()[:2]
-        end_year, end_week = end.isocalendar()[:2]
-
-        self.cursor.execute(
-            "SELECT start_year, start_week, end_year, end_week FROM GeneratedWeeks"
-        )
-        cached_ranges = self.cursor.fetchall()
+        req_first = self._week_key(*start.isocalendar()[:2])
+        req_last = self._week_key(*end.isocalendar()[:2])
 
-        # Determine the full range that needs to be generated
-        min_year = (
-            min(cached_ranges, key=lambda x: x[0])[0] if cached_ranges else start_year
-        )
-        min_week = (
-            min(cached_ranges, key=lambda x: x[1])[1] if cached_ranges else start_week
-        )
-        max_year = (
-            max(cached_ranges, key=lambda x: x[2])[2] if cached_ranges else end_year
-        )
-        max_week = (
-            max(cached_ranges, key=lambda x: x[3])[3] if cached_ranges else end_week
-        )
-
-        # Expand the range to include gaps and requested period
-        if start_year < min_year or (start_year == min_year and start_week < min_week):
-            min_year, min_week = start_year, start_week
-        if end_year > max_year or (end_year == max_year and end_week > max_week):
-            max_year, max_week = end_year, end_week
-
-        first_day = datetime.strptime(f"{min_year} {min_week} 1", "%G %V %u")
-        last_day = datetime.strptime(
-            f"{max_year} {max_week} 1", "%G %V %u"
-        ) + timedelta(days=6)
+        rng = self.get_generated_weeks_range()
+        if rng:
+            cached_first = self._week_key(rng[0], rng[1])
+            cached_last = self._week_key(rng[2], rng[3])
+            first = min(req_first, cached_first)
+            last = max(req_last, cached_last)
+        else:
+            first, last = req_first, req_last
 
-        # Generate new datetimes for the extended range
-        self.generate_datetimes_for_period(first_day, last_day)
+        if regenerate or not rng:
+            if regenerate:
+                # Re-expand finite schedules too (e.g. after a logic change).
+                self.cursor.execute(
+                    "UPDATE Records SET processed = 0 WHERE processed = 1"
+                )
+            self.generate_datetimes_for_period(*self._weeks_window(first, last))
+        else:
+            # Append only the newly exposed edges (including any gap).
+            if first < cached_first:
+                lo, _ = self._weeks_window(first, first)
+                hi, _ = self._weeks_window(cached_first, cached_first)
+                self._append_datetimes_for_infinite_records(lo, hi)
+            if last > cached_last:
+                _, lo = self._weeks_window(cached_last, cached_last)
+                _, hi = self._weeks_window(last, last)
+                self._append_datetimes_for_infinite_records(lo, hi)
 
         # Update the GeneratedWeeks table
         self.cursor.execute("DELETE FROM GeneratedWeeks")  # Clear old entries
@@ -3745,11 +4665,31 @@ class DatabaseManager:
         INSERT INTO GeneratedWeeks (start_year, start_week, end_year, end_week)
         VALUES (?, ?, ?, ?)
         """,
-            (min_year, min_week, max_year, max_week),
+            (*first, *last),
         )
 
         self.commit()
 
+    def _weeks_window(
+        self, first: tuple[int, int], last: tuple[int, int]
+    ) -> tuple[datetime, datetime]:
+        """Return (Monday of first week, Monday after last week) as naive datetimes."""
+        return self._iso_date(*first), self._iso_date(*last) + timedelta(weeks=1)
+
+    def _append_datetimes_for_infinite_records(
+        self, start_date: datetime, end_date: datetime
+    ) -> None:
+        """Add DateTimes rows in [start_date, end_date] for infinite-rule records."""
+        self.cursor.execute("SELECT id FROM Records WHERE rruleset_kind = 2")
+        for (record_id,) in self.cursor.fetchall():
+            self.generate_datetimes_for_record(
+                record_id,
+                window=(start_date, end_date),
+                clear_existing=False,
+                commit=False,
+            )
+        self.commit()
+
     def generate_datetimes(self, rule_str, extent, start_date, end_date):
         """
         Generate occurrences for a given rruleset within the specified date range.
@@ -3782,10 +4722,14 @@ class DatabaseManager:
         *,
         window: tuple[datetime, datetime] | None = None,
         clear_existing: bool = True,
+        commit: bool = True,
     ) -> None:
         """
         Regenerate DateTimes rows for a single record.
 
+        Rows are written with a single executemany; pass ``commit=False`` when
+        regenerating many records so the caller commits once at the end.
+
         Behavior:
         • If the record has jobs (project): generate rows for jobs ONLY (job_id set).
         • If the record has no jobs (event or single task): generate rows for the parent
@@ -3807,15 +4751,25 @@ class DatabaseManager:
 
         itemtype, rruleset, record_timezone, record_extent, jobs_json, processed = row
         raw_rule = (rruleset or "").replace("\\N", "\n").replace("\\n", "\n")
-        rule_str = self._normalize_rruleset(raw_rule)
-        has_rrule = "RRULE" in rule_str
-        if has_rrule:
-            rule_str = self._localize_rruleset(rule_str, record_timezone)
-        is_aware = ("Z" in raw_rule) or ("TZID=" in rule_str)
 
         # Nothing to do without any schedule
+        if not raw_rule.strip():
+            return
+
+        # Build parent recurrence iterator
+        try:
+            rule_str, rule = rruleset_cache.get(
+                raw_rule, record_timezone, prepare=self._prepare_rruleset
+            )
+        except Exception as e:
+            log_msg(
+                f"rrulestr failed for record {record_id}: {e}\n---\n{raw_rule}\n---"
+            )
+            return
         if not rule_str:
             return
+        has_rrule = "RRULE" in rule_str
+        is_aware = ("Z" in raw_rule) or ("TZID=" in rule_str)
 
         # Optional: clear existing rows for this record
         if clear_existing:
@@ -3830,15 +4784,6 @@ class DatabaseManager:
 
         is_finite = (not has_rrule) or ("COUNT=" in rule_str) or ("UNTIL=" in rule_str)
 
-        # Build parent recurrence iterator
-        try:
-            rule = rrulestr(rule_str, tzids=lambda name: tz.gettz(name))
-        except Exception as e:
-            log_msg(
-                f"rrulestr failed for record {record_id}: {e}\n---\n{rule_str}\n---"
-            )
-            return
-
         def _iter_parent_occurrences():
             if is_finite:
                 anchor = get_anchor(is_aware)
@@ -3891,6 +4836,9 @@ class DatabaseManager:
 
         extent_sec_record = td_str_to_seconds(record_extent or "")
 
+        # (record_id, job_id, start, end) rows, written in one executemany below
+        rows: list[tuple[int, int | None, str, str | None]] = []
+
         # ---- PATH A: Projects with jobs -> generate job rows only ----
         if has_jobs:
             for parent_dt in _iter_parent_occurrences():
@@ -3925,28 +4873,21 @@ class DatabaseManager:
                                     if seg_end == seg_start
                                     else _fmt_naive(seg_end)
                                 )
-                                self.cursor.execute(
-                                    "INSERT OR IGNORE INTO DateTimes (record_id, job_id, start_datetime, end_datetime) VALUES (?, ?, ?, ?)",
-                                    (record_id, job_id, s_txt, e_txt),
-                                )
+                                rows.append((record_id, job_id, s_txt, e_txt))
                         except NameError:
                             # fallback: single row
-                            self.cursor.execute(
-                                "INSERT OR IGNORE INTO DateTimes (record_id, job_id, start_datetime, end_datetime) VALUES (?, ?, ?, ?)",
+                            rows.append(
                                 (
                                     record_id,
                                     job_id,
                                     _fmt_naive(job_start),
                                     _fmt_naive(job_end),
-                                ),
+                                )
                             )
                         except Exception as e:
                             log_msg(f"error: {e}")
                     else:
-                        self.cursor.execute(
-                            "INSERT OR IGNORE INTO DateTimes (record_id, job_id, start_datetime, end_datetime) VALUES (?, ?, ?, NULL)",
-                            (record_id, job_id, _fmt_naive(job_start)),
-                        )
+                        rows.append((record_id, job_id, _fmt_naive(job_start), None))
 
         # ---- PATH B: Events / single tasks (no jobs) -> generate parent rows ----
         else:
@@ -3973,22 +4914,24 @@ class DatabaseManager:
                     for seg_start, seg_end in segments:
                         s_txt = _fmt_naive(seg_start)
                         e_txt = None if seg_end == seg_start else _fmt_naive(seg_end)
-                        self.cursor.execute(
-                            "INSERT OR IGNORE INTO DateTimes (record_id, job_id, start_datetime, end_datetime) VALUES (?, NULL, ?, ?)",
-                            (record_id, s_txt, e_txt),
-                        )
+                        rows.append((record_id, None, s_txt, e_txt))
                 else:
-                    self.cursor.execute(
-                        "INSERT OR IGNORE INTO DateTimes (record_id, job_id, start_datetime, end_datetime) VALUES (?, NULL, ?, NULL)",
-                        (record_id, _fmt_naive(start_local)),
-                    )
+                    rows.append((record_id, None, _fmt_naive(start_local), None))
+
+        self.cursor.executemany(
+            "INSERT OR IGNORE INTO DateTimes (record_id, job_id, start_datetime, end_datetime) VALUES (?, ?, ?, ?)",
+            rows,
+        )
+        if clear_existing or rows:
+            self.note_touched(record_id)
 
-        # Mark finite as processed only when we generated full set (no window)
-        if is_finite and not window:
+        # Finite rules ignore the window, so the full set is now in place.
+        if is_finite:
             self.cursor.execute(
                 "UPDATE Records SET processed = 1 WHERE id = ?", (record_id,)
             )
-        self.commit()
+        if commit:
+            self.commit()
 
     def get_events_for_period(self, start_date: datetime, end_date: datetime):
         """
@@ -4023,34 +4966,43 @@ class DatabaseManager:
         JOIN Records r ON dt.record_id = r.id
         WHERE
             r.itemtype NOT IN ('!', '-') AND
-            -- normalized end >= period start
-            (
-                CASE
-                    WHEN dt.end_datetime IS NULL THEN
-                        CASE
-                            WHEN LENGTH(dt.start_datetime) = 8 THEN dt.start_datetime || 'T000000'
-                            ELSE dt.start_datetime
-                        END
-                    WHEN LENGTH(dt.end_datetime) = 8 THEN dt.end_datetime || 'T235959'
-                    ELSE dt.end_datetime
-                END
-            ) >= ?
-            AND
-            -- normalized start < period end
+            -- rows are split into day segments, so this bounds the index scan
+            dt.start_key >= ? AND
+            dt.start_key < ? AND
+            dt.end_key >= ?
+        ORDER BY dt.start_key
+        """
+        self.read_cursor.execute(
+            sql, (_to_key(start_date - timedelta(days=1)), end_key, start_key)
+        )
+        return self.read_cursor.fetchall()
+
+    def records_have_datetimes_in_period(
+        self, record_ids, start_date: datetime, end_date: datetime
+    ) -> bool:
+        """
+        Return True if any of record_ids has a DateTimes row overlapping
+        [start_date, end_date), using the same bounds as get_events_for_period.
+        """
+        ids = list(record_ids)
+        if not ids:
+            return False
+        placeholders = ",".join("?" * len(ids))
+        self.read_cursor.execute(
+            f"""
+            SELECT 1 FROM DateTimes dt
+            WHERE dt.record_id IN ({placeholders})
+              AND dt.start_key >= ? AND dt.start_key < ? AND dt.end_key >= ?
+            LIMIT 1
+            """,
             (
-                CASE
-                    WHEN LENGTH(dt.start_datetime) = 8 THEN dt.start_datetime || 'T000000'
-                    ELSE dt.start_datetime
-                END
-            ) < ?
-        ORDER BY
-            CASE
-                WHEN LENGTH(dt.start_datetime) = 8 THEN dt.start_datetime || 'T000000'
-                ELSE dt.start_datetime
-            END
-        """
-        self.cursor.execute(sql, (start_key, end_key))
-        return self.cursor.fetchall()
+                *ids,
+                _to_key(start_date - timedelta(days=1)),
+                _to_key(end_date),
+                _to_key(start_date),
+            ),
+        )
+        return self.read_cursor.fetchone() is not None
 
     def get_jots_for_period(self, start_date: datetime, end_date: datetime):
         """
@@ -4076,34 +5028,16 @@ class DatabaseManager:
         LEFT JOIN Uses u ON r.use_id = u.id
         WHERE
             r.itemtype = '-' AND
-            -- normalized end >= period start
-            (
-                CASE
-                    WHEN dt.end_datetime IS NULL THEN
-                        CASE
-                            WHEN LENGTH(dt.start_datetime) = 8 THEN dt.start_datetime || 'T000000'
-                            ELSE dt.start_datetime
-                        END
-                    WHEN LENGTH(dt.end_datetime) = 8 THEN dt.end_datetime || 'T235959'
-                    ELSE dt.end_datetime
-                END
-            ) >= ?
-            AND
-            -- normalized start < period end
-            (
-                CASE
-                    WHEN LENGTH(dt.start_datetime) = 8 THEN dt.start_datetime || 'T000000'
-                    ELSE dt.start_datetime
-                END
-            ) < ?
-        ORDER BY
-            CASE
-                WHEN LENGTH(dt.start_datetime) = 8 THEN dt.start_datetime || 'T000000'
-                ELSE dt.start_datetime
-            END
-        """
-        self.cursor.execute(sql, (start_key, end_key))
-        return self.cursor.fetchall()
+            -- rows are split into day segments, so this bounds the index scan
+            dt.start_key >= ? AND
+            dt.start_key < ? AND
+            dt.end_key >= ?
+        ORDER BY dt.start_key
+        """
+        self.read_cursor.execute(
+            sql, (_to_key(start_date - timedelta(days=1)), end_key, start_key)
+        )
+        return self.read_cursor.fetchall()
 
     def get_jot_uses_for_period(self, start_date: datetime, end_date: datetime):
         """
@@ -4128,43 +5062,38 @@ class DatabaseManager:
         LEFT JOIN Uses u ON r.use_id = u.id
         WHERE
             r.itemtype = '-' AND
-            -- normalized end >= period start
-            (
-                CASE
-                    WHEN dt.end_datetime IS NULL THEN
-                        CASE
-                            WHEN LENGTH(dt.start_datetime) = 8 THEN dt.start_datetime || 'T000000'
-                            ELSE dt.start_datetime
-                        END
-                    WHEN LENGTH(dt.end_datetime) = 8 THEN dt.end_datetime || 'T235959'
-                    ELSE dt.end_datetime
-                END
-            ) >= ?
-            AND
-            -- normalized start < period end
-            (
-                CASE
-                    WHEN LENGTH(dt.start_datetime) = 8 THEN dt.start_datetime || 'T000000'
-                    ELSE dt.start_datetime
-                END
-            ) < ?
-        ORDER BY
-            CASE
-                WHEN LENGTH(dt.start_datetime) = 8 THEN dt.start_datetime || 'T000000'
-                ELSE dt.start_datetime
-            END
-        """
-        self.cursor.execute(sql, (start_key, end_key))
-        return self.cursor.fetchall()
+            -- rows are split into day segments, so this bounds the index scan
+            dt.start_key >= ? AND
+            dt.start_key < ? AND
+            dt.end_key >= ?
+        ORDER BY dt.start_key
+        """
+        self.read_cursor.execute(
+            sql, (_to_key(start_date - timedelta(days=1)), end_key, start_key)
+        )
+        return self.read_cursor.fetchall()
 
     def generate_datetimes_for_period(self, start_date: datetime, end_date: datetime):
-        self.cursor.execute("SELECT id FROM Records")
+        """
+        Regenerate DateTimes in the window for records that need it: infinite
+        rules, plus finite rules not yet expanded (processed = 0).  Records
+        without a schedule (notes, undated tasks and drafts) are never fetched.
+        """
+        self.cursor.execute(
+            """
+            SELECT id FROM Records
+            WHERE rruleset_kind = 2
+               OR (rruleset_kind = 1 AND (processed = 0 OR processed IS NULL))
+            """
+        )
         for (record_id,) in self.cursor.fetchall():
             self.generate_datetimes_for_record(
                 record_id,
                 window=(start_date, end_date),
                 clear_existing=True,
+                commit=False,
             )
+        self.commit()
 
     def get_notice_for_events(self):
         """
@@ -4174,7 +5103,7 @@ class DatabaseManager:
         Returns:
             List[Tuple[int, int, str]]: A list of (record_id, days_remaining, subject)
         """
-        self.cursor.execute(
+        self.read_cursor.execute(
             """
             SELECT n.record_id, n.days_remaining, r.subject
             FROM notice n
@@ -4183,7 +5112,7 @@ class DatabaseManager:
             ORDER BY n.days_remaining
             """
         )
-        return self.cursor.fetchall()
+        return self.read_cursor.fetchall()
 
     def get_drafts(self):
         """
@@ -4192,7 +5121,7 @@ class DatabaseManager:
         Returns:
             List[Tuple[int, str]]: A list of (id, subject)
         """
-        self.cursor.execute(
+        self.read_cursor.execute(
             """
             SELECT id, subject
             FROM Records
@@ -4200,7 +5129,7 @@ class DatabaseManager:
             ORDER BY id
             """
         )
-        return self.cursor.fetchall()
+        return self.read_cursor.fetchall()
 
     def get_urgency(self):
         """
@@ -4220,39 +5149,12 @@ class DatabaseManager:
             instance_ts    -- TEXT start_datetime or NULL
         )
         """
-        self.cursor.execute(
-            """
-            WITH first_per_job AS (
-                SELECT
-                    record_id,
-                    job_id,
-                    -- normalized start for correct ordering of date-only vs datetime
-                    MIN(
-                        CASE
-                            WHEN LENGTH(start_datetime) = 8
-                                THEN start_datetime || 'T000000'
-                            ELSE start_datetime
-                        END
-                    ) AS first_norm_start
-                FROM DateTimes
-                GROUP BY record_id, job_id
-            ),
-            first_dt AS (
-                SELECT
-                    d.id,
-                    d.record_id,
-                    d.job_id,
-                    d.start_datetime
-                FROM DateTimes d
-                JOIN first_per_job fp
-                ON d.record_id = fp.record_id
-                AND COALESCE(d.job_id, -1) = COALESCE(fp.job_id, -1)
-                AND CASE
-                        WHEN LENGTH(d.start_datetime) = 8
-                            THEN d.start_datetime || 'T000000'
-                        ELSE d.start_datetime
-                    END = fp.first_norm_start
-            )
+        first_dt = FIRST_INSTANCE_CTE.format(
+            where="WHERE record_id IN (SELECT record_id FROM Urgency)"
+        )
+        self.read_cursor.execute(
+            f"""
+            WITH {first_dt}
             SELECT
                 u.record_id,
                 u.job_id,
@@ -4271,12 +5173,12 @@ class DatabaseManager:
             ON p.record_id = u.record_id
             LEFT JOIN first_dt AS fd
             ON fd.record_id = u.record_id
-            AND COALESCE(fd.job_id, -1) = COALESCE(u.job_id, -1)
+            AND fd.job_id IS u.job_id
             WHERE r.itemtype != 'x'
             ORDER BY pinned DESC, u.urgency DESC, u.id ASC
             """
         )
-        return self.cursor.fetchall()
+        return self.read_cursor.fetchall()
 
     def get_urgency_entry(
         self,
@@ -4475,12 +5377,11 @@ class DatabaseManager:
     def populate_busy_from_datetimes(self):
         """
         Build BusyWeeksFromDateTimes from DateTimes.
-        For each (record_id, year_week) pair, accumulate busybits
-        across all event segments — merging with np.maximum().
+        All event rows are painted in one pass by busy_bits_for_events, which
+        merges each (record_id, year_week) pair; the rows are written with a
+        single executemany.
         """
-        import numpy as np
-
-        log_msg("🧩 Rebuilding BusyWeeksFromDateTimes…")
+        log_msg("🧩 Rebuilding BusyWeeksFromDateTimes…", level="debug")
         self.cursor.execute("DELETE FROM BusyWeeksFromDateTimes")
 
         # Only include Records that are events (itemtype='*')
@@ -4495,39 +5396,23 @@ class DatabaseManager:
             print("⚠️ No event DateTimes entries found.")
             return
 
-        total_inserted = 0
-        for record_id, start_str, end_str in rows:
-            weeks = fine_busy_bits_for_event(start_str, end_str)
-            for yw, arr in weeks.items():
-                # ensure numpy array
-                arr = np.asarray(arr, dtype=np.uint8)
-
-                # check if a row already exists for (record_id, week)
-                self.cursor.execute(
-                    "SELECT busybits FROM BusyWeeksFromDateTimes WHERE record_id=? AND year_week=?",
-                    (record_id, yw),
-                )
-                row = self.cursor.fetchone()
-                if row:
-                    existing = np.frombuffer(row[0], dtype=np.uint8)
-                    merged = np.maximum(existing, arr)
-                else:
-                    merged = arr
-
-                # upsert
-                self.cursor.execute(
-                    """
-                    INSERT INTO BusyWeeksFromDateTimes (record_id, year_week, busybits)
-                    VALUES (?, ?, ?)
-                    ON CONFLICT(record_id, year_week)
-                    DO UPDATE SET busybits = excluded.busybits
-                    """,
-                    (record_id, yw, merged.tobytes()),
-                )
-                total_inserted += 1
+        keys, bits = busy_bits_for_events(rows)
+        self.cursor.executemany(
+            """
+            INSERT INTO BusyWeeksFromDateTimes (record_id, year_week, busybits)
+            VALUES (?, ?, ?)
+            """,
+            (
+                (record_id, year_week, blob)
+                for (record_id, year_week), blob in zip(keys, pack_busy_bits(bits))
+            ),
+        )
 
         self.commit()
-        log_msg(f"✅ BusyWeeksFromDateTimes populated ({total_inserted} week-records).")
+        log_msg(
+            f"✅ BusyWeeksFromDateTimes populated ({len(keys)} week-records).",
+            level="debug",
+        )
 
     def get_last_instances(
         self,
@@ -4549,15 +5434,15 @@ class DatabaseManager:
         """
         today = datetime.now().strftime("%Y%m%dT%H%M")
 
-        self.cursor.execute(
+        self.read_cursor.execute(
             """
             WITH last_per_job AS (
                 SELECT
                     record_id,
                     job_id,
-                    MAX(start_datetime) AS last_datetime
+                    MAX(start_key) AS last_key
                 FROM DateTimes
-                WHERE start_datetime < ?
+                WHERE start_key < ?
                 GROUP BY record_id, job_id
             )
             SELECT
@@ -4571,15 +5456,15 @@ class DatabaseManager:
             FROM last_per_job lp
             JOIN DateTimes d
             ON d.record_id = lp.record_id
-            AND d.start_datetime = lp.last_datetime
+            AND d.start_key = lp.last_key
             AND COALESCE(d.job_id, -1) = COALESCE(lp.job_id, -1)
             JOIN Records r
             ON r.id = d.record_id
-            ORDER BY d.start_datetime DESC
+            ORDER BY d.start_key DESC
             """,
             (today,),
         )
-        return self.cursor.fetchall()
+        return self.read_cursor.fetchall()
 
     def get_records_by_modified(
         self,
@@ -4587,7 +5472,7 @@ class DatabaseManager:
         """
         Return every record ordered by its modified timestamp, newest first.
         """
-        self.cursor.execute(
+        self.read_cursor.execute(
             """
             SELECT id, subject, itemtype, modified, description
             FROM Records
@@ -4595,7 +5480,7 @@ class DatabaseManager:
             ORDER BY modified DESC
             """
         )
-        return self.cursor.fetchall()
+        return self.read_cursor.fetchall()
 
     #         SELECT
     #             r.id,
@@ -4631,15 +5516,15 @@ class DatabaseManager:
         """
         today = datetime.now().strftime("%Y%m%dT%H%M")
 
-        self.cursor.execute(
+        self.read_cursor.execute(
             """
             WITH next_per_job AS (
                 SELECT
                     record_id,
                     job_id,
-                    MIN(start_datetime) AS next_datetime
+                    MIN(start_key) AS next_key
                 FROM DateTimes
-                WHERE start_datetime >= ?
+                WHERE start_key >= ?
                 GROUP BY record_id, job_id
             )
             SELECT
@@ -4653,15 +5538,15 @@ class DatabaseManager:
             FROM next_per_job np
             JOIN DateTimes d
             ON d.record_id = np.record_id
-            AND d.start_datetime = np.next_datetime
+            AND d.start_key = np.next_key
             AND COALESCE(d.job_id, -1) = COALESCE(np.job_id, -1)
             JOIN Records r
             ON r.id = d.record_id
-            ORDER BY d.start_datetime ASC
+            ORDER BY d.start_key ASC
             """,
             (today,),
         )
-        return self.cursor.fetchall()
+        return self.read_cursor.fetchall()
 
     def get_next_instance_for_record(
         self, record_id: int
@@ -4746,33 +5631,51 @@ class DatabaseManager:
         )
         return [(row[0], row[1]) for row in self.cursor.fetchall()]
 
-    def find_records(self, regex: str):
-        regex_ci = f"(?i){regex}"  # force case-insensitive
-        today = int(datetime.now().timestamp())
-        self.cursor.execute(
-            """
-            WITH
-            LastInstances AS (
-                SELECT record_id, MAX(start_datetime) AS last_datetime
-                FROM DateTimes
-                WHERE start_datetime < ?
-                GROUP BY record_id
-            ),
-            NextInstances AS (
-                SELECT record_id, MIN(start_datetime) AS next_datetime
-                FROM DateTimes
-                WHERE start_datetime >= ?
-                GROUP BY record_id
+    def find_records(self, regex: str, fts: bool = False):
+        """
+        Return (id, subject, description, itemtype, last, next) rows for the
+        records matching ``regex``; last/next are the nearest past and future
+        instance starts.
+
+        With ``fts`` (and FTS5 available) a pattern of plain words is matched
+        as word prefixes against RecordsFTS, which also covers job subjects
+        and context.  Patterns using regex syntax fall back to a
+        case-insensitive REGEXP over subject and description.
+        """
+        words = re.findall(r"\w+", regex)
+        if fts and self.fts_enabled and words and not REGEX_META_RE.search(regex):
+            match_sql = (
+                "r.id IN (SELECT rowid FROM RecordsFTS WHERE RecordsFTS MATCH ?)"
             )
-            SELECT r.id, r.subject, r.description, r.itemtype, li.last_datetime, ni.next_datetime
+            match_params: tuple = (" ".join(f'"{word}"*' for word in words),)
+        else:
+            regex_ci = f"(?i){regex}"  # force case-insensitive
+            match_sql = "(r.subject REGEXP ? OR r.description REGEXP ?)"
+            match_params = (regex_ci, regex_ci)
+
+        now_key = _fmt_naive(datetime.now())
+        self.read_cursor.execute(
+            f"""
+            SELECT
+                r.id,
+                r.subject,
+                r.description,
+                r.itemtype,
+                (
+                    SELECT MAX(start_datetime) FROM DateTimes
+                    WHERE record_id = r.id AND start_key < ?
+                ) AS last_datetime,
+                (
+                    SELECT MIN(start_datetime) FROM DateTimes
+                    WHERE record_id = r.id AND start_key >= ?
+                ) AS next_datetime
             FROM Records r
-            LEFT JOIN LastInstances li ON r.id = li.record_id
-            LEFT JOIN NextInstances ni ON r.id = ni.record_id
-            WHERE r.subject REGEXP ? OR r.description REGEXP ?
+            WHERE {match_sql}
+            ORDER BY r.id
             """,
-            (today, today, regex_ci, regex_ci),
+            (now_key, now_key) + match_params,
         )
-        return self.cursor.fetchall()
+        return self.read_cursor.fetchall()
 
     # FIXME: should access record_id
     def update_tags_for_record(self, record_data):
@@ -4820,38 +5723,75 @@ class DatabaseManager:
         )
         return [row[0] for row in cur.fetchall()]
 
-    def populate_urgency_from_record(self, record_id: int):
-        record = self.get_record_as_dictionary(record_id)
+    def _next_starts_by_job(
+        self, record_id: int | None = None
+    ) -> dict[tuple[int, int | None], int]:
+        """
+        Return {(record_id, job_id): epoch seconds} for the earliest scheduled
+        start of every task (or of ``record_id`` alone) in one windowed query,
+        replacing a ``_next_start_seconds`` call per job.
+        """
+        if record_id is None:
+            where = (
+                "WHERE record_id IN"
+                " (SELECT id FROM Records WHERE itemtype IN ('~', '^'))"
+            )
+            params: tuple = ()
+        else:
+            where = "WHERE record_id = ?"
+            params = (record_id,)
+        sql = (
+            f"WITH {FIRST_INSTANCE_CTE.format(where=where)}"
+            " SELECT record_id, job_id, start_datetime FROM first_dt"
+        )
 
+        starts = {}
+        for rid, job_id, start_text in self.cursor.execute(sql, params).fetchall():
+            start_dt = datetime_from_timestamp(start_text)
+            if start_dt:
+                starts[(rid, job_id)] = round(start_dt.timestamp())
+                continue
+            # Unparseable earliest row: fall back to the ordered scan.
+            seconds = self._next_start_seconds(rid, job_id)
+            if seconds is not None:
+                starts[(rid, job_id)] = seconds
+        return starts
+
+    def _urgency_rows_for_record(
+        self,
+        record: dict,
+        now_seconds: int,
+        pinned: bool,
+        next_starts: dict[tuple[int, int | None], int],
+    ) -> tuple[list[tuple[int, int | None, str, str, dict]], int | None]:
+        """
+        Return (rows, reveal_at) for a task record: rows holds (record_id,
+        job_id, subject, status, args) for each visible urgency row, with
+        ``args`` feeding ``score_batch``; reveal_at is when the earliest row
+        hidden until its notice window opens becomes visible, or None.
+        """
         record_id = record["id"]
-        itemtype = record["itemtype"]
-        # log_msg(f"{record_id = }, {pinned = }, {record = }")
+        if record["itemtype"] not in ["^", "~"]:
+            return [], None
+
         created_seconds = dt_str_to_seconds(record["created"])
         modified_seconds = dt_str_to_seconds(record["modified"])
-        extent_seconds = td_str_to_seconds(record.get("extent", "0m"))
+        extent_seconds = td_str_to_seconds(record.get("extent") or "0m")
         # notice_seconds will be 0 in the absence of notice
-        notice_seconds = td_str_to_seconds(record.get("notice", "0m"))
-        rruleset = record.get("rruleset", "")
-        jobs = json.loads(record.get("jobs", "[]"))
+        notice_seconds = td_str_to_seconds(record.get("notice") or "0m")
+        rruleset = record.get("rruleset") or ""
+        jobs = json.loads(record.get("jobs") or "[]")
         subject = record["subject"]
-        # priority_map = self.env.config.urgency.priority.model_dump()
         priority_level = record.get("priority", None)
-        # priority = priority_map.get(priority_level, 0)
         description = True if record.get("description", "") else False
         flags = record.get("flags") or ""
         has_offset = "𝕠" in flags
 
-        if itemtype not in ["^", "~"]:
-            return
-
-        now_seconds = utc_now_to_seconds()
-        pinned = self.is_pinned(record_id)
-
         # Try to parse due from first RDATE in rruleset
         due_seconds = None
         offset_seconds = None
         if has_offset:
-            due_seconds = self._next_start_seconds(record_id, None)
+            due_seconds = next_starts.get((record_id, None))
             offset_seconds = self._offset_seconds_from_record(record)
         if due_seconds is None and rruleset.startswith("RDATE:"):
             due_str = rruleset.split(":", 1)[1].split(",")[0]
@@ -4861,7 +5801,7 @@ class DatabaseManager:
             else:
                 log_msg(f"Invalid RDATE value: {due_str}")
         if due_seconds is None:
-            due_seconds = self._next_start_seconds(record_id, None)
+            due_seconds = next_starts.get((record_id, None))
         if due_seconds and not notice_seconds:
             # treat due_seconds as the default for a missing @b, i.e.,
             # make the default to hide a task with an @s due entry before due - interval
@@ -4870,171 +5810,218 @@ class DatabaseManager:
             else:
                 notice_seconds = due_seconds
 
-        self.cursor.execute("DELETE FROM Urgency WHERE record_id = ?", (record_id,))
         description_text = record.get("description", "") or ""
         job_text = " ".join(
             (j.get("~") or j.get("label") or "") + " " + (j.get("d") or "")
             for j in jobs
         )
-        tags_count = len(re.findall(r"#\w+", subject + " " + description_text + " " + job_text))
-
-        # Handle jobs if present
-        if jobs:
-            # For each job id, count unfinished jobs that directly list it as a prereq.
-            blocking_counts = {
-                j["id"]: sum(
-                    1 for other in jobs
-                    if j["id"] in (other.get("reqs") or [])
-                    and other.get("status") != "finished"
-                )
-                for j in jobs if "id" in j
-            }
-
-            for job in jobs:
-                status = job.get("status", "")
-                if status != "available":
-                    continue
-                job_id = job.get("id")
-                subject = job.get("display_subject", subject)
-
-                job_due = self._next_start_seconds(record_id, job_id)
-                s_seconds = td_str_to_seconds(job.get("s", "0m"))
-                if job_due is None and due_seconds:
-                    job_due = due_seconds + s_seconds
-                elif job_due is None and s_seconds:
-                    job_due = now_seconds + s_seconds
-
-                job_notice = td_str_to_seconds(job.get("b", "0m")) or notice_seconds
-                if job_due and job_notice:
-                    hide = job_due - job_notice > now_seconds
-                    if hide:
-                        continue
-
-                job_extent = td_str_to_seconds(job.get("e", "0m"))
-                blocking = blocking_counts.get(job_id, 0)
-
-                urgency, color, weights = self.compute_urgency.from_args_and_weights(
-                    now=now_seconds,
-                    created=created_seconds,
-                    modified=modified_seconds,
-                    due=job_due,
-                    extent=job_extent,
-                    priority_level=priority_level,
-                    blocking=blocking,
-                    tags=tags_count,
-                    description=description,
-                    jobs=True,
-                    pinned=pinned,
-                )
-
-                self.cursor.execute(
-                    """
-                    INSERT INTO Urgency (record_id, job_id, subject, urgency, color, status, weights)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        record_id,
-                        job_id,
-                        subject,
-                        urgency,
-                        color,
-                        status,
-                        json.dumps(weights),
-                    ),
-                )
+        tags_count = len(
+            re.findall(r"#\w+", subject + " " + description_text + " " + job_text)
+        )
+        common = {
+            "created": created_seconds,
+            "modified": modified_seconds,
+            "priority_level": priority_level,
+            "tags": tags_count,
+            "description": description,
+            "pinned": pinned,
+        }
 
-        else:
+        if not jobs:
             hide = (
                 due_seconds
                 and notice_seconds
                 and due_seconds - notice_seconds > now_seconds
             )
-            if not hide:
-                urgency, color, weights = self.compute_urgency.from_args_and_weights(
-                    now=now_seconds,
-                    created=created_seconds,
-                    modified=modified_seconds,
-                    due=due_seconds,
-                    extent=extent_seconds,
-                    priority_level=priority_level,
-                    tags=tags_count,
-                    description=description,
-                    jobs=False,
-                    pinned=pinned,
-                )
+            if hide:
+                return [], due_seconds - notice_seconds
+            args = dict(common, due=due_seconds, extent=extent_seconds, jobs=False)
+            return [(record_id, None, subject, "next", args)], None
+
+        # For each job id, count unfinished jobs that directly list it as a prereq.
+        blocking_counts = {
+            j["id"]: sum(
+                1
+                for other in jobs
+                if j["id"] in (other.get("reqs") or [])
+                and other.get("status") != "finished"
+            )
+            for j in jobs
+            if "id" in j
+        }
 
-                self.cursor.execute(
-                    """
-                    INSERT INTO Urgency (record_id, job_id, subject, urgency, color, status, weights)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        record_id,
-                        None,
-                        subject,
-                        urgency,
-                        color,
-                        # record.get("status", "next"),
-                        "next",
-                        json.dumps(weights),
-                    ),
+        rows = []
+        reveal_at = None
+        for job in jobs:
+            status = job.get("status", "")
+            if status != "available":
+                continue
+            job_id = job.get("id")
+            job_subject = job.get("display_subject", subject)
+
+            job_due = next_starts.get((record_id, job_id))
+            s_seconds = td_str_to_seconds(job.get("s", "0m"))
+            relative_due = False
+            if job_due is None and due_seconds:
+                job_due = due_seconds + s_seconds
+            elif job_due is None and s_seconds:
+                # measured from now, so waiting will never reveal it
+                job_due = now_seconds + s_seconds
+                relative_due = True
+
+            job_notice = td_str_to_seconds(job.get("b", "0m")) or notice_seconds
+            if job_due and job_notice and job_due - job_notice > now_seconds:
+                if not relative_due:
+                    job_reveal = job_due - job_notice
+                    reveal_at = (
+                        job_reveal if reveal_at is None else min(reveal_at, job_reveal)
+                    )
+                continue
+
+            args = dict(
+                common,
+                due=job_due,
+                due_offset=s_seconds if relative_due else None,
+                extent=td_str_to_seconds(job.get("e", "0m")),
+                blocking=blocking_counts.get(job_id, 0),
+                jobs=True,
+            )
+            rows.append((record_id, job_id, job_subject, status, args))
+        return rows, reveal_at
+
+    def _insert_urgency_rows(self, rows: list[tuple], now_seconds: int) -> None:
+        """Score ``rows`` in one batch and bulk-insert them into Urgency."""
+        if not rows:
+            return
+        urgency, colors, weights = self.compute_urgency.score_batch(
+            now_seconds, [row[4] for row in rows]
+        )
+        self.cursor.executemany(
+            """
+            INSERT INTO Urgency (record_id, job_id, subject, urgency, color, status, weights)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            [
+                (record_id, job_id, subject, value, color, status, json.dumps(w))
+                for (record_id, job_id, subject, status, _), value, color, w in zip(
+                    rows, urgency.tolist(), colors, weights
                 )
+            ],
+        )
 
-        self.commit()
+    def populate_urgency_from_record(
+        self, record_id: int, now_seconds: int | None = None
+    ):
+        record = self.get_record_as_dictionary(record_id)
+        record_id = record["id"]
+        self.cursor.execute(
+            "DELETE FROM UrgencyReveal WHERE record_id = ?", (record_id,)
+        )
+        if record["itemtype"] not in ["^", "~"]:
+            self.commit()
+            return
 
-    def populate_all_urgency(self):
-        self.cursor.execute("DELETE FROM Urgency")
-        tasks = self.get_all_tasks()
-        for task in tasks:
-            # log_msg(f"adding to urgency: {task['itemtype'] = }, {task = }")
-            self.populate_urgency_from_record(task)
+        if now_seconds is None:
+            now_seconds = utc_now_to_seconds()
+        rows, reveal_at = self._urgency_rows_for_record(
+            record,
+            now_seconds,
+            self.is_pinned(record_id),
+            self._next_starts_by_job(record_id),
+        )
+        self.cursor.execute("DELETE FROM Urgency WHERE record_id = ?", (record_id,))
+        self._insert_urgency_rows(rows, now_seconds)
+        if reveal_at is not None:
+            self.cursor.execute(
+                "INSERT INTO UrgencyReveal (record_id, reveal_at) VALUES (?, ?)",
+                (record_id, reveal_at),
+            )
         self.commit()
 
-    def update_urgency(self, urgency_id: int):
+    def populate_all_urgency(self):
         """
-        Recalculate urgency score for a given entry using only fields in the Urgency table.
+        Rebuild Urgency for every task: inputs come from three set-based
+        queries and all rows are scored and inserted in a single batch.
         """
-        self.cursor.execute("SELECT urgency_id FROM ActiveUrgency WHERE id = 1")
-        row = self.cursor.fetchone()
-        active_id = row[0] if row else None
-
-        self.cursor.execute(
-            """
-            SELECT id, touched, status FROM Urgency WHERE id = ?
-        """,
-            (urgency_id,),
+        now_seconds = utc_now_to_seconds()
+        pinned = {
+            rid for (rid,) in self.cursor.execute("SELECT record_id FROM Pinned")
+        }
+        next_starts = self._next_starts_by_job()
+        rows, reveals = [], []
+        for task in self.get_all_tasks():
+            task_rows, reveal_at = self._urgency_rows_for_record(
+                task, now_seconds, task["id"] in pinned, next_starts
+            )
+            rows.extend(task_rows)
+            if reveal_at is not None:
+                reveals.append((task["id"], reveal_at))
+        self.cursor.execute("DELETE FROM Urgency")
+        self.cursor.execute("DELETE FROM UrgencyReveal")
+        self._insert_urgency_rows(rows, now_seconds)
+        self.cursor.executemany(
+            "INSERT INTO UrgencyReveal (record_id, reveal_at) VALUES (?, ?)", reveals
         )
-        row = self.cursor.fetchone()
-        if not row:
-            return  # skip nonexistent
-
-        urgency_id, touched_ts, status = row
-        now_ts = int(time.time())
+        self.commit()
 
-        # Example scoring
-        age_days = (now_ts - touched_ts) / 86400 if touched_ts else 0
-        active_bonus = 10.0 if urgency_id == active_id else 0.0
-        status_weight = {
-            "next": 5.0,
-            "scheduled": 2.0,
-            "waiting": -1.0,
-            "someday": -5.0,
-        }.get(status, 0.0)
+    def rescore_urgency(self, now_seconds: int | None = None) -> int:
+        """
+        Re-score the stored Urgency rows at ``now_seconds`` (default: now).
 
-        score = age_days + active_bonus + status_weight
+        Every row keeps its component inputs under ``weights["args"]``, so the
+        time-dependent weights (due, pastdue, age, recent) can be brought up
+        to date in one batch without rebuilding the table.  Jobs due relative
+        to now carry ``due_offset`` and get their due recomputed. Pinned rows carry
+        no inputs and stay at 1.0.  Tasks whose hidden rows have entered their
+        notice window (UrgencyReveal) are rebuilt first, so they appear.
 
-        self.cursor.execute(
-            """
-            UPDATE Urgency SET urgency = ? WHERE id = ?
-        """,
-            (score, urgency_id),
-        )
-        self.commit()
-
-    def update_all_urgencies(self):
-        self.cursor.execute("SELECT id FROM Urgency")
-        for (urgency_id,) in self.cursor.fetchall():
-            self.update_urgency(urgency_id)
+        Returns:
+            The number of rows whose urgency changed plus the number of tasks
+            rebuilt to reveal rows.
+        """
+        if now_seconds is None:
+            now_seconds = utc_now_to_seconds()
+        revealed = [
+            record_id
+            for (record_id,) in self.cursor.execute(
+                "SELECT record_id FROM UrgencyReveal WHERE reveal_at <= ?",
+                (now_seconds,),
+            ).fetchall()
+        ]
+        for record_id in revealed:
+            self.populate_urgency_from_record(record_id, now_seconds)
+        ids, previous, rows = [], [], []
+        for urgency_id, urgency, weights_json in self.cursor.execute(
+            "SELECT id, urgency, weights FROM Urgency"
+        ).fetchall():
+            try:
+                args = json.loads(weights_json or "{}").get("args")
+            except (TypeError, ValueError, AttributeError):
+                args = None
+            if not args:
+                continue
+            if args.get("due_offset") is not None:
+                # job due measured from now (only &s): it moves with the clock
+                args["due"] = now_seconds + args["due_offset"]
+            ids.append(urgency_id)
+            previous.append(urgency)
+            rows.append(args)
+
+        urgency, colors, weights = self.compute_urgency.score_batch(now_seconds, rows)
+        changed = [
+            (value, color, json.dumps(w), urgency_id)
+            for urgency_id, old, value, color, w in zip(
+                ids, previous, urgency.tolist(), colors, weights
+            )
+            if value != old
+        ]
+        if changed:
+            self.cursor.executemany(
+                "UPDATE Urgency SET urgency = ?, color = ?, weights = ? WHERE id = ?",
+                changed,
+            )
+            self.commit()
+        return len(changed) + len(revealed)
 
     def get_all(self):
         cur = self.conn.cursor()
@@ -5084,100 +6071,69 @@ class DatabaseManager:
         0 = free
         1 = busy
         2 = conflict
+
+        All weeks are counted, collapsed and written in one pass.
         """
 
-        self.cursor.execute("SELECT DISTINCT year_week FROM BusyWeeksFromDateTimes")
-        weeks = [row[0] for row in self.cursor.fetchall()]
-        if not weeks:
+        self.cursor.execute("SELECT year_week, busybits FROM BusyWeeksFromDateTimes")
+        rows = [
+            (year_week, blob)
+            for year_week, blob in self.cursor.fetchall()
+            if len(blob) == PACKED_WEEK_BYTES
+        ]
+        if not rows:
             print("⚠️ No data to aggregate.")
             return
 
-        for yw in weeks:
-            # --- Gather all event arrays for this week
-            self.cursor.execute(
-                "SELECT busybits FROM BusyWeeksFromDateTimes WHERE year_week = ?",
-                (yw,),
-            )
-            blobs = [
-                np.frombuffer(row[0], dtype=np.uint8) for row in self.cursor.fetchall()
-            ]
-            if not blobs:
-                continue
-
-            n = len(blobs[0])
-            if any(arr.size != n for arr in blobs):
-                print(f"⚠️ Skipping {yw}: inconsistent array sizes")
-                continue
-
-            # Stack vertically -> shape (num_events, 679)
-            stack = np.vstack(blobs)
-
-            # Count per slot
-            counts = stack.sum(axis=0)
-
-            # Collapse fine bits into ternary (0 free / 1 busy / 2 conflict)
-            merged = np.where(counts >= 2, 2, np.where(counts >= 1, 1, 0)).astype(
-                np.uint8
-            )
+        rows.sort(key=lambda row: row[0])
+        weeks, starts = np.unique([yw for yw, _ in rows], return_index=True)
+        packed = np.frombuffer(b"".join(blob for _, blob in rows), dtype=np.uint8)
+        fine = np.unpackbits(packed.reshape(-1, PACKED_WEEK_BYTES), axis=1)
+        counts = np.add.reduceat(fine[:, :WEEK_SLOTS].astype(np.int32), starts, axis=0)
 
-            # Reduce 679 fine bits → 35 coarse blocks (7 × [1+4])
-            merged = _reduce_to_35_slots(merged)
-
-            # Serialize
-            blob = merged.tobytes()
+        # Collapse fine counts into ternary (0 free / 1 busy / 2 conflict)
+        coarse = _reduce_to_35_slots(np.minimum(counts, 2))
+        self._write_busy_weeks(zip(weeks.tolist(), _ternary_strings(coarse)))
+        self.commit()
 
-            bits_str = "".join(str(int(x)) for x in merged)
-            self.cursor.execute(
-                """
-                INSERT INTO BusyWeeks (year_week, busybits)
-                VALUES (?, ?)
-                ON CONFLICT(year_week)
-                DO UPDATE SET busybits = excluded.busybits
+    def _write_busy_weeks(self, items: Iterable[tuple[str, str]]) -> None:
+        """Upsert (year_week, busybits) rows into BusyWeeks."""
+        self.cursor.executemany(
+            """
+            INSERT INTO BusyWeeks (year_week, busybits)
+            VALUES (?, ?)
+            ON CONFLICT(year_week)
+            DO UPDATE SET busybits = excluded.busybits
             """,
-                (yw, bits_str),
-            )
-
-        self.commit()
+            items,
+        )
 
     def _aggregate_busy_week(self, year_week: str) -> None:
-        import numpy as np
-
         self.cursor.execute(
             "SELECT busybits FROM BusyWeeksFromDateTimes WHERE year_week = ?",
             (year_week,),
         )
-        blobs = [
-            np.frombuffer(row[0], dtype=np.uint8) for row in self.cursor.fetchall()
-        ]
-        if not blobs:
+        masks = [busy_mask(row[0]) for row in self.cursor.fetchall()]
+        if not masks:
             self.cursor.execute(
                 "DELETE FROM BusyWeeks WHERE year_week = ?", (year_week,)
             )
             self.commit()
             return
 
-        stack = np.vstack(blobs)
-        counts = stack.sum(axis=0)
-        merged = np.where(counts >= 2, 2, np.where(counts >= 1, 1, 0)).astype(np.uint8)
-        merged = _reduce_to_35_slots(merged)
-        bits_str = "".join(str(int(x)) for x in merged)
-        self.cursor.execute(
-            """
-            INSERT INTO BusyWeeks (year_week, busybits)
-            VALUES (?, ?)
-            ON CONFLICT(year_week)
-            DO UPDATE SET busybits = excluded.busybits
-            """,
-            (year_week, bits_str),
+        # busy where any record is busy, conflict where two or more overlap
+        busy = or_aggregate(masks)
+        conflict = conflict_aggregate(masks)
+        merged = _reduce_to_35_slots(
+            busy_mask_to_bits(busy) + busy_mask_to_bits(conflict)
         )
+        self._write_busy_weeks([(year_week, _ternary_strings(merged)[0])])
         self.commit()
 
     def update_busy_weeks_for_record(self, record_id: int) -> None:
         """
         Recompute busy caches impacted by a single record.
         """
-        import numpy as np
-
         self.cursor.execute(
             "SELECT year_week FROM BusyWeeksFromDateTimes WHERE record_id = ?",
             (record_id,),
@@ -5195,34 +6151,26 @@ class DatabaseManager:
         if itemtype == "*":
             self.cursor.execute(
                 """
-                SELECT start_datetime, end_datetime
+                SELECT record_id, start_datetime, end_datetime
                 FROM DateTimes
                 WHERE record_id = ?
                 """,
                 (record_id,),
             )
-            rows = self.cursor.fetchall()
-            week_map: dict[str, np.ndarray] = {}
-            for start_str, end_str in rows:
-                for year_week, arr in fine_busy_bits_for_event(
-                    start_str, end_str
-                ).items():
-                    affected.add(year_week)
-                    arr = np.asarray(arr, dtype=np.uint8)
-                    if year_week in week_map:
-                        week_map[year_week] = np.maximum(week_map[year_week], arr)
-                    else:
-                        week_map[year_week] = arr
-            for year_week, arr in week_map.items():
-                self.cursor.execute(
-                    """
-                    INSERT INTO BusyWeeksFromDateTimes (record_id, year_week, busybits)
-                    VALUES (?, ?, ?)
-                    ON CONFLICT(record_id, year_week)
-                    DO UPDATE SET busybits = excluded.busybits
-                    """,
-                    (record_id, year_week, arr.tobytes()),
-                )
+            keys, bits = busy_bits_for_events(self.cursor.fetchall())
+            affected.update(year_week for _, year_week in keys)
+            self.cursor.executemany(
+                """
+                INSERT INTO BusyWeeksFromDateTimes (record_id, year_week, busybits)
+                VALUES (?, ?, ?)
+                ON CONFLICT(record_id, year_week)
+                DO UPDATE SET busybits = excluded.busybits
+                """,
+                (
+                    (record_id, year_week, blob)
+                    for (_, year_week), blob in zip(keys, pack_busy_bits(bits))
+                ),
+            )
             self.commit()
 
         for year_week in affected:
@@ -5323,10 +6271,10 @@ class DatabaseManager:
         Return a list of 35 ternary busy bits (0=free, 1=busy, 2=conflict)
         for the given ISO year-week string (e.g. '2025-41').
         """
-        self.cursor.execute(
+        self.read_cursor.execute(
             "SELECT busybits FROM BusyWeeks WHERE year_week = ?", (year_week,)
         )
-        row = self.cursor.fetchone()
+        row = self.read_cursor.fetchone()
         if not row:
             return [0] * 35
 
@@ -5339,6 +6287,90 @@ class DatabaseManager:
             bits = (bits + [0] * 35)[:35]
         return bits
 
+    def find_free_slots(
+        self,
+        start: datetime,
+        end: datetime,
+        min_duration: timedelta,
+        day_hours: tuple[int, int] = (0, 24),
+    ) -> list[tuple[datetime, datetime]]:
+        """
+        Return free (start, end) periods of at least min_duration in [start, end),
+        searching only between day_hours = (first hour, last hour) of each day.
+
+        Answers come from the fine busy cache (BusyWeeksFromDateTimes) at
+        15-minute resolution without reading DateTimes:
+        - only events are busy and all-day events do not block time;
+        - an event ending at 10:00 leaves the 10:00 slot free, while one
+          ending at 10:05 blocks it;
+        - weeks outside the generated window are generated first (with the
+          busy cache refreshed), so recurring events count there too.
+        """
+        first_hour, last_hour = day_hours
+        if not 0 <= first_hour < last_hour <= 24:
+            raise ValueError(f"Invalid day_hours: {day_hours!r}")
+        if end <= start:
+            return []
+
+        slot = timedelta(minutes=15)
+        first_day = start.date()
+        last_day = (end - timedelta(microseconds=1)).date()
+        week0 = first_day - timedelta(days=first_day.weekday())
+        n_weeks = (last_day - week0).days // 7 + 1
+        labels = [_iso_year_week(week0 + timedelta(weeks=i)) for i in range(n_weeks)]
+        index = {label: i for i, label in enumerate(labels)}
+
+        first_week = week0.isocalendar()[:2]
+        last_week = (week0 + timedelta(weeks=n_weeks - 1)).isocalendar()[:2]
+        rng = self.get_generated_weeks_range()
+        if (
+            not rng
+            or self._week_key(*first_week) < self._week_key(rng[0], rng[1])
+            or self._week_key(*last_week) > self._week_key(rng[2], rng[3])
+        ):
+            self.extend_datetimes_for_weeks(*first_week, n_weeks)
+            self.populate_dependent_tables()
+
+        self.read_cursor.execute(
+            """
+            SELECT year_week, busybits FROM BusyWeeksFromDateTimes
+            WHERE year_week BETWEEN ? AND ?
+            """,
+            (labels[0], labels[-1]),
+        )
+        masks = [0] * n_weeks
+        for year_week, blob in self.read_cursor.fetchall():
+            i = index.get(year_week)
+            if i is not None and len(blob) == PACKED_WEEK_BYTES:
+                masks[i] |= busy_mask(blob)
+
+        # (weeks × 679) → one row of 96 quarter hours per day, all-day dropped
+        fine = np.stack([busy_mask_to_bits(mask) for mask in masks])
+        by_day = fine.reshape(n_weeks * 7, DAY_SLOTS)[:, 1:]
+        offset = (first_day - week0).days
+        n_days = (last_day - first_day).days + 1
+        busy = by_day[offset : offset + n_days].astype(bool)
+
+        slots = np.arange(96)
+        in_hours = (slots >= first_hour * 4) & (slots < last_hour * 4)
+        free = (~busy & in_hours).reshape(-1)
+
+        midnight = datetime.combine(first_day, time.min)
+        lo = -((midnight - start) // slot)  # first whole slot at or after start
+        hi = (end - midnight) // slot
+        free[: max(lo, 0)] = False
+        free[hi:] = False
+
+        edges = np.diff(np.concatenate(([0], free.astype(np.int8), [0])))
+        run_starts = np.flatnonzero(edges == 1)
+        run_stops = np.flatnonzero(edges == -1)
+        need = max(-(-min_duration // slot), 1)
+        keep = run_stops - run_starts >= need
+        return [
+            (midnight + int(a) * slot, midnight + int(b) * slot)
+            for a, b in zip(run_starts[keep], run_stops[keep])
+        ]
+
     def move_bin(self, bin_name: str, new_parent_name: str) -> bool:
         """
         Convenience wrapper that moves bins by name (creating them if missing).
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
 from typing import Callable, Iterable, List, Sequence
 
 from dateutil import parser as dt_parser
@@ -10,6 +10,30 @@ from dateutil import parser as dt_parser
 FIELD_REGEX_DATE = re.compile(r"^\d{4}-\d{1,2}-\d{1,2}$")
 LIST_SPLIT_PATTERN = re.compile(r"[,\s]+")
 
+# Fields whose values are kept in the TokenFields table (and so can be pushed
+# down to SQL); masked values are never written there.
+UNINDEXED_FIELDS = frozenset({"m", "~m"})
+# Fields with a parsed TokenFields.value_dt, usable by ``dt`` pushdown.
+DATETIME_FIELDS = frozenset({"s", "f", "~s", "~f"})
+TOKEN_FIELD_SQL = (
+    "r.id IN (SELECT record_id FROM TokenFields WHERE field = ? AND {condition})"
+)
+# Relative cost of evaluating a command's predicate on one record; cheaper (and
+# typically more selective) clauses of an ``and`` run are checked first.
+COMMAND_COSTS = {
+    "equals": 1,
+    "exists": 1,
+    "one": 2,
+    "begins": 3,
+    "includes": 3,
+    "in": 3,
+    "more": 4,
+    "less": 4,
+    "any": 4,
+    "all": 4,
+    "dt": 8,
+}
+
 
 class QueryError(ValueError):
     """Raised when a query string cannot be parsed."""
@@ -28,32 +52,131 @@ class QueryResponse:
     info_id: int | None = None
 
 
+@dataclass(frozen=True)
+class SqlFilter:
+    """
+    A WHERE fragment over ``Records r`` that a clause has been pushed down to.
+
+    An ``exact`` filter selects precisely the records its clause matches; an
+    inexact one only narrows the candidates the clause is then checked against.
+    """
+
+    sql: str
+    params: tuple = ()
+    exact: bool = True
+
+
 class QueryPlan:
-    def __init__(self, clauses: list[tuple[str | None, Callable[["RecordView"], bool]]]):
+    def __init__(
+        self,
+        clauses: list[tuple[str | None, Callable[["RecordView"], bool]]],
+        filters: list[SqlFilter | None] | None = None,
+        costs: list[int] | None = None,
+    ):
         self.clauses = clauses
+        self.filters = filters if filters is not None else [None] * len(clauses)
+        self.costs = costs if costs is not None else [0] * len(clauses)
+        self._segments = self._compile()
+
+    def _compile(self) -> list[list[Callable[["RecordView"], bool]]]:
+        """
+        Split the clauses at each ``or`` into segments: the first predicate of
+        a later segment is or-ed onto the running result, the rest are and-ed.
+        Since the connectors fold left to right, the and-ed predicates of a
+        segment (all of the first one) are independent and are ordered by cost.
+        """
+        segments: list[list[tuple[int, Callable[["RecordView"], bool]]]] = []
+        for (connector, predicate), cost in zip(self.clauses, self.costs):
+            if not segments or connector == "or":
+                segments.append([])
+            segments[-1].append((cost, predicate))
+        compiled = []
+        for idx, segment in enumerate(segments):
+            head, tail = (segment[:1], segment[1:]) if idx else ([], segment)
+            tail = sorted(tail, key=lambda item: item[0])
+            compiled.append([predicate for _, predicate in head + tail])
+        return compiled
 
     def matches(self, record: "RecordView") -> bool:
         """
-        Evaluate the compiled plan against a record, applying each predicate in
-        sequence while honoring the stored ``and``/``or`` connectors.  Clauses
-        default to ``and`` when no connector is provided (first clause).
+        Evaluate the compiled plan against a record, honoring the stored
+        ``and``/``or`` connectors left to right.  Evaluation short-circuits:
+        an ``or`` clause is skipped once the result is true, and the rest of an
+        ``and`` run once it is false.
         """
-        result: bool | None = None
-        for connector, predicate in self.clauses:
-            value = predicate(record)
-            if result is None:
-                result = value
-                continue
-            if connector == "or":
-                result = result or value
+        result = False
+        for idx, segment in enumerate(self._segments):
+            conjuncts = segment
+            if idx:
+                result = result or bool(segment[0](record))
+                conjuncts = segment[1:]
             else:
-                result = result and value
-        return bool(result)
+                result = True
+            if not result:
+                continue
+            for predicate in conjuncts:
+                if not predicate(record):
+                    result = False
+                    break
+        return result
 
     @property
     def is_empty(self) -> bool:
         return not self.clauses
 
+    def sql_filter(self) -> SqlFilter | None:
+        """
+        Fold the clause filters with the same left-to-right ``and``/``or`` logic
+        as ``matches`` into one candidate filter.  A clause without a filter
+        restricts nothing, so it absorbs an ``or`` and drops out of an ``and``.
+        Returns None when nothing can be pushed down.
+        """
+        combined: SqlFilter | None = None
+        pairs = zip(self.clauses, self.filters)
+        for idx, ((connector, _), current) in enumerate(pairs):
+            if idx == 0:
+                combined = current
+            elif connector == "or":
+                if combined is None or current is None:
+                    combined = None
+                else:
+                    combined = SqlFilter(
+                        f"({combined.sql} OR {current.sql})",
+                        combined.params + current.params,
+                    )
+            elif current is not None:
+                if combined is None:
+                    combined = current
+                else:
+                    combined = SqlFilter(
+                        f"({combined.sql} AND {current.sql})",
+                        combined.params + current.params,
+                    )
+        return combined
+
+    def residual(self) -> "QueryPlan":
+        """
+        Return the clauses still to be checked on records selected by
+        ``sql_filter``.  In a pure ``and`` chain, clauses with exact filters are
+        already settled; once ``or`` is involved every clause is kept.
+        """
+        if any(connector == "or" for connector, _ in self.clauses):
+            return self
+        kept = [
+            (predicate, cost)
+            for (_, predicate), current, cost in zip(
+                self.clauses, self.filters, self.costs
+            )
+            if current is None or not current.exact
+        ]
+        return QueryPlan(
+            [
+                (None if idx == 0 else "and", predicate)
+                for idx, (predicate, _) in enumerate(kept)
+            ],
+            costs=[cost for _, cost in kept],
+        )
+
 
 class RecordView:
     """Normalized view over a record's tokens for querying."""
@@ -69,6 +192,7 @@ class RecordView:
         self.itemtype = (itemtype or "").strip()
         self.subject = (subject or "").strip()
         self._field_map: dict[str, list[str]] = {}
+        self._datetime_values: dict[str, list[tuple[date | datetime, bool]]] = {}
         self._populate_from_tokens(tokens or [])
 
     def _populate_from_tokens(self, tokens: Sequence[dict]) -> None:
@@ -120,6 +244,12 @@ class RecordView:
             value = raw
         return value
 
+    def field_values(self) -> Iterable[tuple[str, str]]:
+        """Yield every (field, value) pair of the record."""
+        for field, values in self._field_map.items():
+            for value in values:
+                yield field, value
+
     def get_values(self, field: str) -> list[str]:
         field = normalize_field(field)
         return list(self._field_map.get(field, []))
@@ -132,12 +262,17 @@ class RecordView:
         return values
 
     def get_datetime_values(self, field: str) -> list[tuple[date | datetime, bool]]:
-        parsed: list[tuple[date | datetime, bool]] = []
-        for value in self.get_values(field):
-            parsed_value = parse_field_datetime(value)
-            if parsed_value is not None:
-                parsed.append(parsed_value)
-        return parsed
+        """Parsed datetimes of ``field``, memoized so each value parses once."""
+        field = normalize_field(field)
+        parsed = self._datetime_values.get(field)
+        if parsed is None:
+            parsed = []
+            for value in self._field_map.get(field, []):
+                parsed_value = parse_field_datetime(value)
+                if parsed_value is not None:
+                    parsed.append(parsed_value)
+            self._datetime_values[field] = parsed
+        return list(parsed)
 
 
 class QueryParser:
@@ -179,6 +314,8 @@ class QueryParser:
             raise QueryError("Enter a query.")
         tokens = text.split()
         clauses: list[tuple[str | None, Callable[[RecordView], bool]]] = []
+        filters: list[SqlFilter | None] = []
+        costs: list[int] = []
         connector: str | None = None
         info_id: int | None = None
         idx = 0
@@ -225,17 +362,94 @@ class QueryParser:
                 idx += 1
 
             predicate = builder(args)
+            sql_filter = self._pushdown(lowered, args)
             if negate:
                 predicate = negate_predicate(predicate)
+                sql_filter = negate_filter(sql_filter)
 
             clause_connector = connector if clauses else None
             clauses.append((clause_connector, predicate))
+            filters.append(sql_filter)
+            costs.append(COMMAND_COSTS.get(lowered, 0))
             connector = None
 
         if connector is not None:
             raise QueryError("Query cannot end with a connector.")
 
-        return QueryPlan(clauses), info_id
+        return QueryPlan(clauses, filters, costs), info_id
+
+    def _pushdown(self, command: str, args: list[str]) -> SqlFilter | None:
+        """
+        Translate a clause into an SQL filter over TokenFields when possible.
+
+        ``exists``, ``equals``, ``begins`` and ``includes``/``in`` are exact;
+        ``more``/``less`` and ``dt`` only narrow the candidates, leaving the
+        comparison itself to Python.
+        """
+        if command == "exists":
+            return field_filter(args[0], "value != ''", ())
+        if command == "equals":
+            return field_filter(args[0], "value = ?", (args[1],))
+        if command in ("begins", "includes", "in"):
+            pattern = args[-1]
+            if command == "begins":
+                pattern = f"^(?:{pattern})"
+            try:
+                re.compile(pattern)
+            except re.error:
+                return None
+            parts = [
+                field_filter(field, "value REGEXP ?", (f"(?i){pattern}",))
+                for field in args[:-1]
+            ]
+            if any(part is None for part in parts):
+                return None
+            return SqlFilter(
+                "(" + " OR ".join(part.sql for part in parts) + ")",
+                tuple(param for part in parts for param in part.params),
+            )
+        if command in ("more", "less"):
+            operator = ">=" if command == "more" else "<="
+            target = args[1]
+            if to_number(target) is None:
+                return field_filter(
+                    args[0], f"value {operator} ?", (target,), exact=False
+                )
+            return field_filter(
+                args[0],
+                f"(value_num {operator} ?"
+                f" OR (value_num IS NULL AND value {operator} ?))",
+                (to_number(target), target),
+                exact=False,
+            )
+        if command == "dt" and normalize_field(args[0]) in DATETIME_FIELDS:
+            return self._pushdown_dt(args)
+        return None
+
+    def _pushdown_dt(self, args: list[str]) -> SqlFilter | None:
+        """
+        Filter on TokenFields.value_dt, which holds 'YYYY-MM-DD' for date-only
+        values and 'YYYY-MM-DD HH:MM:SS' otherwise, so the length tells the two
+        apart and text comparison orders them.  compare_dates truncates
+        datetimes to midnight, so comparisons are by day: each becomes a range
+        on value_dt that the (field, value_dt) index can serve.
+        """
+        operator = args[1]
+        if operator == "?":
+            kind = args[2].lower()
+            length = "= 10" if kind == "date" else "> 10"
+            return field_filter(args[0], f"length(value_dt) {length}", (), exact=False)
+        target = parse_query_datetime(args[2])
+        if isinstance(target, datetime):
+            target = target.date()
+        day, next_day = target.isoformat(), (target + timedelta(days=1)).isoformat()
+        if operator == ">":
+            condition, params = "value_dt >= ?", (next_day,)
+        elif operator == "<":
+            condition, params = "value_dt < ?", (day,)
+        else:
+            condition, params = "value_dt >= ? AND value_dt < ?", (day, next_day)
+        return field_filter(args[0], condition, params, exact=False)
 
     def _build_begins(self, args: list[str]) -> Callable[[RecordView], bool]:
         if len(args) < 2:
@@ -402,12 +616,21 @@ class QueryEngine:
     def run(
         self,
         text: str,
-        records: Iterable[dict],
+        records: Iterable[dict] | Callable[[SqlFilter | None], Iterable[dict]],
     ) -> QueryResponse:
+        """
+        Evaluate ``text`` against ``records``.  When ``records`` is a callable it
+        is given the plan's SQL filter and should return only the candidate
+        records; clauses the filter settles exactly are then skipped.
+        """
         plan, info_id = self.parser.parse(text)
         if info_id is not None:
             return QueryResponse(matches=[], info_id=info_id)
 
+        if callable(records):
+            records = records(plan.sql_filter())
+            plan = plan.residual()
+
         matches: list[QueryMatch] = []
         for record in records:
             view = RecordView(
@@ -416,7 +639,7 @@ class QueryEngine:
                 subject=record.get("subject", ""),
                 tokens=record.get("tokens", []),
             )
-            if plan.matches(view):
+            if plan.is_empty or plan.matches(view):
                 matches.append(
                     QueryMatch(
                         record_id=view.record_id,
@@ -452,6 +675,41 @@ def negate_predicate(predicate: Callable[[RecordView], bool]) -> Callable[[Recor
     return _wrapped
 
 
+def field_filter(
+    field: str, condition: str, params: tuple, exact: bool = True
+) -> SqlFilter | None:
+    """
+    Build a filter matching records with any TokenFields row for ``field``
+    satisfying ``condition`` (written against value, value_num and value_dt).
+    """
+    field = normalize_field(field)
+    if not field or field in UNINDEXED_FIELDS:
+        return None
+    sql = TOKEN_FIELD_SQL.format(condition=condition)
+    return SqlFilter(sql, (field, *params), exact)
+
+
+def field_datetime_key(value: str) -> str | None:
+    """
+    Return the sortable TokenFields.value_dt text for ``value``: 'YYYY-MM-DD'
+    for a date-only value, 'YYYY-MM-DD HH:MM:SS' for a datetime.
+    """
+    parsed = parse_field_datetime(value)
+    if parsed is None:
+        return None
+    parsed_value, is_date_only = parsed
+    if is_date_only:
+        return parsed_value.isoformat()
+    return parsed_value.replace(tzinfo=None).isoformat(sep=" ")
+
+
+def negate_filter(sql_filter: SqlFilter | None) -> SqlFilter | None:
+    """Negate an exact filter; an inexact one cannot be inverted."""
+    if sql_filter is None or not sql_filter.exact:
+        return None
+    return SqlFilter(f"NOT ({sql_filter.sql})", sql_filter.params)
+
+
 def compare_values(left: str, right: str, operator: str) -> bool:
     left_num = to_number(left)
     right_num = to_number(right)
@@ -1,9 +1,14 @@
+import atexit
 import inspect
+import sys
 import textwrap
+import threading
+import time
 import shutil
 import re
 import os
 import tomllib
+from collections import OrderedDict
 from rich import print as rich_print
 from datetime import date, datetime, timedelta, timezone
 from typing import Literal, Tuple
@@ -11,6 +16,7 @@ from dateutil import tz
 from pathlib import Path
 from dateutil.parser import parse as dateutil_parse
 from dateutil.parser import parserinfo
+from dateutil.rrule import rrulestr
 from zoneinfo import ZoneInfo
 from .versioning import get_version
 
@@ -374,6 +380,70 @@ def get_anchor(aware: bool) -> datetime:
     return dt
 
 
+class RRulesetCache:
+    """
+    Bounded LRU of parsed ``rrulestr`` objects keyed by (rule text, timezone,
+    prepare).
+
+    ``prepare`` (when given) turns the stored rule text into the string that
+    is actually parsed, e.g. normalizing and localizing it to the record's
+    timezone; the prepared text is cached alongside the parsed rule.  Its
+    qualified name is part of the key, so raw and prepared lookups of the same
+    text never share an entry and the cache holds no reference to the object
+    a bound ``prepare`` belongs to.  Parse errors propagate and are not cached.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple[str, str, str], tuple[str, object]] = (
+            OrderedDict()
+        )
+
+    def get(
+        self, rule_str: str, timezone: str | None = None, prepare=None
+    ) -> tuple[str, object]:
+        """Return (prepared rule text, parsed rule or None if the text is empty)."""
+        prepare_name = (
+            f"{prepare.__module__}.{prepare.__qualname__}" if prepare else ""
+        )
+        key = (rule_str or "", timezone or "", prepare_name)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+        self.misses += 1
+        text = prepare(rule_str, timezone) if prepare else rule_str
+        rule = rrulestr(text, tzids=tz.gettz) if text else None
+        self._entries[key] = (text, rule)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return text, rule
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+        }
+
+
+rruleset_cache = RRulesetCache()
+
+
+def compile_rruleset(rule_str: str):
+    """Return the cached ``rrulestr`` object for rule_str (None when empty)."""
+    return rruleset_cache.get(rule_str)[1]
+
+
 def fmt_user(dt_str: str) -> str:
     """
     User friendly formatting for dates and datetimes using env settings
@@ -851,35 +921,35 @@ def _resolve_log_file_path(file_path: str | Path) -> Path:
     return _get_runtime_home() / path
 
 
-def _default_log_relative_path(kind: str) -> Path:
-    """Return logs/log_<YYMMDD>.md style paths under the runtime home."""
-    suffix = datetime.now().strftime("%y%m%d")
-    return Path("logs") / f"{kind}_{suffix}.md"
-
-
-def _get_num_logs_limit() -> int:
-    """
-    Return configured daily log retention count.
-    0 means disabled (keep all files).
-    """
-    default = 0
+def _read_runtime_config_value(name: str, default):
+    """Read a top-level config value for the runtime home (TKLR_HOME aware)."""
     runtime_home = _get_runtime_home()
     config_path = runtime_home / "config.toml"
-    value = default
 
     if runtime_home == env.home:
         try:
-            value = int(getattr(env.config, "num_logs", default))
+            return getattr(env.config, name, default)
         except Exception:
-            value = default
-    elif config_path.exists():
+            return default
+    if config_path.exists():
         try:
             with open(config_path, "rb") as fh:
                 data = tomllib.load(fh)
-            value = int(data.get("num_logs", default))
+            return data.get(name, default)
         except Exception:
-            value = default
+            return default
+    return default
+
 
+def _get_num_logs_limit() -> int:
+    """
+    Return configured daily log retention count.
+    0 means disabled (keep all files).
+    """
+    try:
+        value = int(_read_runtime_config_value("num_logs", 0))
+    except Exception:
+        value = 0
     return max(value, 0)
 
 
@@ -903,141 +973,220 @@ def _prune_daily_log_files(kind: str, keep: int) -> None:
             continue
 
 
-def _apply_log_retention() -> None:
-    keep = _get_num_logs_limit()
-    if keep <= 0:
-        return
-    _prune_daily_log_files("log", keep)
-    _prune_daily_log_files("bug", keep)
+LOG_LEVELS = {"debug": 10, "info": 20, "warning": 30, "error": 40, "off": 100}
 
+# Resolved lazily from config.log_level; see set_log_level().
+_log_threshold: int | None = None
+_log_width: int | None = None
 
-def log_msg(
-    msg: str,
-    file_path: str | Path | None = None,
-    print_output: bool = False,
-):
+
+def set_log_level(level: str | None) -> None:
     """
-    Log a message and save it directly to a file.
+    Set the lowest level written by log_msg and bug_msg.
 
-    Args:
-        msg (str): The message to log.
-        file_path (str | Path | None, optional): Overrides the default path when
-            provided. Defaults to ``None`` which writes to ``logs/log_<YYMMDD>.md``.
-        print_output (bool, optional): If True, also print to console.
+    Passing None re-reads ``log_level`` from the config on the next call.
     """
-    frame = inspect.stack()[1].frame
-    func_name = frame.f_code.co_name
+    global _log_threshold
+    _log_threshold = None if level is None else LOG_LEVELS[level]
 
-    # Default: just function name
-    caller_name = func_name
 
-    # Detect instance/class/static context
-    if "self" in frame.f_locals:  # instance method
-        cls_name = frame.f_locals["self"].__class__.__name__
-        caller_name = f"{cls_name}.{func_name}"
-    elif "cls" in frame.f_locals:  # classmethod
-        cls_name = frame.f_locals["cls"].__name__
-        caller_name = f"{cls_name}.{func_name}"
+def log_enabled(level: str = "debug") -> bool:
+    """
+    Return True when log_msg/bug_msg would write a message at ``level``.
 
-    # Format the line header
-    lines = [
-        f"- {datetime.now().strftime('%H:%M:%S')} log_msg ({caller_name}):  ",
-    ]
-    # Wrap the message text
+    Guard costly debug messages with it so their f-strings are only built
+    when they will be written.
+    """
+    threshold = _log_threshold
+    if threshold is None:
+        threshold = _get_log_threshold()
+    return LOG_LEVELS[level] >= threshold
+
+
+def _get_log_threshold() -> int:
+    global _log_threshold
+    if _log_threshold is None:
+        level = str(_read_runtime_config_value("log_level", "info")).lower()
+        _log_threshold = LOG_LEVELS.get(level, LOG_LEVELS["info"])
+    return _log_threshold
+
+
+class _LogSink:
+    """
+    Append-only log files kept open between calls.
+
+    Writes are buffered and flushed once FLUSH_BYTES are pending, by a timer
+    FLUSH_INTERVAL seconds after the first unflushed write, immediately for
+    warnings and above, and at exit.  Daily retention runs once per kind,
+    runtime home and day rather than on every message.
+    """
+
+    FLUSH_INTERVAL = 1.0
+    FLUSH_BYTES = 64 * 1024
+
+    def __init__(self):
+        self._handles: dict[str, tuple[Path, object]] = {}
+        self._lock = threading.RLock()
+        self._pending = 0
+        self._timer: threading.Timer | None = None
+        self._retention_keys: dict[str, tuple[Path, str]] = {}
+        atexit.register(self.close)
+
+    def write(self, key: str, path: Path, text: str, *, flush: bool = False) -> None:
+        with self._lock:
+            entry = self._handles.get(key)
+            if entry is None or entry[0] != path:
+                if entry is not None:
+                    entry[1].close()
+                path.parent.mkdir(parents=True, exist_ok=True)
+                handle = open(path, "a")
+                self._handles[key] = (path, handle)
+            else:
+                handle = entry[1]
+            handle.write(text)
+            self._pending += len(text)
+            if flush or self._pending >= self.FLUSH_BYTES:
+                self.flush()
+            elif self._timer is None:
+                self._timer = threading.Timer(self.FLUSH_INTERVAL, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def maybe_apply_retention(self, kind: str, day: str) -> None:
+        key = (_get_runtime_home(), day)
+        if self._retention_keys.get(kind) == key:
+            return
+        self._retention_keys[kind] = key
+        keep = _get_num_logs_limit()
+        if keep > 0:
+            _prune_daily_log_files(kind, keep)
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            self._pending = 0
+            for _, handle in self._handles.values():
+                try:
+                    handle.flush()
+                except (OSError, ValueError):
+                    continue
+
+    def close(self) -> None:
+        with self._lock:
+            self.flush()
+            for _, handle in self._handles.values():
+                try:
+                    handle.close()
+                except OSError:
+                    continue
+            self._handles.clear()
+
+
+_log_sink = _LogSink()
+
+
+def _emit_log(
+    kind: str,
+    msg: str,
+    file_path: str | Path | None,
+    print_output: bool,
+    level: str,
+) -> None:
+    """Format and write one log_msg/bug_msg entry; callers check the level."""
+    global _log_width
+    # _emit_log <- log_msg/bug_msg <- caller
+    code = sys._getframe(2).f_code
+    caller_name = getattr(code, "co_qualname", code.co_name).rpartition("<locals>.")[2]
+
+    if _log_width is None:
+        _log_width = max(shutil.get_terminal_size()[0] - 6, 20)
+
+    now = datetime.now()
+    lines = [f"- {now.strftime('%H:%M:%S')} {kind}_msg ({caller_name}):  "]
     lines.extend(
-        [
-            f"\n{x}"
-            for x in textwrap.wrap(
-                msg.strip(),
-                width=shutil.get_terminal_size()[0] - 6,
-                initial_indent="   ",
-                subsequent_indent="   ",
-            )
-        ]
+        f"\n{x}"
+        for x in textwrap.wrap(
+            msg.strip(),
+            width=_log_width,
+            initial_indent="   ",
+            subsequent_indent="   ",
+        )
     )
     lines.append("\n\n")
+    text = "".join(lines)
 
     # Best-effort file logging; fall back to console when the file is unwritable.
     use_default_path = file_path is None
-    if file_path is None:
-        file_path = _default_log_relative_path("log")
-    log_path = _resolve_log_file_path(file_path)
-    log_path.parent.mkdir(parents=True, exist_ok=True)
+    if use_default_path:
+        day = now.strftime("%y%m%d")
+        key = kind
+        log_path = _get_runtime_home() / "logs" / f"{kind}_{day}.md"
+    else:
+        key = str(file_path)
+        log_path = _resolve_log_file_path(file_path)
 
     try:
-        with open(log_path, "a") as f:
-            f.writelines(lines)
+        _log_sink.write(
+            key, log_path, text, flush=LOG_LEVELS[level] >= LOG_LEVELS["warning"]
+        )
         if use_default_path:
-            _apply_log_retention()
+            _log_sink.maybe_apply_retention(kind, day)
     except OSError:
         print_output = True
 
     if print_output:
-        print("".join(lines))
+        print(text)
 
 
-def bug_msg(
+def log_msg(
     msg: str,
     file_path: str | Path | None = None,
     print_output: bool = False,
+    level: str = "info",
 ):
     """
-    Companion to log_msg for temporary debugging.
+    Log a message and save it directly to a file.
 
     Args:
         msg (str): The message to log.
         file_path (str | Path | None, optional): Overrides the default path when
-            provided. Defaults to ``None`` which writes to ``logs/bug_<YYMMDD>.md``.
+            provided. Defaults to ``None`` which writes to ``logs/log_<YYMMDD>.md``.
         print_output (bool, optional): If True, also print to console.
+        level (str, optional): One of LOG_LEVELS; messages below the
+            configured ``log_level`` return immediately.
     """
-    frame = inspect.stack()[1].frame
-    func_name = frame.f_code.co_name
-
-    # Default: just function name
-    caller_name = func_name
-
-    # Detect instance/class/static context
-    if "self" in frame.f_locals:  # instance method
-        cls_name = frame.f_locals["self"].__class__.__name__
-        caller_name = f"{cls_name}.{func_name}"
-    elif "cls" in frame.f_locals:  # classmethod
-        cls_name = frame.f_locals["cls"].__name__
-        caller_name = f"{cls_name}.{func_name}"
-
-    # Format the line header
-    lines = [
-        f"- {datetime.now().strftime('%H:%M:%S')} bug_msg ({caller_name}):  ",
-    ]
-    # Wrap the message text
-    lines.extend(
-        [
-            f"\n{x}"
-            for x in textwrap.wrap(
-                msg.strip(),
-                width=shutil.get_terminal_size()[0] - 6,
-                initial_indent="   ",
-                subsequent_indent="   ",
-            )
-        ]
-    )
-    lines.append("\n\n")
+    threshold = _log_threshold
+    if threshold is None:
+        threshold = _get_log_threshold()
+    if LOG_LEVELS[level] < threshold:
+        return
+    _emit_log("log", msg, file_path, print_output, level)
 
-    use_default_path = file_path is None
-    if file_path is None:
-        file_path = _default_log_relative_path("bug")
-    log_path = _resolve_log_file_path(file_path)
-    log_path.parent.mkdir(parents=True, exist_ok=True)
 
-    try:
-        with open(log_path, "a") as f:
-            f.writelines(lines)
-        if use_default_path:
-            _apply_log_retention()
-    except OSError:
-        print_output = True
+def bug_msg(
+    msg: str,
+    file_path: str | Path | None = None,
+    print_output: bool = False,
+    level: str = "info",
+):
+    """
+    Companion to log_msg for temporary debugging.
 
-    if print_output:
-        print("".join(lines))
+    Args:
+        msg (str): The message to log.
+        file_path (str | Path | None, optional): Overrides the default path when
+            provided. Defaults to ``None`` which writes to ``logs/bug_<YYMMDD>.md``.
+        print_output (bool, optional): If True, also print to console.
+        level (str, optional): As for log_msg.
+    """
+    threshold = _log_threshold
+    if threshold is None:
+        threshold = _get_log_threshold()
+    if LOG_LEVELS[level] < threshold:
+        return
+    _emit_log("bug", msg, file_path, print_output, level)
 
 
 def print_msg(msg: str, file_path: str = "log_msg.md", print_output: bool = False):
@@ -80,6 +80,7 @@ class UIConfig(BaseModel):
     minutes: int = 6
     timer_warning_minutes: int = 90
     timer_urgent_minutes: int = 180
+    urgency_refresh_minutes: int = Field(5, ge=0)
     palette: Dict[str, Dict[str, str]] = Field(default_factory=dict)
     current_command: str = ""
 
@@ -166,14 +167,22 @@ class UrgencyConfig(BaseModel):
     )
 
 
+class StorageConfig(BaseModel):
+    profile: str = Field("default", pattern="^(default|tuned)$")
+    cache_size_mb: int = Field(32, ge=0)
+    mmap_size_mb: int = Field(128, ge=0)
+
+
 class TklrConfig(BaseModel):
     title: str = "Tklr Configuration"
     secret: str = Field(default_factory=generate_secret)
     num_completions: int = Field(6, ge=0)
     num_logs: int = Field(3, ge=0)
+    log_level: str = Field("info", pattern="^(debug|info|warning|error|off)$")
     ui: UIConfig = UIConfig()
     alerts: dict[str, str] = {}
     urgency: UrgencyConfig = UrgencyConfig()
+    storage: StorageConfig = StorageConfig()
     bin_orders: Dict[str, List[str]] = Field(default_factory=dict)
 
 
@@ -196,6 +205,11 @@ num_completions = {{ num_completions }}
 #   N -> keep only the N most recent files for each kind (log and bug)
 num_logs = {{ num_logs }}
 
+# log_level: str = 'debug' | 'info' | 'warning' | 'error' | 'off'
+# Messages below this level are skipped without formatting or file access.
+# 'debug' adds detailed tracing from datetime generation, busy and view refreshes.
+log_level = "{{ log_level }}"
+
 [ui]
 # theme: str = 'dark' | 'light'
 theme = "{{ ui.theme }}"
@@ -230,6 +244,11 @@ timer_warning_minutes = {{ ui.timer_warning_minutes }}
 # Minutes elapsed before the jot timer footer indicator turns to an urgent color.
 timer_urgent_minutes = {{ ui.timer_urgent_minutes }}
 
+# urgency_refresh_minutes: int (default 5)
+# Minutes between re-scoring the stored urgency rows against the current
+# time so task ordering keeps up with due, age and recent. 0 disables it.
+urgency_refresh_minutes = {{ ui.urgency_refresh_minutes }}
+
 # current_command: optional CLI snippet to run after saving changes in the UI.
 # Example: 'days --end 8 --width 46'
 # Prefix with '!' to run a standalone command/script (no automatic 'tklr').
@@ -379,6 +398,22 @@ max = {{ urgency.description.max }}
 # 0.0 otherwise.
 max = {{ urgency.project.max }}
 
+[storage]
+# profile: str = 'default' | 'tuned'
+# 'default' keeps SQLite's rollback journal and a single connection.
+# 'tuned' switches the database to WAL with synchronous=NORMAL, an
+# in-memory temp store and the cache/mmap sizes below, and builds views
+# from a separate read-only connection so reads never wait on writes.
+profile = "{{ storage.profile }}"
+
+# cache_size_mb: int >= 0 (tuned profile only)
+# Page cache size per connection, in megabytes.
+cache_size_mb = {{ storage.cache_size_mb }}
+
+# mmap_size_mb: int >= 0 (tuned profile only)
+# Memory-mapped I/O size in megabytes; 0 disables mmap.
+mmap_size_mb = {{ storage.mmap_size_mb }}
+
 [bin_orders]
 # Specify custom ordering of children for a root bin.
 # Example:
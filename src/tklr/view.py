@@ -66,6 +66,7 @@ from .shared import (
     fmt_user,
     get_next_yrwk,
     get_previous_yrwk,
+    log_enabled,
     log_msg,
     parse,
     timedelta_str_to_seconds,
@@ -1963,7 +1964,7 @@ class DetailsScreen(ModalScreen[None]):
         Called on 'f' from DetailsScreen.
         Gathers record/job context, prompts for completion time, calls controller.
         """
-        log_msg("finish_task")
+        log_msg("finish_task", level="debug")
         return
 
         meta = self.app.controller.get_last_details_meta() or {}
@@ -1998,7 +1999,7 @@ class DetailsScreen(ModalScreen[None]):
             self.app.notify(f"Finish failed: {e}")
 
     def _toggle_pinned(self) -> None:
-        log_msg("toggle_pin")
+        log_msg("toggle_pin", level="debug")
         return
 
         if not self.is_task or self.record_id is None:
@@ -2019,25 +2020,25 @@ class DetailsScreen(ModalScreen[None]):
 
     def _schedule_new(self) -> None:
         # e.g. self.app.controller.schedule_new(self.record_id)
-        log_msg("schedule_new")
+        log_msg("schedule_new", level="debug")
 
     def _reschedule(self) -> None:
         # e.g. self.app.controller.reschedule(self.record_id)
-        log_msg("reschedule")
+        log_msg("reschedule", level="debug")
 
     def _touch_item(self) -> None:
         # e.g. self.app.controller.touch_record(self.record_id)
-        log_msg("touch")
+        log_msg("touch", level="debug")
 
     def _show_repetitions(self) -> None:
-        log_msg("show_repetitions")
+        log_msg("show_repetitions", level="debug")
         if not self.is_recurring or self.record_id is None:
             return
         # e.g. rows = self.app.controller.list_repetitions(self.record_id)
         pass
 
     def _show_completions(self) -> None:
-        log_msg("show_completions")
+        log_msg("show_completions", level="debug")
         if not self.is_task or self.record_id is None:
             return
         # e.g. rows = self.app.controller.list_completions(self.record_id)
@@ -2085,9 +2086,11 @@ class HelpScreen(Screen):
                     vp.refresh()
                 except Exception:
                     pass
-        log_msg(
-            f"help_layout children: {[(i, child.__class__.__name__, child.id, child.styles.background) for i, child in enumerate(self.query_one('#help_layout').children)]}"
-        )  # Make sure it fills the screen; no popup sizing/margins.
+        if log_enabled("debug"):
+            log_msg(
+                f"help_layout children: {[(i, child.__class__.__name__, child.id, child.styles.background) for i, child in enumerate(self.query_one('#help_layout').children)]}",
+                level="debug",
+            )  # Make sure it fills the screen; no popup sizing/margins.
 
 
 class ScrollableList(ScrollView):
@@ -2354,7 +2357,7 @@ class WeeksScreen(SearchableScreen, SafeScreen):
         footer_content: str,
     ):
         super().__init__()
-        log_msg(f"{self.app = }, {self.app.controller = }")
+        log_msg(f"{self.app = }, {self.app.controller = }", level="debug")
         self.add_class("panel-bg-weeks")  # WeeksScreen
         self.table_title = title
         self.table = table  # busy bar / calendar mini-grid content (string)
@@ -2444,15 +2447,21 @@ class WeeksScreen(SearchableScreen, SafeScreen):
 
     def refresh_page(self) -> None:
         """Update the ListWithDetails widget to reflect the current page (with debug)."""
-        log_msg(
-            f"[WeeksScreen.refresh_page] current_page={self.current_page}, total_pages={len(self.pages)}"
-        )
+        if log_enabled("debug"):
+            log_msg(
+                f"[WeeksScreen.refresh_page] current_page={self.current_page}, total_pages={len(self.pages)}",
+                level="debug",
+            )
         if not self.list_with_details:
-            log_msg("[WeeksScreen.refresh_page] no list_with_details widget")
+            log_msg(
+                "[WeeksScreen.refresh_page] no list_with_details widget", level="debug"
+            )
             return
 
         if not self.pages:
-            log_msg("[WeeksScreen.refresh_page] no pages -> clearing list")
+            log_msg(
+                "[WeeksScreen.refresh_page] no pages -> clearing list", level="debug"
+            )
             self.list_with_details.update_list([])
             if self.list_with_details.has_details_open():
                 self.list_with_details.hide_details()
@@ -2465,7 +2474,8 @@ class WeeksScreen(SearchableScreen, SafeScreen):
         # defensive: check page index bounds
         if self.current_page < 0 or self.current_page >= len(self.pages):
             log_msg(
-                f"[WeeksScreen.refresh_page] current_page out of bounds, resetting to 0"
+                f"[WeeksScreen.refresh_page] current_page out of bounds, resetting to 0",
+                level="debug",
             )
             self.current_page = 0
 
@@ -2489,9 +2499,11 @@ class WeeksScreen(SearchableScreen, SafeScreen):
             return
 
         rows, tag_map = page
-        log_msg(
-            f"[WeeksScreen.refresh_page] page {self.current_page} rows={len(rows)} tags={len(tag_map)}"
-        )
+        if log_enabled("debug"):
+            log_msg(
+                f"[WeeksScreen.refresh_page] page {self.current_page} rows={len(rows)} tags={len(tag_map)}",
+                level="debug",
+            )
         # update list contents
         self.list_with_details.update_list(rows)
         # reset controller afill for week -> single-letter tags (page_tagger guarantees this)
@@ -2521,16 +2533,19 @@ class WeeksScreen(SearchableScreen, SafeScreen):
             self.app.current_start_date, self.app.selected_week
         )
 
-        log_msg(
-            f"[WeeksScreen.update_table_and_list] controller returned title={title!r} busy_bar_len={len(busy_bar) if busy_bar else 0} pages_type={type(pages)}"
-        )
+        if log_enabled("debug"):
+            log_msg(
+                f"[WeeksScreen.update_table_and_list] controller returned title={title!r} busy_bar_len={len(busy_bar) if busy_bar else 0} pages_type={type(pages)}",
+                level="debug",
+            )
 
         # some controllers might mistakenly return (pages, header) tuple; normalize:
         normalized_pages = pages
         # If it's a tuple (pages, header) — detect and unwrap
         if isinstance(pages, tuple) and len(pages) == 2 and isinstance(pages[0], list):
             log_msg(
-                "[WeeksScreen.update_table_and_list] Detected (pages, header) tuple; unwrapping first element as pages."
+                "[WeeksScreen.update_table_and_list] Detected (pages, header) tuple; unwrapping first element as pages.",
+                level="debug",
             )
             normalized_pages = pages[0]
 
@@ -2542,16 +2557,18 @@ class WeeksScreen(SearchableScreen, SafeScreen):
             normalized_pages = []
 
         # optionally, do a quick contents-sanity check
-        page_cnt = len(normalized_pages)
-        sample_info = []
-        for i, p in enumerate(normalized_pages[:3]):
-            if isinstance(p, (list, tuple)) and len(p) == 2:
-                sample_info.append((i, len(p[0]), len(p[1])))
-            else:
-                sample_info.append((i, "BAD_PAGE_SHAPE", type(p)))
-        log_msg(
-            f"[WeeksScreen.update_table_and_list] pages_count={page_cnt} sample={sample_info}"
-        )
+        if log_enabled("debug"):
+            page_cnt = len(normalized_pages)
+            sample_info = []
+            for i, p in enumerate(normalized_pages[:3]):
+                if isinstance(p, (list, tuple)) and len(p) == 2:
+                    sample_info.append((i, len(p[0]), len(p[1])))
+                else:
+                    sample_info.append((i, "BAD_PAGE_SHAPE", type(p)))
+            log_msg(
+                f"[WeeksScreen.update_table_and_list] pages_count={page_cnt} sample={sample_info}",
+                level="debug",
+            )
 
         # adopt new pages and reset page index
         self.pages = normalized_pages
@@ -2687,7 +2704,7 @@ class FullScreenList(SearchableScreen):
     def get_record_for_tag(self, tag: str):
         """Return the record_id corresponding to a tag on the current page."""
         total_pages = len(self.pages)
-        log_msg(f"{self.current_page = }, {total_pages = }")
+        log_msg(f"{self.current_page = }, {total_pages = }", level="debug")
         if total_pages == 0:
             return None
 
@@ -2706,14 +2723,14 @@ class FullScreenList(SearchableScreen):
     def show_details_for_tag(self, tag: str) -> None:
         app = self.app  # DynamicViewApp
         record = self.get_record_for_tag(tag)
-        log_msg(f"{record = }")
+        log_msg(f"{record = }", level="debug")
         if record:
             record_id, job_id, datetime_id, instance_ts = record
 
             title, lines, meta = app.controller.get_details_for_record(
                 record_id, job_id, datetime_id, instance_ts
             )
-            log_msg(f"{title = }, {lines = }, {meta = }")
+            log_msg(f"{title = }, {lines = }, {meta = }", level="debug")
             if self.list_with_details:
                 self.list_with_details.show_details(title, lines, meta)
 
@@ -4215,6 +4232,10 @@ class DynamicViewApp(App):
         # Fallback guard: once per minute ensure we notice a missed day rollover.
         self.set_interval(60, self._daily_rollover_guard)
         self.set_interval(60, self._refresh_timer_indicator)
+        ui_cfg = getattr(getattr(self.controller.env, "config", None), "ui", None)
+        refresh_minutes = getattr(ui_cfg, "urgency_refresh_minutes", 5)
+        if refresh_minutes:
+            self.set_interval(refresh_minutes * 60, self._refresh_urgency)
 
     async def action_check_updates(self) -> None:
         """Manually check PyPI for a newer release and refresh the footer indicator."""
@@ -4277,7 +4298,7 @@ class DynamicViewApp(App):
         push_history: bool = False,
     ) -> None:
         screen = self.screen
-        log_msg("showing details")
+        log_msg("showing details", level="debug")
         list_widget = getattr(screen, "list_with_details", None)
         if list_widget:
             list_widget.show_details(title, lines, meta, push_history=push_history)
@@ -4321,7 +4342,7 @@ class DynamicViewApp(App):
             )
 
         def _after_choice(choice: str | None) -> None:
-            log_msg(f"delete prompt returned {choice = }")
+            log_msg(f"delete prompt returned {choice = }", level="debug")
 
             if not choice:
                 return
@@ -4949,6 +4970,17 @@ class DynamicViewApp(App):
             return
         self.run_daily_tasks(refresh=True)
 
+    def _refresh_urgency(self):
+        """
+        Timer callback that re-scores urgency against the current time so the
+        agenda task ordering stays current between edits. The agenda is only
+        redrawn when some score actually moved.
+        """
+        changed = self.controller.rescore_urgency()
+        bug_msg(f"urgency rescored: {changed} changed", level="debug")
+        if changed and self.view == "agenda":
+            self.refresh_view()
+
     def play_bells(self) -> None:
         """An action to ring the bell."""
         delay = [0.6, 0.4, 0.2]
@@ -5072,7 +5104,7 @@ class DynamicViewApp(App):
             return
 
         method_name = self.VIEW_REFRESHERS.get(view_name)
-        log_msg(f"{view_name = }, {method_name = }")
+        log_msg(f"{view_name = }, {method_name = }", level="debug")
         if not method_name:
             return
 
@@ -5082,7 +5114,7 @@ class DynamicViewApp(App):
 
     def action_show_weeks(self):
         self.view = "weeks"
-        log_msg(f"{self.selected_week = }")
+        log_msg(f"{self.selected_week = }", level="debug")
         title, table, details = self.controller.get_table_and_list(
             self.current_start_date, self.selected_week
         )
@@ -5094,7 +5126,7 @@ class DynamicViewApp(App):
 
     def action_show_jots(self):
         self.view = "jots"
-        log_msg(f"{self.selected_week = }")
+        log_msg(f"{self.selected_week = }", level="debug")
         timer_id = self._jot_timer_id if self._jot_timer_state == "running" else None
         title, details = self.controller.get_jots_table_and_list(
             self.current_start_date, self.selected_week, timer_record_id=timer_id
@@ -5374,7 +5406,8 @@ class DynamicViewApp(App):
     def action_show_next(self):
         self.view = "next"
         details, title = self.controller.get_next()
-        log_msg(f"{details = }, {title = }")
+        if log_enabled("debug"):
+            log_msg(f"{details = }, {title = }", level="debug")
 
         footer = f"[bold {FOOTER}]?[/bold {FOOTER}] Help  [bold {FOOTER}]/[/bold {FOOTER}] Search"
         self.show_screen(FullScreenList(details, title, "", footer))
@@ -5398,7 +5431,8 @@ class DynamicViewApp(App):
     def action_show_tags(self):
         self.view = "tags"
         details, title = self.controller.get_tag_view()
-        log_msg(f"{details = }, {title = }")
+        if log_enabled("debug"):
+            log_msg(f"{details = }, {title = }", level="debug")
 
         footer = f"[bold {FOOTER}]?[/bold {FOOTER}] Help  [bold {FOOTER}]/[/bold {FOOTER}] Search"
         self.show_screen(FullScreenList(details, title, "", footer))
@@ -5419,7 +5453,8 @@ class DynamicViewApp(App):
     def action_show_alerts(self):
         self.view = "alerts"
         pages, header = self.controller.get_active_alerts()
-        log_msg(f"{pages = }, {header = }")
+        if log_enabled("debug"):
+            log_msg(f"{pages = }, {header = }", level="debug")
 
         footer = f"[bold {FOOTER}]?[/bold {FOOTER}] Help  [bold {FOOTER}]/[/bold {FOOTER}] Search"
 
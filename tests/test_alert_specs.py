@@ -0,0 +1,58 @@
+from tklr.item import Item
+from tklr.model import DatabaseManager, parse_alert_specs
+
+
+def test_parse_alert_specs_expands_leads_and_commands():
+    assert parse_alert_specs('["30m, 15m: n, v", "10m", "1h: "]') == [
+        (1800, "n"),
+        (1800, "v"),
+        (900, "n"),
+        (900, "v"),
+    ]
+    assert parse_alert_specs("") == []
+    assert parse_alert_specs("not json") == []
+
+
+def test_alerts_generated_from_specs(isolated_env, freeze_at):
+    with freeze_at("2026-01-06 08:00:00"):
+        dbm = DatabaseManager(
+            str(isolated_env.db_path), isolated_env, reset=True, auto_populate=False
+        )
+        standup = dbm.add_item(
+            Item(
+                env=isolated_env,
+                raw="* standup @s 2026-01-06 9:00 @r d @a 30m, -5m: n",
+                final=True,
+            )
+        )
+        early = dbm.add_item(
+            Item(
+                env=isolated_env, raw="* early @s 2026-01-06 7:30 @a 0m: n", final=True
+            )
+        )
+        for record_id in (standup, early):
+            dbm.generate_datetimes_for_record(record_id)
+        assert dbm.cursor.execute(
+            "SELECT lead_seconds, command FROM AlertSpecs WHERE record_id = ?",
+            (standup,),
+        ).fetchall() == [(1800, "n"), (-300, "n")]
+
+        dbm.populate_alerts()
+        alerts = dbm.cursor.execute(
+            "SELECT record_id, trigger_datetime, start_datetime FROM Alerts"
+            " ORDER BY trigger_datetime"
+        ).fetchall()
+        # 'early' already triggered; tomorrow's standup is outside today
+        assert alerts == [
+            (standup, "20260106T0830", "20260106T0900"),
+            (standup, "20260106T0905", "20260106T0900"),
+        ]
+
+        # editing the alerts re-parses the specs on save
+        dbm.cursor.execute(
+            "UPDATE Records SET alerts = ? WHERE id = ?", ('["1h: n"]', standup)
+        )
+        dbm.populate_alerts_for_record(standup)
+        assert dbm.cursor.execute(
+            "SELECT trigger_datetime FROM Alerts WHERE record_id = ?", (standup,)
+        ).fetchall() == [("20260106T0800",)]
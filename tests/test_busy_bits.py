@@ -0,0 +1,81 @@
+import numpy as np
+
+from tklr.model import (
+    PACKED_WEEK_BYTES,
+    _reduce_to_35_slots,
+    _ternary_strings,
+    busy_bits_for_events,
+    busy_mask,
+    busy_mask_to_bits,
+    conflict_aggregate,
+    fine_busy_bits_for_event,
+    or_aggregate,
+    pack_busy_bits,
+    unpack_busy_bits,
+)
+
+
+def _nonzero(arr):
+    return np.flatnonzero(arr).tolist()
+
+
+def test_busy_bits_for_events_paints_all_rows_at_once():
+    keys, bits = busy_bits_for_events(
+        [
+            # Sunday evening into Monday morning: split across two ISO weeks
+            (1, "20260111T2200", "20260112T0100"),
+            # all-day Mon-Tue (midnight end is exclusive)
+            (2, "20260105T0000", "20260107T0000"),
+            # two overlapping rows of the same record merge into one map
+            (3, "20260106T0900", "20260106T1000"),
+            (3, "20260106T0930", "20260106T1100"),
+            # no end and not all-day: not busy
+            (4, "20260106T0900", None),
+        ]
+    )
+    got = {key: _nonzero(bits[i]) for i, key in enumerate(keys)}
+
+    assert got == {
+        (1, "2026-02"): list(range(6 * 97 + 1 + 88, 7 * 97)),
+        (1, "2026-03"): list(range(1, 5)),
+        (2, "2026-02"): [0, 97],
+        (3, "2026-02"): list(range(97 + 1 + 36, 97 + 1 + 44)),
+    }
+    assert bits.dtype == np.uint8
+
+
+def test_fine_busy_bits_for_event_matches_batch():
+    weeks = fine_busy_bits_for_event("20260106", None)
+    assert list(weeks) == ["2026-02"]
+    assert _nonzero(weeks["2026-02"]) == [97]
+
+
+def test_reduce_to_35_slots_handles_stacks_of_weeks():
+    fine = np.zeros((2, 679), dtype=np.uint8)
+    fine[0, 0] = 1  # Monday all-day
+    fine[0, 1 + 30] = 2  # Monday 07:30 conflict
+    fine[1, 97 + 1 + 95] = 1  # Tuesday 23:45 busy
+
+    coarse = _reduce_to_35_slots(fine)
+    assert coarse.shape == (2, 35)
+    assert _ternary_strings(coarse) == [
+        "10200" + "0" * 30,
+        "00000" + "00001" + "0" * 25,
+    ]
+    assert (_reduce_to_35_slots(fine[1]) == coarse[1]).all()
+
+
+def test_packed_masks_aggregate_busy_and_conflict():
+    fine = np.zeros((3, 679), dtype=np.uint8)
+    fine[0, 10:20] = 1
+    fine[1, 15:25] = 1
+    fine[2, 678] = 1
+    blobs = pack_busy_bits(fine)
+    assert {len(blob) for blob in blobs} == {PACKED_WEEK_BYTES}
+    assert (unpack_busy_bits(blobs[2]) == fine[2]).all()
+
+    masks = [busy_mask(blob) for blob in blobs]
+    busy = busy_mask_to_bits(or_aggregate(masks))
+    conflict = busy_mask_to_bits(conflict_aggregate(masks))
+    assert _nonzero(busy) == list(range(10, 25)) + [678]
+    assert _nonzero(conflict) == list(range(15, 20))
@@ -0,0 +1,59 @@
+from tklr.item import Item
+from tklr.model import BUSY_SCHEMA_VERSION, DatabaseManager
+
+
+def _open(env, reset=False):
+    return DatabaseManager(
+        str(env.db_path),
+        env,
+        reset=reset,
+        auto_populate=False,
+    )
+
+
+def test_busy_cache_survives_reopen(isolated_env):
+    dbm = _open(isolated_env, reset=True)
+    item = Item(
+        env=isolated_env,
+        raw="* meeting @s 2026-01-08 11:00 @e 1h",
+        final=True,
+    )
+    dbm.add_item(item)
+    dbm.populate_dependent_tables(force=True)
+    weeks = dbm.cursor.execute(
+        "SELECT year_week, busybits FROM BusyWeeks ORDER BY year_week"
+    ).fetchall()
+    assert weeks
+    dbm.conn.close()
+
+    reopened = _open(isolated_env)
+    assert reopened._get_state_value("busy", {}).get("seeded") is True
+    assert reopened._get_state_value("busy_schema_version") == BUSY_SCHEMA_VERSION
+    assert not reopened._maybe_refresh_busy_tables(force=False)
+    assert (
+        reopened.cursor.execute(
+            "SELECT year_week, busybits FROM BusyWeeks ORDER BY year_week"
+        ).fetchall()
+        == weeks
+    )
+
+
+def test_busy_cache_dropped_on_schema_change(isolated_env):
+    dbm = _open(isolated_env, reset=True)
+    dbm.add_item(
+        Item(
+            env=isolated_env,
+            raw="* meeting @s 2026-01-08 11:00 @e 1h",
+            final=True,
+        )
+    )
+    dbm.populate_dependent_tables(force=True)
+    dbm._set_state_value("busy_schema_version", BUSY_SCHEMA_VERSION - 1)
+    dbm.conn.commit()
+    dbm.conn.close()
+
+    reopened = _open(isolated_env)
+    assert reopened._get_state_value("busy", {}).get("seeded") is False
+    assert reopened.cursor.execute("SELECT COUNT(*) FROM BusyWeeks").fetchone() == (
+        0,
+    )
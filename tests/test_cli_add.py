@@ -0,0 +1,37 @@
+import sqlite3
+
+from click.testing import CliRunner
+
+from tklr.cli import main as cli_main
+from tklr.cli.main import cli
+
+
+def test_cli_add_keeps_valid_entries_when_one_fails(monkeypatch, tmp_path):
+    home = tmp_path / "home"
+    home.mkdir()
+
+    monkeypatch.setenv("TKLR_HOME", str(home))
+    monkeypatch.delenv("XDG_CONFIG_HOME", raising=False)
+
+    add_item = cli_main.Controller.add_item
+
+    def failing_add_item(self, item):
+        record_id = add_item(self, item)
+        if item.subject == "boom":
+            # fail after the record row is written
+            raise RuntimeError("disk hiccup")
+        return record_id
+
+    monkeypatch.setattr(cli_main.Controller, "add_item", failing_add_item)
+
+    entries = tmp_path / "entries.txt"
+    entries.write_text("~ first\n...\n~ boom\n...\n~ last\n")
+
+    result = CliRunner().invoke(cli, ["add", "--file", str(entries)])
+
+    assert result.exit_code == 0, result.output
+    assert "Added 2 entries" in result.output
+    assert "disk hiccup" in result.output
+    with sqlite3.connect(home / "tklr.db") as conn:
+        subjects = [row[0] for row in conn.execute("SELECT subject FROM Records")]
+    assert sorted(subjects) == ["first", "last"]
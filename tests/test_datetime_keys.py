@@ -0,0 +1,46 @@
+from datetime import datetime
+
+from tklr.item import Item
+from tklr.model import DatabaseManager
+
+
+def test_start_end_keys_drive_period_queries(isolated_env):
+    dbm = DatabaseManager(
+        str(isolated_env.db_path),
+        isolated_env,
+        reset=True,
+        auto_populate=False,
+    )
+    for raw in (
+        "* timed @s 2026-01-05 9:00 @e 1h",
+        "* late @s 2026-01-04 22:00 @e 4h",
+        "* outside @s 2026-01-13 9:00",
+    ):
+        record_id = dbm.add_item(Item(env=isolated_env, raw=raw, final=True))
+        dbm.generate_datetimes_for_record(record_id)
+
+    keys = dbm.cursor.execute(
+        "SELECT start_key, end_key FROM DateTimes ORDER BY start_key"
+    ).fetchall()
+    assert keys == [
+        ("20260104T2200", "20260104T2359"),
+        ("20260105T0000", "20260105T0200"),
+        ("20260105T0900", "20260105T1000"),
+        ("20260113T0900", "20260113T0900"),
+    ]
+
+    events = dbm.get_events_for_period(datetime(2026, 1, 5), datetime(2026, 1, 12))
+    assert [(row[1], row[4]) for row in events] == [
+        ("20260105T0000", "late"),
+        ("20260105T0900", "timed"),
+    ]
+
+    plan = " ".join(
+        str(row)
+        for row in dbm.cursor.execute(
+            "EXPLAIN QUERY PLAN SELECT id FROM DateTimes "
+            "WHERE start_key >= ? AND start_key < ? AND end_key >= ?",
+            ("a", "b", "a"),
+        )
+    )
+    assert "idx_datetimes_start_end_key" in plan
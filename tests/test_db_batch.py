@@ -0,0 +1,47 @@
+import sqlite3
+
+import pytest
+
+from tklr.item import Item
+from tklr.model import DatabaseManager
+
+
+def _count_from_other_connection(env) -> int:
+    with sqlite3.connect(str(env.db_path)) as other:
+        return other.execute("SELECT COUNT(*) FROM Records").fetchone()[0]
+
+
+@pytest.fixture
+def dbm(isolated_env):
+    return DatabaseManager(
+        str(isolated_env.db_path),
+        isolated_env,
+        reset=True,
+        auto_populate=False,
+    )
+
+
+def test_nested_batches_commit_once_at_outermost_exit(dbm, isolated_env):
+    with dbm.batch():
+        dbm.add_item(Item(env=isolated_env, raw="* one @s 2026-01-05 9:00", final=True))
+        with dbm.batch():
+            dbm.add_item(
+                Item(env=isolated_env, raw="* two @s 2026-01-06 9:00", final=True)
+            )
+        assert dbm.conn.in_transaction
+        assert _count_from_other_connection(isolated_env) == 0
+    assert not dbm.conn.in_transaction
+    assert _count_from_other_connection(isolated_env) == 2
+
+
+def test_batch_rolls_back_on_error(dbm, isolated_env):
+    with pytest.raises(RuntimeError):
+        with dbm.batch():
+            dbm.add_item(
+                Item(env=isolated_env, raw="* one @s 2026-01-05 9:00", final=True)
+            )
+            raise RuntimeError("boom")
+    assert dbm.count_records() == 0
+    # commits work normally again after the failed batch
+    dbm.add_item(Item(env=isolated_env, raw="* two @s 2026-01-06 9:00", final=True))
+    assert _count_from_other_connection(isolated_env) == 1
@@ -0,0 +1,85 @@
+from tklr.item import Item
+from tklr.model import DATETIME_DERIVED_VERSION, DatabaseManager
+
+
+def _add(dbm, env, raw):
+    return dbm.add_item(Item(env=env, raw=raw, final=True))
+
+
+def test_edit_refreshes_only_dirty_record(isolated_env, monkeypatch):
+    dbm = DatabaseManager(
+        str(isolated_env.db_path),
+        isolated_env,
+        reset=True,
+        auto_populate=False,
+    )
+    _add(dbm, isolated_env, "* standup @s 2026-01-05 9:00 @e 15m @r d")
+    _add(dbm, isolated_env, "~ report @s 2026-01-09")
+    dbm.populate_dependent_tables(force=True)
+    assert dbm.cursor.execute("SELECT COUNT(*) FROM DirtyRecords").fetchone() == (0,)
+
+    full_passes = []
+    for name in (
+        "generate_datetimes_for_period",
+        "populate_alerts",
+        "populate_notice",
+        "populate_all_urgency",
+    ):
+        monkeypatch.setattr(dbm, name, lambda *a, _n=name, **k: full_passes.append(_n))
+
+    new_id = _add(dbm, isolated_env, "~ review @s 2026-01-07")
+    assert dbm.cursor.execute("SELECT record_id FROM DirtyRecords").fetchall() == [
+        (new_id,)
+    ]
+
+    dbm.populate_dependent_tables()
+
+    assert full_passes == []
+    assert dbm.cursor.execute("SELECT COUNT(*) FROM DirtyRecords").fetchone() == (0,)
+    assert dbm.cursor.execute(
+        "SELECT start_datetime FROM DateTimes WHERE record_id = ?", (new_id,)
+    ).fetchall() == [("20260107T0000",)]
+    assert dbm.cursor.execute(
+        "SELECT COUNT(*) FROM Urgency WHERE record_id = ?", (new_id,)
+    ).fetchone() == (1,)
+
+
+def test_processed_flag_does_not_mark_dirty(isolated_env):
+    dbm = DatabaseManager(
+        str(isolated_env.db_path),
+        isolated_env,
+        reset=True,
+        auto_populate=False,
+    )
+    record_id = _add(dbm, isolated_env, "* lunch @s 2026-01-08 12:00 @e 1h")
+    dbm.cursor.execute("DELETE FROM DirtyRecords")
+    dbm.cursor.execute("UPDATE Records SET processed = 1 WHERE id = ?", (record_id,))
+    assert dbm.cursor.execute("SELECT COUNT(*) FROM DirtyRecords").fetchone() == (0,)
+
+
+def test_dirty_refresh_keeps_stale_state_stale(isolated_env, monkeypatch):
+    dbm = DatabaseManager(
+        str(isolated_env.db_path),
+        isolated_env,
+        reset=True,
+        auto_populate=False,
+    )
+    _add(dbm, isolated_env, "~ report @s 2026-01-09")
+    dbm.populate_dependent_tables(force=True)
+
+    # an edit that was never refreshed leaves the alerts state behind
+    alerts_state = dbm._get_state_value("alerts")
+    stale_version = f"{DATETIME_DERIVED_VERSION}:0"
+    dbm._set_state_value("alerts", {**alerts_state, "version": stale_version})
+
+    full_passes = []
+    for name in ("populate_alerts", "populate_notice"):
+        monkeypatch.setattr(dbm, name, lambda *a, _n=name, **k: full_passes.append(_n))
+
+    _add(dbm, isolated_env, "~ review @s 2026-01-07")
+    dbm.populate_dependent_tables()
+
+    assert full_passes == ["populate_alerts"]
+    assert dbm.cursor.execute(
+        "SELECT COUNT(*) FROM DerivedState WHERE key = 'dirty_base_version'"
+    ).fetchone() == (0,)
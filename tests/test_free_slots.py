@@ -0,0 +1,108 @@
+from datetime import date, datetime, time, timedelta
+
+from click.testing import CliRunner
+
+from tklr.cli.main import cli
+from tklr.item import Item
+from tklr.model import DatabaseManager
+
+
+def _dbm_with_events(env, *raws):
+    dbm = DatabaseManager(str(env.db_path), env, reset=True, auto_populate=False)
+    for raw in raws:
+        dbm.add_item(Item(env=env, raw=raw, final=True))
+    dbm.extend_datetimes_for_weeks(2026, 2, 2)
+    dbm.populate_dependent_tables(force=True)
+    return dbm
+
+
+def test_find_free_slots_reads_busy_cache(isolated_env):
+    dbm = _dbm_with_events(
+        isolated_env,
+        "* standup @s 2026-01-06 9:00 @e 45m",
+        "* lunch @s 2026-01-06 12:00 @e 1h",
+        "* holiday @s 2026-01-07",
+    )
+
+    slots = dbm.find_free_slots(
+        datetime(2026, 1, 6),
+        datetime(2026, 1, 8),
+        timedelta(minutes=90),
+        day_hours=(8, 18),
+    )
+    assert slots == [
+        # a slot starting exactly at an event's end is free
+        (datetime(2026, 1, 6, 9, 45), datetime(2026, 1, 6, 12, 0)),
+        (datetime(2026, 1, 6, 13, 0), datetime(2026, 1, 6, 18, 0)),
+        # all-day events do not block time
+        (datetime(2026, 1, 7, 8, 0), datetime(2026, 1, 7, 18, 0)),
+    ]
+
+    # start mid-slot rounds up; short gaps are dropped
+    assert dbm.find_free_slots(
+        datetime(2026, 1, 6, 8, 5),
+        datetime(2026, 1, 6, 12, 0),
+        timedelta(hours=2),
+        day_hours=(8, 18),
+    ) == [(datetime(2026, 1, 6, 9, 45), datetime(2026, 1, 6, 12, 0))]
+
+
+def test_free_slot_starts_at_meeting_end(isolated_env):
+    dbm = _dbm_with_events(
+        isolated_env,
+        "* planning @s 2026-01-06 9:00 @e 1h",
+        "* review @s 2026-01-06 11:00 @e 1h",
+    )
+    # back to back with the meetings on both sides
+    assert dbm.find_free_slots(
+        datetime(2026, 1, 6, 9, 0),
+        datetime(2026, 1, 6, 12, 0),
+        timedelta(hours=1),
+    ) == [(datetime(2026, 1, 6, 10, 0), datetime(2026, 1, 6, 11, 0))]
+
+
+def test_free_slots_beyond_generated_weeks(isolated_env):
+    dbm = _dbm_with_events(isolated_env)
+    _, _, end_year, end_week = dbm.get_generated_weeks_range()
+    day = date.fromisocalendar(end_year, end_week, 1) + timedelta(weeks=20)
+    start = datetime.combine(day, time())
+    eve = day - timedelta(days=1)
+    dbm.add_item(
+        Item(env=isolated_env, raw=f"* office @s {eve} 9:00 @e 8h @r d", final=True)
+    )
+    dbm.populate_dependent_tables()
+
+    # twenty weeks out the recurring event still blocks the working day
+    assert dbm.find_free_slots(
+        start, start + timedelta(days=1), timedelta(hours=1), day_hours=(8, 18)
+    ) == [
+        (start + timedelta(hours=8), start + timedelta(hours=9)),
+        (start + timedelta(hours=17), start + timedelta(hours=18)),
+    ]
+    _, _, end_year, end_week = dbm.get_generated_weeks_range()
+    assert date.fromisocalendar(end_year, end_week, 7) >= day
+
+
+def test_cli_free_lists_periods(monkeypatch, isolated_env):
+    _dbm_with_events(isolated_env, "* review @s 2026-01-05 9:00 @e 7h").conn.close()
+
+    runner = CliRunner()
+    result = runner.invoke(
+        cli,
+        [
+            "free",
+            "--start",
+            "2026-01-05",
+            "--end",
+            "2026-01-05",
+            "--duration",
+            "90m",
+            "--hours",
+            "8-18",
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "Mon, Jan 5" in result.output
+    assert "(2h)" in result.output  # 16:00-18:00
+    assert "(1h)" not in result.output  # 8:00-9:00 is shorter than 90m
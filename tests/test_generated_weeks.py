@@ -0,0 +1,102 @@
+from datetime import datetime
+
+from tklr.item import Item
+from tklr.model import DatabaseManager
+
+
+def test_extension_appends_only_new_weeks_for_infinite_rules(
+    isolated_env, monkeypatch
+):
+    dbm = DatabaseManager(
+        str(isolated_env.db_path),
+        isolated_env,
+        reset=True,
+        auto_populate=False,
+    )
+    weekly_id = dbm.add_item(
+        Item(env=isolated_env, raw="* weekly @s 2026-01-05 9:00 @r w", final=True)
+    )
+    dbm.add_item(
+        Item(env=isolated_env, raw="* once @s 2026-01-06 10:00", final=True)
+    )
+
+    dbm.extend_datetimes_for_weeks(2026, 2, 4)
+    assert dbm.get_generated_weeks_range() == (2026, 2, 2026, 6)
+
+    calls = []
+    original = dbm.generate_datetimes_for_record
+
+    def _spy(record_id, **kwargs):
+        calls.append((record_id, kwargs))
+        return original(record_id, **kwargs)
+
+    monkeypatch.setattr(dbm, "generate_datetimes_for_record", _spy)
+
+    dbm.extend_datetimes_for_weeks(2026, 6, 4)
+
+    assert dbm.get_generated_weeks_range() == (2026, 2, 2026, 10)
+    assert calls == [
+        (
+            weekly_id,
+            {
+                "window": (datetime(2026, 2, 9), datetime(2026, 3, 9)),
+                "clear_existing": False,
+                "commit": False,
+            },
+        )
+    ]
+    starts = [
+        row[0]
+        for row in dbm.cursor.execute(
+            "SELECT start_datetime FROM DateTimes WHERE record_id = ? "
+            "ORDER BY start_datetime",
+            (weekly_id,),
+        )
+    ]
+    assert starts[0] == "20260105T0900"
+    assert starts[-1] == "20260302T0900"
+    assert len(starts) == len(set(starts)) == 9
+
+
+def test_period_regeneration_skips_processed_and_unscheduled(
+    isolated_env, monkeypatch
+):
+    dbm = DatabaseManager(
+        str(isolated_env.db_path),
+        isolated_env,
+        reset=True,
+        auto_populate=False,
+    )
+    weekly_id = dbm.add_item(
+        Item(env=isolated_env, raw="* weekly @s 2026-01-05 9:00 @r w", final=True)
+    )
+    once_id = dbm.add_item(
+        Item(env=isolated_env, raw="* once @s 2026-01-06 10:00", final=True)
+    )
+    dbm.add_item(Item(env=isolated_env, raw="% a note", final=True))
+    dbm.add_item(Item(env=isolated_env, raw="~ undated task", final=True))
+
+    kinds = dict(
+        dbm.cursor.execute("SELECT id, rruleset_kind FROM Records").fetchall()
+    )
+    assert kinds == {weekly_id: 2, once_id: 1, 3: 0, 4: 0}
+
+    window = (datetime(2026, 1, 5), datetime(2026, 2, 2))
+    seen = []
+    original = dbm.generate_datetimes_for_record
+
+    def _spy(record_id, **kwargs):
+        seen.append(record_id)
+        return original(record_id, **kwargs)
+
+    monkeypatch.setattr(dbm, "generate_datetimes_for_record", _spy)
+
+    dbm.generate_datetimes_for_period(*window)
+    assert seen == [weekly_id, once_id]
+
+    seen.clear()
+    dbm.generate_datetimes_for_period(*window)
+    assert seen == [weekly_id]
+    assert dbm.cursor.execute(
+        "SELECT start_datetime FROM DateTimes WHERE record_id = ?", (once_id,)
+    ).fetchall() == [("20260106T1000",)]
@@ -28,3 +28,56 @@ def test_daily_log_file_retention_for_log_and_bug(tmp_path, monkeypatch):
 
     assert [p.name for p in log_files] == ["log_260102.md", "log_260103.md"]
     assert [p.name for p in bug_files] == ["bug_260102.md", "bug_260103.md"]
+
+
+def test_log_levels_and_caller(tmp_path, monkeypatch):
+    from tklr import shared
+
+    home = _init_home_with_log_limit(tmp_path, monkeypatch, keep=0)
+    monkeypatch.setattr(shared, "_log_threshold", None)
+
+    class Probe:
+        def run(self):
+            log_msg("kept entry")
+            log_msg("skipped entry", level="debug")
+
+    Probe().run()
+    shared.set_log_level("debug")
+    log_msg("debug entry", level="debug")
+    shared._log_sink.flush()
+
+    text = "".join(p.read_text() for p in (home / "logs").glob("log_*.md"))
+    assert "(Probe.run)" in text
+    assert "kept entry" in text
+    assert "skipped entry" not in text
+    assert "debug entry" in text
+
+
+def test_log_enabled_follows_level(monkeypatch):
+    from tklr import shared
+
+    monkeypatch.setattr(shared, "_log_threshold", None)
+    shared.set_log_level("info")
+    assert not shared.log_enabled("debug")
+    assert shared.log_enabled("info")
+    shared.set_log_level("off")
+    assert not shared.log_enabled("error")
+
+
+def test_buffered_lines_flushed_without_later_writes(tmp_path):
+    import time
+
+    from tklr import shared
+
+    sink = shared._LogSink()
+    sink.FLUSH_INTERVAL = 0.05
+    path = tmp_path / "logs" / "log.md"
+    try:
+        sink.write("log", path, "quiet entry\n")
+        assert path.read_text() == ""
+        deadline = time.monotonic() + 5
+        while not path.read_text() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert path.read_text() == "quiet entry\n"
+    finally:
+        sink.close()
@@ -0,0 +1,76 @@
+import itertools
+
+from tklr.query import QueryEngine, QueryParser, QueryPlan, RecordView
+
+
+def fold(connectors, values):
+    result = values[0]
+    for connector, value in zip(connectors, values[1:]):
+        result = result or value if connector == "or" else result and value
+    return result
+
+
+def test_matches_agrees_with_left_fold_and_short_circuits():
+    for size in range(1, 5):
+        for connectors in itertools.product(("and", "or"), repeat=size - 1):
+            for values in itertools.product((False, True), repeat=size):
+                calls = []
+
+                def make(idx, value, calls):
+                    def predicate(record):
+                        calls.append(idx)
+                        return value
+
+                    return predicate
+
+                clauses = [
+                    (None if idx == 0 else connectors[idx - 1], make(idx, value, calls))
+                    for idx, value in enumerate(values)
+                ]
+                # reverse the costs so reordering is exercised
+                plan = QueryPlan(clauses, costs=list(range(size, 0, -1)))
+                assert plan.matches(None) == fold(connectors, values)
+                assert len(calls) <= size
+                if all(c == "and" for c in connectors) and False in values:
+                    # the cheapest false clause stops the chain
+                    assert calls == sorted(calls, reverse=True)
+                    assert values[calls[-1]] is False
+
+
+def test_cheap_clauses_run_first(monkeypatch):
+    plan, _ = QueryParser().parse("dt s > 2026-01-01 and equals c home")
+    calls = []
+    original = RecordView.get_datetime_values
+
+    def tracking(self, field):
+        calls.append(field)
+        return original(self, field)
+
+    monkeypatch.setattr(RecordView, "get_datetime_values", tracking)
+    view = RecordView(1, "*", "gym", [{"t": "@", "k": "c", "token": "@c work"}])
+    assert not plan.matches(view)
+    assert calls == []
+
+
+def test_datetime_values_are_parsed_once(monkeypatch):
+    from tklr import query
+
+    parsed = []
+    original = query.parse_field_datetime
+
+    def counting(value):
+        parsed.append(value)
+        return original(value)
+
+    monkeypatch.setattr(query, "parse_field_datetime", counting)
+    record = {
+        "id": 1,
+        "itemtype": "*",
+        "subject": "standup",
+        "tokens": [{"t": "@", "k": "s", "token": "@s 2026-01-06 9:00"}],
+    }
+    response = QueryEngine().run(
+        "dt s > 2026-01-01 and dt s < 2026-02-01 and dt s ? time", [record]
+    )
+    assert [match.record_id for match in response.matches] == [1]
+    assert parsed == ["2026-01-06 9:00"]
@@ -0,0 +1,112 @@
+import pytest
+
+from tklr.item import Item
+from tklr.model import DatabaseManager
+from tklr.query import QueryEngine, QueryParser
+
+RAWS = [
+    "~ Call plumber @c home @p 2",
+    "* gym @s 2026-01-07 18:00 @e 1h @c home",
+    "- errand run @s 2026-01-07 @u errands",
+    "* standup @s 2026-01-06 9:00 @c office @d daily sync",
+    "* holiday @s 2025-12-25 @c Home",
+    "% call notes @d plumber quote @b journal",
+    "^ garage @~ sort tools &r 1 @~ call dump &r 2: 1 @c home",
+    "~ idle @p 4",
+]
+
+QUERIES = [
+    "equals c home",
+    "~equals c home",
+    "equals itemtype ~",
+    "begins subject call",
+    "includes subject d plumb",
+    "in subject ~ call",
+    "includes c ^h.me$ and ~equals itemtype ^",
+    "equals c office or includes u err",
+    "equals c home or exists b",
+    "dt s > 2026-01-01",
+    "~dt s > 2026-01-01",
+    "dt s ? date and includes c home",
+    "exists ~r and equals c home",
+    "exists d or ~exists c",
+    "more p 3",
+    "~less p 3",
+    "less subject h",
+    "dt s < 2026-01-07-12-00",
+    "dt s = 2026-01-06",
+    "dt s ? time or equals c Home",
+]
+
+
+@pytest.fixture
+def dbm(isolated_env):
+    dbm = DatabaseManager(
+        str(isolated_env.db_path), isolated_env, reset=True, auto_populate=False
+    )
+    for raw in RAWS:
+        dbm.add_item(Item(env=isolated_env, raw=raw, final=True))
+    return dbm
+
+
+@pytest.mark.parametrize("query", QUERIES)
+def test_pushdown_matches_python_evaluation(dbm, query):
+    engine = QueryEngine()
+    expected = engine.run(query, list(dbm.iter_records_for_query())).matches
+    assert engine.run(query, dbm.iter_records_for_query).matches == expected
+
+
+def test_pushdown_filters_and_residual(dbm):
+    plan, _ = QueryParser().parse("equals c home and dt s ? time")
+    sql_filter = plan.sql_filter()
+    ids = [row["id"] for row in dbm.iter_records_for_query(sql_filter)]
+    assert ids == [2]
+    # the equality is settled in SQL; only the date check remains
+    assert len(plan.residual().clauses) == 1
+
+    # an unpushable clause in an 'or' leaves nothing to filter on
+    plan, _ = QueryParser().parse("equals c home or any d daily")
+    assert plan.sql_filter() is None
+    assert plan.residual() is plan
+
+
+def test_token_fields_follow_record_changes(dbm):
+    def fields(record_id):
+        return dbm.cursor.execute(
+            "SELECT field, value, value_num, value_dt FROM TokenFields"
+            " WHERE record_id = ? ORDER BY field, value",
+            (record_id,),
+        ).fetchall()
+
+    assert fields(1) == [
+        ("c", "home", None, None),
+        ("itemtype", "~", None, None),
+        ("p", "2", 2.0, None),
+        ("subject", "Call plumber", None, None),
+        ("subject", "Call plumber", None, None),
+    ]
+    assert ("s", "2026-01-07 18:00", None, "2026-01-07 18:00:00") in fields(2)
+
+    # writes outside the save paths clear the rows; the next query re-indexes
+    dbm.cursor.execute("UPDATE Records SET subject = 'Call electrician' WHERE id = 1")
+    assert fields(1) == []
+    engine = QueryEngine()
+    response = engine.run("begins subject call", dbm.iter_records_for_query)
+    assert [match.subject for match in response.matches] == [
+        "Call electrician",
+        "call notes",
+    ]
+
+    dbm.cursor.execute("DELETE FROM Records WHERE id = 1")
+    assert fields(1) == []
+
+
+def test_reindexing_for_a_query_commits(dbm):
+    use_id = dbm.cursor.execute("SELECT use_id FROM Records WHERE id = 3").fetchone()[0]
+    # renaming a use rewrites Records.tokens outside the save paths
+    dbm.update_use(use_id, "chores")
+    assert not dbm.conn.in_transaction
+
+    response = QueryEngine().run("equals u chores", dbm.iter_records_for_query)
+    assert [match.record_id for match in response.matches] == [3]
+    assert not dbm.conn.in_transaction
@@ -0,0 +1,52 @@
+import sqlite3
+
+from tklr import model
+from tklr.item import Item
+from tklr.model import DatabaseManager
+
+
+def _trace_statements(dbm):
+    statements = []
+    dbm.conn.set_trace_callback(statements.append)
+    return statements
+
+
+def test_flags_and_jobs_served_from_snapshot(isolated_env, monkeypatch):
+    monkeypatch.setattr(model, "EXTERNAL_CHECK_INTERVAL", 0)
+    dbm = DatabaseManager(
+        str(isolated_env.db_path),
+        isolated_env,
+        reset=True,
+        auto_populate=False,
+    )
+    plain = dbm.add_item(
+        Item(env=isolated_env, raw="* plain @s 2026-01-05 9:00", final=True)
+    )
+    project = dbm.add_item(
+        Item(
+            env=isolated_env,
+            raw="^ project @s 2026-01-05 @~ first &r 1 @~ second &r 2: 1",
+            final=True,
+        )
+    )
+
+    statements = _trace_statements(dbm)
+    for _ in range(3):
+        assert dbm.get_record_snapshot(plain)[0] == ""
+        assert dbm.get_job_dict(project, 1)["display_subject"]
+        assert dbm.get_job_dict(project, 99) is None
+    assert len([s for s in statements if "FROM Records" in s]) == 1
+
+    # our own writes drop just the touched record
+    dbm.cursor.execute("UPDATE Records SET flags = 'X' WHERE id = ?", (plain,))
+    dbm.conn.commit()
+    assert dbm.get_record_snapshot(plain)[0] == "X"
+
+    # commits from another connection drop the whole snapshot
+    other = sqlite3.connect(str(isolated_env.db_path))
+    other.execute("UPDATE Records SET flags = 'Y' WHERE id = ?", (plain,))
+    other.commit()
+    other.close()
+    assert dbm.get_record_snapshot(plain)[0] == "Y"
+    assert dbm.records_touched_since(0) is None
+    assert dbm.get_record_snapshot(12345) is None
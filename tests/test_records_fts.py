@@ -0,0 +1,55 @@
+from click.testing import CliRunner
+
+from tklr.cli.main import cli
+from tklr.item import Item
+from tklr.model import DatabaseManager
+
+
+def _ids(rows):
+    return [row[0] for row in rows]
+
+
+def test_find_uses_fts_for_plain_words(isolated_env):
+    dbm = DatabaseManager(
+        str(isolated_env.db_path), isolated_env, reset=True, auto_populate=False
+    )
+    assert dbm.fts_enabled
+    review = dbm.add_item(
+        Item(env=isolated_env, raw="~ quarterly review @d with Café team", final=True)
+    )
+    project = dbm.add_item(
+        Item(
+            env=isolated_env,
+            raw="^ launch @~ draft reviewer notes &r 1 @~ ship &r 2: 1",
+            final=True,
+        )
+    )
+    dbm.add_item(Item(env=isolated_env, raw="~ lunch @c office", final=True))
+
+    assert _ids(dbm.find_records("review", fts=True)) == [review, project]
+    assert _ids(dbm.find_records("cafe QUART", fts=True)) == [review]
+    assert _ids(dbm.find_records("office", fts=True)) == [3]
+    # regex syntax falls back to REGEXP over subject and description
+    assert _ids(dbm.find_records("^l", fts=True)) == [project, 3]
+    # without fts, plain words are still substring regexes
+    assert _ids(dbm.find_records("view", fts=False)) == [review]
+
+    # the index follows updates and deletes
+    dbm.cursor.execute("UPDATE Records SET subject = 'annual' WHERE id = ?", (review,))
+    dbm.cursor.execute("DELETE FROM Records WHERE id = ?", (project,))
+    dbm.conn.commit()
+    assert _ids(dbm.find_records("review", fts=True)) == []
+    assert _ids(dbm.find_records("annual", fts=True)) == [review]
+
+
+def test_cli_find_fts(isolated_env):
+    dbm = DatabaseManager(
+        str(isolated_env.db_path), isolated_env, reset=True, auto_populate=False
+    )
+    dbm.add_item(Item(env=isolated_env, raw="~ call plumber", final=True))
+    dbm.conn.close()
+
+    result = CliRunner().invoke(cli, ["find", "--fts", "plumb"])
+    assert result.exit_code == 0, result.output
+    assert "call plumber" in result.output
+    assert "1 match." in result.output
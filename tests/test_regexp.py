@@ -0,0 +1,31 @@
+import re
+
+import pytest
+
+from tklr.model import _regexp_matcher, regexp
+
+
+def test_regexp_matches_like_re_search():
+    cases = [
+        ("(?i)waldo", "Where is WALDO?"),
+        ("waldo", "Where is WALDO?"),
+        ("(?i)proj\\d+", "Proj42 kickoff"),
+        ("^call", "call mom"),
+        ("(?i)café", "CAFÉ au lait"),
+        ("", "anything"),
+    ]
+    for pattern, value in cases:
+        assert regexp(pattern, value) == (re.search(pattern, value) is not None)
+    assert regexp("waldo", None) is False
+
+
+def test_regexp_compiles_each_pattern_once():
+    _regexp_matcher.cache_clear()
+    for value in ("alpha", "beta", "gamma"):
+        regexp("(?i)a.p", value)
+        regexp("(?i)ALPHA", value)
+    info = _regexp_matcher.cache_info()
+    assert (info.misses, info.hits) == (2, 4)
+
+    with pytest.raises(re.error):
+        regexp("(unclosed", "x")
@@ -0,0 +1,85 @@
+import gc
+import weakref
+
+import pytest
+
+from tklr.shared import RRulesetCache
+
+
+def test_cache_hits_and_evicts_least_recently_used():
+    cache = RRulesetCache(maxsize=2)
+    daily = "DTSTART:20260105T0900\nRRULE:FREQ=DAILY;COUNT=3"
+    weekly = "DTSTART:20260105T0900\nRRULE:FREQ=WEEKLY;COUNT=3"
+    monthly = "DTSTART:20260105T0900\nRRULE:FREQ=MONTHLY;COUNT=3"
+
+    _, first = cache.get(daily)
+    _, again = cache.get(daily)
+    assert first is again
+    assert len(list(first)) == 3
+
+    cache.get(weekly)
+    cache.get(daily)  # refresh daily so weekly is the eviction candidate
+    cache.get(monthly)
+    assert cache.stats() == {"hits": 2, "misses": 3, "size": 2, "maxsize": 2}
+
+    cache.get(weekly)
+    assert cache.misses == 4
+
+
+def test_cache_keys_on_timezone_and_applies_prepare():
+    cache = RRulesetCache()
+    calls = []
+
+    def prepare(text, timezone):
+        calls.append(timezone)
+        return text
+
+    rule = "DTSTART:20260105T0900\nRRULE:FREQ=DAILY;COUNT=1"
+    cache.get(rule, "US/Eastern", prepare=prepare)
+    cache.get(rule, "US/Eastern", prepare=prepare)
+    cache.get(rule, "Europe/Paris", prepare=prepare)
+    assert calls == ["US/Eastern", "Europe/Paris"]
+
+
+def test_raw_and_prepared_lookups_do_not_share_entries():
+    cache = RRulesetCache()
+    raw = "DTSTART:20260105T0900\nRRULE:FREQ=DAILY;COUNT=3"
+
+    def prepare(text, timezone):
+        return text.replace("COUNT=3", "COUNT=2")
+
+    # either call style may come first; each gets its own entry
+    for _ in range(2):
+        text, rule = cache.get(raw)
+        assert text == raw
+        assert len(list(rule)) == 3
+        text, rule = cache.get(raw, prepare=prepare)
+        assert text.endswith("COUNT=2")
+        assert len(list(rule)) == 2
+    assert cache.stats()["size"] == 2
+
+
+def test_parse_errors_are_not_cached():
+    cache = RRulesetCache()
+    with pytest.raises(ValueError):
+        cache.get("RRULE:FREQ=NOPE")
+    assert cache.stats()["size"] == 0
+    assert cache.get("") == ("", None)
+
+
+def test_bound_prepare_does_not_pin_its_owner():
+    class Owner:
+        def prepare(self, text, timezone):
+            return text
+
+    owner = Owner()
+    cache = RRulesetCache()
+    rule = "DTSTART:20260105T0900\nRRULE:FREQ=DAILY;COUNT=1"
+    cache.get(rule, "US/Eastern", prepare=owner.prepare)
+    ref = weakref.ref(owner)
+    del owner
+    gc.collect()
+    assert ref() is None
+    # another instance's method shares the entry
+    assert cache.get(rule, "US/Eastern", prepare=Owner().prepare)
+    assert cache.stats()["hits"] == 1
@@ -0,0 +1,47 @@
+import sqlite3
+
+import pytest
+
+from tklr.item import Item
+from tklr.model import DatabaseManager
+
+
+def _open(env):
+    return DatabaseManager(
+        str(env.db_path),
+        env,
+        reset=True,
+        auto_populate=False,
+    )
+
+
+def test_default_profile_shares_connection(isolated_env):
+    dbm = _open(isolated_env)
+    assert dbm.read_conn is dbm.conn
+    mode = dbm.conn.execute("PRAGMA journal_mode").fetchone()[0]
+    assert mode.lower() != "wal"
+
+
+def test_tuned_profile_uses_wal_and_read_only_views(isolated_env):
+    isolated_env.config.storage.profile = "tuned"
+    dbm = _open(isolated_env)
+
+    assert dbm.conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert dbm.conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+    assert dbm.conn.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
+    assert dbm.read_conn is not dbm.conn
+    with pytest.raises(sqlite3.OperationalError):
+        dbm.read_conn.execute("DELETE FROM Records")
+
+    record_id = dbm.add_item(
+        Item(env=isolated_env, raw="* lunch @s 2026-01-08 12:00 @e 1h", final=True)
+    )
+    dbm.generate_datetimes_for_record(record_id)
+    assert dbm.find_records("lunch")[0][0] == record_id
+
+    # switching back to the default profile leaves WAL
+    dbm.read_conn.close()
+    dbm.conn.close()
+    isolated_env.config.storage.profile = "default"
+    dbm = DatabaseManager(str(isolated_env.db_path), isolated_env, auto_populate=False)
+    assert dbm.conn.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
@@ -0,0 +1,216 @@
+import itertools
+import json
+from datetime import date, timedelta
+
+from tklr import model
+from tklr.item import Item
+from tklr.model import DatabaseManager, UrgencyComputer
+
+NOW = 1_770_000_000
+DAY = 86400
+
+
+def test_score_batch_matches_scalar_path(isolated_env):
+    urgency = UrgencyComputer(isolated_env)
+    rows = [
+        {
+            "created": NOW - 30 * DAY,
+            "modified": NOW - modified_days * DAY,
+            "due": None if due_days is None else NOW + due_days * DAY,
+            "extent": extent,
+            "priority_level": priority_level,
+            "blocking": blocking,
+            "tags": tags,
+            "description": description,
+            "jobs": jobs,
+            "pinned": pinned,
+        }
+        for (
+            modified_days,
+            due_days,
+            extent,
+            priority_level,
+            blocking,
+            tags,
+            description,
+            jobs,
+            pinned,
+        ) in itertools.product(
+            (0, 3, 40),
+            (None, -20, -1, 0.5, 30),
+            (0, 3600),
+            (None, 1, 4),
+            (0, 2),
+            (0, 5),
+            (False, True),
+            (False, True),
+            (False, True),
+        )
+    ]
+
+    values, colors, weights = urgency.score_batch(NOW, rows)
+
+    assert len(values) == len(rows)
+    for row, value, color, weight in zip(rows, values.tolist(), colors, weights):
+        expected = urgency.from_args_and_weights(now=NOW, **row)
+        assert (value, color, weight) == expected
+
+
+def test_populate_all_urgency_batches_queries(isolated_env):
+    dbm = DatabaseManager(
+        str(isolated_env.db_path), isolated_env, reset=True, auto_populate=False
+    )
+    for i in range(5):
+        dbm.add_item(Item(env=isolated_env, raw=f"~ task {i} #x", final=True))
+    project = dbm.add_item(
+        Item(
+            env=isolated_env,
+            raw="^ project @s 2026-01-05 @~ first &r 1 @~ second &r 2: 1",
+            final=True,
+        )
+    )
+    dbm.generate_datetimes_for_record(project)
+    dbm.populate_all_urgency()
+    before = dbm.cursor.execute(
+        "SELECT record_id, job_id, subject, status, weights FROM Urgency"
+        " ORDER BY record_id, job_id"
+    ).fetchall()
+    assert len(before) == 6
+
+    statements = []
+    dbm.conn.set_trace_callback(statements.append)
+    dbm.populate_all_urgency()
+    dbm.conn.set_trace_callback(None)
+    selects = [s for s in statements if s.lstrip().startswith(("SELECT", "WITH"))]
+    assert len(selects) == 3  # pinned ids, next starts, tasks
+
+    # the per-record refresh produces the same rows
+    dbm.populate_urgency_from_record(project)
+    after = dbm.cursor.execute(
+        "SELECT record_id, job_id, subject, status, weights FROM Urgency"
+        " ORDER BY record_id, job_id"
+    ).fetchall()
+    strip = [(r[:4], json.loads(r[4])["tags"]) for r in before]
+    assert [(r[:4], json.loads(r[4])["tags"]) for r in after] == strip
+
+
+def test_rescore_urgency_matches_rebuild(isolated_env, monkeypatch):
+    dbm = DatabaseManager(
+        str(isolated_env.db_path), isolated_env, reset=True, auto_populate=False
+    )
+    dbm.add_item(Item(env=isolated_env, raw="~ idle", final=True))
+    dbm.add_item(Item(env=isolated_env, raw="~ urgent @p 1", final=True))
+    soon = (date.today() + timedelta(days=10)).isoformat()
+    due = dbm.add_item(
+        Item(env=isolated_env, raw=f"~ due @s {soon} @b 20d", final=True)
+    )
+    dbm.generate_datetimes_for_record(due)
+    # a job with only &s is due that long after now, whenever now is
+    dbm.add_item(Item(env=isolated_env, raw="^ trip @~ pack &s 2d &r 1", final=True))
+    now = model.utc_now_to_seconds()
+    monkeypatch.setattr(model, "utc_now_to_seconds", lambda: now)
+    dbm.populate_all_urgency()
+
+    def snapshot():
+        rows = dbm.cursor.execute(
+            "SELECT record_id, urgency, color, weights FROM Urgency ORDER BY record_id"
+        ).fetchall()
+        # unchanged rows keep the "now" they were last scored at
+        return [
+            (rid, value, color, {k: v for k, v in json.loads(w).items() if k != "args"})
+            for rid, value, color, w in rows
+        ]
+
+    later = now + 60 * DAY
+    # idle and due move with the clock; priority 1 still outweighs age and
+    # the relative job stays two days out
+    assert dbm.rescore_urgency(later) == 2
+    rescored = snapshot()
+    assert dbm.rescore_urgency(later) == 0
+
+    monkeypatch.setattr(model, "utc_now_to_seconds", lambda: later)
+    dbm.populate_all_urgency()
+    assert snapshot() == rescored
+
+
+def test_next_starts_fetched_per_job_in_one_query(isolated_env):
+    dbm = DatabaseManager(
+        str(isolated_env.db_path), isolated_env, reset=True, auto_populate=False
+    )
+    project = dbm.add_item(
+        Item(
+            env=isolated_env,
+            raw="^ project @~ first &r 1 @~ second &r 2 @~ third &r 3: 1, 2",
+            final=True,
+        )
+    )
+    dbm.cursor.execute("DELETE FROM DateTimes")
+    dbm.cursor.executemany(
+        "INSERT INTO DateTimes (record_id, job_id, start_datetime) VALUES (?, ?, ?)",
+        [
+            (project, None, "20260110T0900"),
+            (project, None, "20260105"),
+            (project, 1, "20260107T1000"),
+            (project, 1, "20260106T1000"),
+            (project, 2, "20260108T0800"),
+        ],
+    )
+
+    statements = []
+    dbm.conn.set_trace_callback(statements.append)
+    starts = dbm._next_starts_by_job()
+    dbm.conn.set_trace_callback(None)
+    assert len(statements) == 1
+    assert starts == {
+        (project, job_id): dbm._next_start_seconds(project, job_id)
+        for job_id in (None, 1, 2)
+    }
+
+    dbm.populate_all_urgency()
+    rows = dbm.get_urgency()
+    assert len(rows) == dbm.cursor.execute("SELECT COUNT(*) FROM Urgency").fetchone()[0]
+    assert {row[1]: row[9] for row in rows} == {
+        1: "20260106T1000",
+        2: "20260108T0800",
+    }
+
+
+def test_rescore_reveals_tasks_entering_their_notice_window(isolated_env, monkeypatch):
+    dbm = DatabaseManager(
+        str(isolated_env.db_path), isolated_env, reset=True, auto_populate=False
+    )
+    later = (date.today() + timedelta(days=10)).isoformat()
+    task = dbm.add_item(
+        Item(env=isolated_env, raw=f"~ file taxes @s {later} @n 2d", final=True)
+    )
+    dbm.generate_datetimes_for_record(task)
+    now = model.utc_now_to_seconds()
+    monkeypatch.setattr(model, "utc_now_to_seconds", lambda: now)
+    dbm.populate_all_urgency()
+
+    def visible():
+        return [rid for (rid,) in dbm.cursor.execute("SELECT record_id FROM Urgency")]
+
+    assert visible() == []
+    assert dbm.rescore_urgency(now + DAY) == 0
+    assert visible() == []
+
+    # eight days on, the two-day notice window has opened
+    assert dbm.rescore_urgency(now + 9 * DAY) == 1
+    assert visible() == [task]
+    assert dbm.rescore_urgency(now + 9 * DAY) == 0
+
+
+def test_score_batch_looks_up_each_priority_once(isolated_env, monkeypatch):
+    urgency = UrgencyComputer(isolated_env)
+    calls = []
+    lookup = urgency.urgency_priority
+    monkeypatch.setattr(
+        urgency, "urgency_priority", lambda level: calls.append(level) or lookup(level)
+    )
+    rows = [
+        {"created": NOW, "modified": NOW, "extent": 0, "priority_level": level}
+        for level in (1, 2, 1, None, 2, 1)
+    ]
+    urgency.score_batch(NOW, rows)
+    assert sorted(calls) == [1, 2]
@@ -0,0 +1,97 @@
+from datetime import date, timedelta
+
+from tklr.item import Item
+
+
+def _add(ctrl, env, raw):
+    record_id = ctrl.add_item(Item(env=env, raw=raw, final=True))
+    ctrl.db_manager.populate_dependent_tables()
+    return record_id
+
+
+def _texts(pages):
+    return [text for page_rows, _ in pages for text in page_rows]
+
+
+def test_week_pages_cached_until_touched(test_controller, test_env):
+    ctrl = test_controller
+    week = (2026, 2)
+    first = _add(ctrl, test_env, "* standup @s 2026-01-05 9:00 @e 30m")
+
+    pages = ctrl.get_week_details(week)
+    assert ctrl.get_week_details(week) is pages
+
+    # a record in another week does not invalidate this one
+    _add(ctrl, test_env, "* elsewhere @s 2026-03-02 9:00")
+    assert ctrl.get_week_details(week) is pages
+
+    # a new record landing in the week does
+    _add(ctrl, test_env, "* review @s 2026-01-07 14:00 @e 1h")
+    pages = ctrl.get_week_details(week)
+    assert any("review" in text for text in _texts(pages))
+
+    # so does an edit to a record already shown
+    ctrl.db_manager.cursor.execute(
+        "UPDATE Records SET subject = 'retro' WHERE id = ?", (first,)
+    )
+    ctrl.db_manager.conn.commit()
+    pages = ctrl.get_week_details(week)
+    assert any("retro" in text for text in _texts(pages))
+
+    # and the day rolling over
+    built_on, seq, ids, cached = ctrl._week_page_cache[week]
+    ctrl._week_page_cache[week] = (built_on - timedelta(days=1), seq, ids, cached)
+    assert ctrl.get_week_details(week) is not pages
+    assert ctrl._week_page_cache[week][0] == date.today()
+
+
+def test_week_with_sunday_event_is_cached_per_record(test_controller, test_env):
+    ctrl = test_controller
+    week = (2026, 2)
+    standup = _add(ctrl, test_env, "* standup @s 2026-01-05 9:00 @e 30m")
+    brunch = _add(ctrl, test_env, "* brunch @s 2026-01-11 11:00 @e 1h")
+
+    pages = ctrl.get_week_details(week)
+    assert any("brunch" in text for text in _texts(pages))
+    assert ctrl._week_page_cache[week][2] == {standup, brunch}
+
+    # deleting a record shown in the cached week rebuilds it
+    ctrl.delete_record(standup)
+    pages = ctrl.get_week_details(week)
+    assert not any("standup" in text for text in _texts(pages))
+    assert any("brunch" in text for text in _texts(pages))
+
+
+def test_regenerating_datetimes_touches_record_once(test_controller, test_env):
+    dbm = test_controller.db_manager
+    daily = _add(test_controller, test_env, "* standup @s 2026-01-05 9:00 @r d")
+    assert (
+        dbm.cursor.execute(
+            "SELECT COUNT(*) FROM DateTimes WHERE record_id = ?", (daily,)
+        ).fetchone()[0]
+        > 1
+    )
+
+    seq = dbm.touch_seq
+    dbm.generate_datetimes_for_record(daily)
+    assert dbm.touch_seq == seq + 1
+    assert dbm.records_touched_since(seq) == {daily}
+
+
+def test_touch_stamps_pruned_once_cached_weeks_catch_up(test_controller, test_env):
+    ctrl = test_controller
+    week = (2026, 2)
+    _add(ctrl, test_env, "* standup @s 2026-01-05 9:00 @e 30m")
+    pages = ctrl.get_week_details(week)
+
+    for day in range(2, 6):
+        _add(ctrl, test_env, f"* elsewhere @s 2026-03-0{day} 9:00")
+    assert ctrl.db_manager._touched
+
+    assert ctrl.get_week_details(week) is pages
+    assert ctrl.db_manager._touched == {}
+
+    ctrl._week_page_cache.clear()
+    _add(ctrl, test_env, "* later @s 2026-03-09 9:00")
+    ctrl.get_week_details(week)
+    assert ctrl.db_manager._touched == {}